@@ -0,0 +1,260 @@
+# backtesting/adaptive_search.py
+import time
+from abc import ABC, abstractmethod
+import numpy as np
+import pandas as pd
+
+from backtesting.vectorized_optimizer import (
+    METRIC_COLUMNS, VectorizedOptimizer, build_param_grid,
+    infer_periods_per_year, moving_average_matrix, price_arrays
+)
+
+PARAM_COLUMNS = ['short_window', 'long_window', 'stop_loss', 'take_profit']
+
+
+class GridEvaluator:
+    """Grid'in istenen alt kümesini ortak MA matrisi üzerinde değerlendirir
+
+    MA matrisi grid'deki tüm pencereler için bir kez hesaplanır; arama
+    algoritmaları sadece seçtikleri kombinasyonların indekslerini verir.
+    """
+
+    def __init__(self, data, grid, engine='auto', initial_capital=100000):
+        from backtesting.backend import get_grid_engine
+        self.grid = grid
+        self.close, self.high, self.low = price_arrays(data)
+        windows, inverse = np.unique(
+            np.concatenate((grid['short_window'], grid['long_window'])), return_inverse=True
+        )
+        n_combos = len(grid['short_window'])
+        self.short_cols, self.long_cols = inverse[:n_combos], inverse[n_combos:]
+        self.ma_matrix = moving_average_matrix(self.close, windows)
+        self.periods_per_year = infer_periods_per_year(data.index)
+        self.evaluate_grid = get_grid_engine(engine)
+        self.initial_capital = initial_capital
+        self.n_bars = len(self.close)
+        self.bar_evaluations = 0
+
+    def evaluate(self, indices, start=0):
+        """Seçilen kombinasyonları [start, n_bars) aralığında değerlendir"""
+        indices = np.asarray(indices, dtype=np.int64)
+        self.bar_evaluations += len(indices) * (self.n_bars - start)
+        metrics = self.evaluate_grid(
+            self.close, self.high, self.low, self.ma_matrix,
+            self.short_cols[indices], self.long_cols[indices],
+            self.grid['stop_loss'][indices], self.grid['take_profit'][indices],
+            start=start, initial_capital=self.initial_capital,
+            periods_per_year=self.periods_per_year
+        )
+        table = pd.DataFrame({name: self.grid[name][indices] for name in PARAM_COLUMNS})
+        for column in METRIC_COLUMNS + ['final_value']:
+            table[column] = metrics[column]
+        table.index = indices
+        return table
+
+
+class AdaptiveOptimizer(VectorizedOptimizer, ABC):
+    """Tam grid yerine bütçe sınırlı arama yapan optimizer'ların ortak tabanı
+
+    max_evaluations kombinasyon (tam veri eşdeğeri) ya da time_budget saniye
+    dolduğunda arama durur ve o ana kadarki en iyi sonuç döner.
+    """
+
+    def __init__(self, backtester=None, initial_capital=100000, objective='sharpe_ratio', min_trades=2,
+                 engine='auto', max_evaluations=None, budget_fraction=0.1, time_budget=None,
+                 random_state=None):
+        super().__init__(backtester, initial_capital, objective, min_trades, engine=engine)
+        self.max_evaluations = max_evaluations
+        self.budget_fraction = budget_fraction
+        self.time_budget = time_budget
+        self.rng = np.random.default_rng(random_state)
+
+    def _budget(self, n_combos):
+        if self.max_evaluations is not None:
+            return min(self.max_evaluations, n_combos)
+        return min(n_combos, max(50, int(n_combos * self.budget_fraction)))
+
+    def _scores(self, table, min_trades=None):
+        """Objective değerleri; yetersiz işlemli kombinasyonlar -inf"""
+        min_trades = self.min_trades if min_trades is None else min_trades
+        scores = table[self.objective].to_numpy(dtype=np.float64)
+        return np.where(table['sell_trades'].to_numpy() >= min_trades, scores, -np.inf)
+
+    @abstractmethod
+    def search(self, evaluator, budget, deadline, report):
+        """Alt sınıflar aramayı uygular; tam veride değerlendirilen tabloyu döndürür"""
+
+    def optimize_ma_parameters(self, data, param_ranges, progress_callback=None):
+        """En iyi parametreleri ve metriklerini döndür
+
+        progress_callback(percent, message) verilirse bütçe kullanımına göre
+        ilerleme raporlanır.
+        """
+        start_time = time.time()
+        grid = param_ranges if 'short_window' in param_ranges else build_param_grid(param_ranges)
+        n_combos = len(grid['short_window'])
+        if n_combos == 0:
+            return None, None
+
+        evaluator = GridEvaluator(data, grid, self.engine, self.initial_capital)
+        budget = self._budget(n_combos)
+        deadline = start_time + self.time_budget if self.time_budget else None
+
+        def report(used, message):
+            if progress_callback:
+                progress_callback(min(100, int(used * 100 / max(1, budget))), message)
+
+        table = self.search(evaluator, budget, deadline, report)
+        self._record_results(table)
+
+        equivalent = evaluator.bar_evaluations / max(1, evaluator.n_bars)
+        print(f"⚡ {n_combos:,} kombinasyonluk uzayda {equivalent:,.0f} tam değerlendirme eşdeğeri "
+              f"(%{equivalent * 100 / n_combos:.1f}) ile {time.time() - start_time:.2f} saniyede arandı")
+        return self.best_from_table(table)
+
+
+class SuccessiveHalvingOptimizer(AdaptiveOptimizer):
+    """Veri alt kümeleri üzerinde successive halving
+
+    Rastgele seçilen adaylar önce serinin son küçük bir bölümünde
+    değerlendirilir; her turda en iyi 1/eta kısmı kalır ve değerlendirme
+    penceresi eta kat büyür. Son tur tüm veridir. MA'lar tüm seri üzerinden
+    hesaplandığından kısa pencerelerde ısınma kaybı yoktur.
+    """
+
+    def __init__(self, *args, eta=3, n_rungs=4, min_bars=500, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.eta = eta
+        self.n_rungs = n_rungs
+        self.min_bars = min_bars
+
+    def _rung_starts(self, n_bars):
+        """Her turun başlangıç barı; son tur tüm veridir"""
+        min_fraction = self.eta ** -(self.n_rungs - 1)
+        starts = []
+        for rung in range(self.n_rungs):
+            fraction = 1.0 if rung == self.n_rungs - 1 else min_fraction * self.eta ** rung
+            starts.append(min(int(n_bars * (1 - fraction)), max(0, n_bars - self.min_bars)))
+        return starts
+
+    def search(self, evaluator, budget, deadline, report):
+        n_combos = len(evaluator.grid['short_window'])
+        n_bars = evaluator.n_bars
+        starts = self._rung_starts(n_bars)
+        # min_bars sınırı kısa turları büyütebilir: maliyet gerçek pencere uzunluğuyla hesaplanır
+        fractions = [(n_bars - start) / n_bars for start in starts]
+
+        # n aday ile toplam maliyet = n * Σ fraction_r / eta^r tam değerlendirme
+        unit_cost = sum(fraction / self.eta ** rung for rung, fraction in enumerate(fractions))
+        n_candidates = min(n_combos, max(self.eta, int(budget / unit_cost)))
+        candidates = self.rng.choice(n_combos, size=n_candidates, replace=False)
+        used = 0.0
+        table = None
+
+        for rung, (start, fraction) in enumerate(zip(starts, fractions)):
+            # Kalan bütçeye sığmayan adaylar turdan önce kırpılır (en az bir aday kalır)
+            affordable = max(1, int((budget - used) / fraction + 1e-9))
+            candidates = candidates[:affordable]
+            table = evaluator.evaluate(candidates, start=start)
+            used += len(candidates) * fraction
+            report(used, f"Tur {rung + 1}/{self.n_rungs}: {len(candidates)} aday, verinin %{fraction * 100:.0f}'i")
+
+            if start == 0 or len(candidates) <= 1:
+                break
+            order = np.argsort(-self._scores(table, 1), kind='stable')
+            if deadline and time.time() > deadline:
+                # Süre doldu: bu turun en iyilerini tam veride bir kez değerlendir
+                return evaluator.evaluate(candidates[order[:self.eta]])
+
+            keep = max(1, len(candidates) // self.eta)
+            candidates = candidates[order[:keep]]
+
+        if start != 0:
+            # Bütçe tam veri turuna yetmedi: kalan en iyi aday yine tüm veride değerlendirilir
+            table = evaluator.evaluate(candidates[:1])
+        return table
+
+
+class TPEOptimizer(AdaptiveOptimizer):
+    """Tree-structured Parzen Estimator ile ayrık grid üzerinde Bayesian arama
+
+    Gözlemler objective'e göre iyi (üst gamma) ve kötü olarak ikiye ayrılır;
+    her parametre için komşu değerlere yayılmış ayrık yoğunluklar l(x) ve
+    g(x) kurulur. Henüz denenmemiş grid noktaları arasından l/g oranı en
+    yüksek olanlar batch halinde değerlendirilir. patience batch boyunca
+    iyileşme olmazsa arama erken durur.
+    """
+
+    def __init__(self, *args, n_startup=None, batch_size=16, gamma=0.25, patience=8, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.n_startup = n_startup
+        self.batch_size = batch_size
+        self.gamma = gamma
+        self.patience = patience
+
+    @staticmethod
+    def _density(codes, n_values, weights=None):
+        """Ayrık değer kodları için komşulara yayılmış, düzleştirilmiş yoğunluk"""
+        counts = np.bincount(codes, weights=weights, minlength=n_values).astype(np.float64)
+        smoothed = counts.copy()
+        smoothed[1:] += 0.5 * counts[:-1]
+        smoothed[:-1] += 0.5 * counts[1:]
+        smoothed += 1.0 / n_values
+        return smoothed / smoothed.sum()
+
+    def search(self, evaluator, budget, deadline, report):
+        grid = evaluator.grid
+        n_combos = len(grid['short_window'])
+        codes = []
+        sizes = []
+        for name in PARAM_COLUMNS:
+            values, inverse = np.unique(grid[name], return_inverse=True)
+            codes.append(inverse)
+            sizes.append(len(values))
+
+        n_startup = self.n_startup or min(budget, max(2 * self.batch_size, budget // 5))
+        observed = evaluator.evaluate(self.rng.choice(n_combos, size=n_startup, replace=False))
+        evaluated = np.zeros(n_combos, dtype=bool)
+        evaluated[observed.index] = True
+        best = self._scores(observed).max()
+        stale = 0
+        report(len(observed), f"{len(observed)}/{budget} değerlendirme | en iyi {self.objective}: {best:.3f}")
+
+        while len(observed) < budget and not evaluated.all():
+            if deadline and time.time() > deadline:
+                break
+
+            scores = self._scores(observed)
+            finite = np.isfinite(scores)
+            ranked = observed.index.to_numpy()[np.argsort(-np.where(finite, scores, -1e300), kind='stable')]
+            n_good = max(1, int(np.ceil(self.gamma * len(ranked))))
+            good, bad = ranked[:n_good], ranked[n_good:]
+
+            log_ratio = np.zeros(n_combos)
+            for dim_codes, n_values in zip(codes, sizes):
+                l = self._density(dim_codes[good], n_values)
+                g = self._density(dim_codes[bad], n_values) if len(bad) else np.full(n_values, 1.0 / n_values)
+                log_ratio += np.log(l[dim_codes]) - np.log(g[dim_codes])
+
+            # Aynı skorlu noktalar arasında çeşitlilik için küçük gürültü
+            log_ratio += self.rng.gumbel(scale=0.1, size=n_combos)
+            log_ratio[evaluated] = -np.inf
+            size = min(self.batch_size, budget - len(observed), int((~evaluated).sum()))
+            batch = np.argpartition(-log_ratio, size - 1)[:size]
+
+            fresh = evaluator.evaluate(batch)
+            evaluated[batch] = True
+            observed = pd.concat([observed, fresh])
+
+            batch_best = self._scores(fresh).max()
+            if batch_best > best + 1e-9:
+                best = batch_best
+                stale = 0
+            else:
+                stale += 1
+            report(len(observed), f"{len(observed)}/{budget} değerlendirme | en iyi {self.objective}: {best:.3f}")
+            if stale >= self.patience:
+                print(f"⏹️ {self.patience} batch boyunca iyileşme yok, arama erken durduruldu")
+                break
+
+        return observed
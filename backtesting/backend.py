@@ -0,0 +1,63 @@
+# backtesting/backend.py
+"""Çalışılan makineye göre backtest motoru seçimi
+
+GPU varsa CUDA backtester, yoksa numba ile derlenmiş CPU backtester
+kullanılır. numba da yoksa aynı döngüler saf Python/NumPy ile çalışır.
+"""
+from backtesting.numba_backtester import NumbaBacktester, NUMBA_AVAILABLE, evaluate_grid_numba
+from backtesting.vectorized_optimizer import evaluate_grid
+
+
+def cuda_available():
+    """CUDA destekli bir GPU kullanılabilir mi"""
+    try:
+        from numba import cuda
+        return cuda.is_available()
+    except Exception:
+        return False
+
+
+def get_backtester(initial_capital=100000, backend='auto'):
+    """Backtester örneği döndür
+
+    backend: 'auto', 'cuda' veya 'cpu'. 'auto' GPU varsa CUDA'yı seçer.
+    """
+    if backend == 'cuda' or (backend == 'auto' and cuda_available()):
+        try:
+            from backtesting.cuda_backtester import CUDABacktester
+            return CUDABacktester(initial_capital=initial_capital)
+        except Exception as e:
+            if backend == 'cuda':
+                raise
+            print(f"⚠️ CUDA backtester başlatılamadı, CPU kullanılacak: {e}")
+
+    return NumbaBacktester(initial_capital=initial_capital)
+
+
+def get_grid_engine(engine='auto'):
+    """Grid değerlendirme fonksiyonu: 'numba', 'numpy' veya 'auto'"""
+    if engine == 'numba' or (engine == 'auto' and NUMBA_AVAILABLE):
+        return evaluate_grid_numba
+    return evaluate_grid
+
+
+def get_optimizer(backtester=None, method='grid', **kwargs):
+    """Makineye uygun parametre optimizer'ı
+
+    method: 'grid' (tam grid), 'tpe' (Bayesian) veya 'halving'
+    (successive halving). Tam grid'de numba varsa derlenmiş motor tüm
+    çekirdekleri prange ile kullanır; yoksa grid parçaları ParallelOptimizer
+    ile process'lere dağıtılır.
+    """
+    if method in ('tpe', 'halving'):
+        from backtesting.adaptive_search import TPEOptimizer, SuccessiveHalvingOptimizer
+        kwargs.pop('result_cache', None)
+        optimizer_class = TPEOptimizer if method == 'tpe' else SuccessiveHalvingOptimizer
+        return optimizer_class(backtester, **kwargs)
+
+    if NUMBA_AVAILABLE:
+        from backtesting.vectorized_optimizer import VectorizedOptimizer
+        return VectorizedOptimizer(backtester, engine='numba', **kwargs)
+
+    from backtesting.parallel_optimizer import ParallelOptimizer
+    return ParallelOptimizer(backtester, **kwargs)
@@ -0,0 +1,90 @@
+# backtesting/batch_metrics.py
+import numpy as np
+
+from backtesting.vectorized_optimizer import TRADING_DAYS
+
+
+def trade_list_arrays(trade_lists):
+    """Kombinasyon başına işlem listelerinden (TradeLog ya da dict listesi) kompakt işlem dizileri"""
+    from backtesting.trade_log import TradeLog
+    counts = np.fromiter((len(trades) for trades in trade_lists), dtype=np.int64, count=len(trade_lists))
+    trade_combo = np.repeat(np.arange(len(trade_lists)), counts)
+    if trade_lists and all(isinstance(trades, TradeLog) for trades in trade_lists):
+        records = np.concatenate([trades.records for trades in trade_lists])
+        return trade_combo, records['type'], records['pnl']
+
+    trade_side = np.fromiter(
+        (1 if t['type'] == 'BUY' else -1 for trades in trade_lists for t in trades),
+        dtype=np.int8, count=int(counts.sum())
+    )
+    trade_pnl = np.fromiter(
+        (t.get('pnl', 0.0) for trades in trade_lists for t in trades),
+        dtype=np.float64, count=int(counts.sum())
+    )
+    return trade_combo, trade_side, trade_pnl
+
+
+def batch_performance_metrics(equity, close, trade_combo=None, trade_side=None, trade_pnl=None,
+                              initial_capital=100000.0, periods_per_year=TRADING_DAYS,
+                              max_chunk_cells=8_000_000):
+    """Çok sayıda özsermaye eğrisinin metriklerini tek seferde hesapla
+
+    equity (combos × bars) portföy değerleri, close ortak (bars) ya da
+    kombinasyon başına (combos × bars) kapanış serisidir. İşlem dizileri
+    verilmezse işlem sayıları ve win rate 0 döner. Metrikler
+    NumbaBacktester.calculate_performance_metrics ile aynı tanımlara sahiptir;
+    bellek kullanımı max_chunk_cells hücrelik satır blokları ile sınırlanır.
+    Dönüş: her metrik için kombinasyon başına dizi.
+    """
+    equity = np.atleast_2d(np.asarray(equity, dtype=np.float64))
+    close = np.asarray(close, dtype=np.float64)
+    n_combos, n_bars = equity.shape
+
+    max_dd = np.zeros(n_combos)
+    mean = np.zeros(n_combos)
+    std = np.zeros(n_combos)
+
+    rows = max(1, max_chunk_cells // max(1, n_bars))
+    for first in range(0, n_combos, rows):
+        block = equity[first:first + rows]
+        previous = np.empty_like(block)
+        previous[:, 0] = initial_capital
+        previous[:, 1:] = block[:, :-1]
+        returns = block / previous - 1
+        mean[first:first + rows] = returns.mean(axis=1)
+        std[first:first + rows] = returns.std(axis=1)
+
+        peak = np.maximum.accumulate(np.maximum(block, initial_capital), axis=1)
+        max_dd[first:first + rows] = np.minimum((block / peak).min(axis=1) - 1, 0.0)
+
+    final_value = equity[:, -1] if n_bars else np.full(n_combos, float(initial_capital))
+    if close.ndim == 1:
+        buy_hold = np.full(n_combos, (close[-1] / close[0] - 1) * 100)
+    else:
+        buy_hold = (close[:, -1] / close[:, 0] - 1) * 100
+
+    if trade_combo is None:
+        buys = sells = wins = np.zeros(n_combos, dtype=np.int64)
+    else:
+        trade_combo = np.asarray(trade_combo, dtype=np.int64)
+        is_sell = np.asarray(trade_side) < 0
+        buys = np.bincount(trade_combo[~is_sell], minlength=n_combos)
+        sells = np.bincount(trade_combo[is_sell], minlength=n_combos)
+        wins = np.bincount(trade_combo[is_sell & (np.asarray(trade_pnl) > 0)], minlength=n_combos)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        sharpe = np.where(std > 0, mean / std * np.sqrt(periods_per_year), 0.0)
+        win_rate = np.where(sells > 0, wins / sells * 100, 0.0)
+
+    return {
+        'total_return': (final_value / initial_capital - 1) * 100,
+        'buy_hold_return': buy_hold,
+        'max_drawdown': max_dd * 100,
+        'volatility': std * np.sqrt(periods_per_year) * 100,
+        'sharpe_ratio': sharpe,
+        'total_trades': buys + sells,
+        'buy_trades': buys,
+        'sell_trades': sells,
+        'win_rate': win_rate,
+        'final_value': final_value,
+    }
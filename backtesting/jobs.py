@@ -0,0 +1,205 @@
+# backtesting/jobs.py
+import itertools
+import threading
+import time
+from collections import deque
+
+
+class JobCancelled(Exception):
+    """İş, iptal isteği üzerine durduruldu"""
+
+
+class CancelToken:
+    """İşbirlikçi iptal bayrağı
+
+    Uzun işler ilerleme raporlarken check() çağırır; iptal istenmişse
+    JobCancelled fırlatılır ve iş bir sonraki parça sınırında durur.
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        self._event.set()
+
+    @property
+    def cancelled(self):
+        return self._event.is_set()
+
+    def check(self):
+        if self._event.is_set():
+            raise JobCancelled()
+
+
+def format_duration(seconds):
+    """Saniyeyi sa:dk:sn (bir saatten kısaysa dk:sn) metnine çevir"""
+    seconds = int(max(0, seconds))
+    hours, rest = divmod(seconds, 3600)
+    minutes, seconds = divmod(rest, 60)
+    return f"{hours}:{minutes:02d}:{seconds:02d}" if hours else f"{minutes:02d}:{seconds:02d}"
+
+
+class ProgressTracker:
+    """progress_callback(percent, message) sarmalayıcısı
+
+    Her çağrıda iptal kontrol edilir; mesaja geçen süre, tahmini kalan süre
+    ve total verilmişse işlem hızı (unit/sn) eklenir. Aşağıdaki callback en
+    fazla min_interval saniyede bir (yüzde değiştiğinde ya da iş bittiğinde
+    hemen) çağrılır.
+    """
+
+    def __init__(self, callback=None, token=None, total=None, unit='kombinasyon', min_interval=0.2):
+        self.callback = callback
+        self.token = token
+        self.total = total
+        self.unit = unit
+        self.min_interval = min_interval
+        self.start_time = time.time()
+        self.percent = 0
+        self.rate = None
+        self.eta = None
+        self._last_report = 0.0
+
+    def __call__(self, percent, message=''):
+        if self.token is not None:
+            self.token.check()
+
+        now = time.time()
+        elapsed = now - self.start_time
+        if percent > 0 and elapsed > 0:
+            self.eta = elapsed * (100 - percent) / percent
+            if self.total:
+                self.rate = self.total * percent / 100 / elapsed
+
+        changed = percent != self.percent
+        self.percent = percent
+        if self.callback is None:
+            return
+        if not changed and percent < 100 and now - self._last_report < self.min_interval:
+            return
+        self._last_report = now
+
+        parts = [message] if message else []
+        if self.rate is not None:
+            parts.append(f"{self.rate:,.0f} {self.unit}/sn")
+        parts.append(f"Geçen {format_duration(elapsed)}")
+        if self.eta is not None and percent < 100:
+            parts.append(f"Kalan ~{format_duration(self.eta)}")
+        self.callback(percent, " | ".join(parts))
+
+
+class Job:
+    """Kuyrukta çalıştırılacak iptal edilebilir iş
+
+    func(progress) sonucu döndürür; progress bir ProgressTracker'dır ve
+    optimizer'ların progress_callback parametresine doğrudan verilebilir.
+    """
+
+    _ids = itertools.count(1)
+
+    def __init__(self, name, func, total=None, unit='kombinasyon'):
+        self.id = next(self._ids)
+        self.name = name
+        self.func = func
+        self.total = total
+        self.unit = unit
+        self.token = CancelToken()
+        self.status = 'pending'
+        self.result = None
+        self.error = None
+        self.started_at = None
+        self.finished_at = None
+
+    def cancel(self):
+        """İptal iste; henüz başlamamış iş hiç çalışmaz"""
+        self.token.cancel()
+        if self.status == 'pending':
+            self.status = 'cancelled'
+
+    @property
+    def duration(self):
+        if self.started_at is None:
+            return 0.0
+        return (self.finished_at or time.time()) - self.started_at
+
+    def run(self, progress_callback=None):
+        """İşi çalıştır; dönüş: 'done', 'cancelled' ya da 'failed'"""
+        if self.token.cancelled:
+            self.status = 'cancelled'
+            return self.status
+
+        self.status = 'running'
+        self.started_at = time.time()
+        progress = ProgressTracker(progress_callback, self.token, self.total, self.unit)
+        try:
+            self.result = self.func(progress)
+            self.status = 'done'
+        except JobCancelled:
+            self.status = 'cancelled'
+        except Exception as e:
+            self.error = e
+            self.status = 'failed'
+        finally:
+            self.finished_at = time.time()
+        return self.status
+
+    def __repr__(self):
+        return f"Job({self.id}, {self.name!r}, {self.status})"
+
+
+class JobQueue:
+    """İlk giren ilk çıkar iş kuyruğu
+
+    İşler tek bir worker tarafından sırayla alınır (next_job); kuyruk
+    thread-safe'tir, arayüz thread'i çalışırken iş ekleyip iptal edebilir.
+    """
+
+    def __init__(self):
+        self._jobs = deque()
+        self._lock = threading.Lock()
+        self.current = None
+
+    def submit(self, job):
+        with self._lock:
+            self._jobs.append(job)
+        return job
+
+    def next_job(self):
+        """Sıradaki iptal edilmemiş işi al; kuyruk boşsa None"""
+        with self._lock:
+            while self._jobs:
+                job = self._jobs.popleft()
+                if job.status == 'pending':
+                    self.current = job
+                    return job
+            self.current = None
+            return None
+
+    def pending(self):
+        with self._lock:
+            return [job for job in self._jobs if job.status == 'pending']
+
+    def cancel_current(self):
+        job = self.current
+        if job is not None:
+            job.cancel()
+        return job
+
+    def cancel_all(self):
+        """Bekleyen ve çalışan tüm işleri iptal et"""
+        with self._lock:
+            jobs = list(self._jobs)
+            self._jobs.clear()
+        for job in jobs:
+            job.cancel()
+        self.cancel_current()
+
+    def run_all(self, progress_callback=None):
+        """Kuyruktaki işleri bu thread'de sırayla çalıştır; biten işleri döndür"""
+        finished = []
+        while True:
+            job = self.next_job()
+            if job is None:
+                return finished
+            job.run(progress_callback)
+            finished.append(job)
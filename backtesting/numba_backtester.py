@@ -0,0 +1,393 @@
+# backtesting/numba_backtester.py
+import numpy as np
+import pandas as pd
+
+from backtesting.vectorized_optimizer import (
+    METRIC_COLUMNS, price_arrays, infer_periods_per_year, moving_average_matrix
+)
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """numba yoksa fonksiyonu olduğu gibi döndür"""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+from backtesting.trade_log import EXIT_STOP_LOSS, EXIT_TAKE_PROFIT, EXIT_CROSS, SELL, TradeLog
+
+
+@njit(cache=True)
+def _simulate(close, high, low, short_ma, long_ma, stop_loss, take_profit, initial_capital, prev_above):
+    """Tek parametre seti için bar bar pozisyon / SL / TP döngüsü
+
+    prev_above ilk bardan önceki short > long durumudur (seri başında False).
+    Dönüş: (portfolio_value, signal, fill_price, exit_reason)
+    signal: 1 alış, -1 satış, 0 işlem yok.
+    """
+    n = len(close)
+    portfolio_value = np.empty(n)
+    signal = np.zeros(n, dtype=np.int8)
+    fill_price = np.full(n, np.nan)
+    exit_reason = np.zeros(n, dtype=np.int8)
+
+    cash = initial_capital
+    entry = 0.0
+    in_position = False
+
+    for t in range(n):
+        above = short_ma[t] > long_ma[t]
+        exited = False
+        price = 0.0
+
+        if in_position:
+            stop_price = entry * (1.0 - stop_loss)
+            target_price = entry * (1.0 + take_profit)
+            if low[t] <= stop_price:
+                price = stop_price
+                exit_reason[t] = EXIT_STOP_LOSS
+                exited = True
+            elif high[t] >= target_price:
+                price = target_price
+                exit_reason[t] = EXIT_TAKE_PROFIT
+                exited = True
+            elif prev_above and not above:
+                price = close[t]
+                exit_reason[t] = EXIT_CROSS
+                exited = True
+            if exited:
+                cash *= price / entry
+                in_position = False
+                signal[t] = -1
+                fill_price[t] = price
+
+        if not in_position and not exited and above and not prev_above:
+            entry = close[t]
+            in_position = True
+            signal[t] = 1
+            fill_price[t] = entry
+
+        portfolio_value[t] = cash * close[t] / entry if in_position else cash
+        prev_above = above
+
+    return portfolio_value, signal, fill_price, exit_reason
+
+
+@njit(cache=True)
+def _equity_metrics(portfolio_value, initial_capital, periods_per_year):
+    """Portföy serisinden (toplam getiri, max drawdown, volatilite, sharpe)"""
+    n = len(portfolio_value)
+    previous = initial_capital
+    peak = initial_capital
+    max_dd = 0.0
+    sum_ret = 0.0
+    sum_ret2 = 0.0
+
+    for t in range(n):
+        value = portfolio_value[t]
+        ret = value / previous - 1.0
+        sum_ret += ret
+        sum_ret2 += ret * ret
+        if value > peak:
+            peak = value
+        dd = value / peak - 1.0
+        if dd < max_dd:
+            max_dd = dd
+        previous = value
+
+    count = max(n, 1)
+    mean = sum_ret / count
+    std = np.sqrt(max(sum_ret2 / count - mean * mean, 0.0))
+    sharpe = mean / std * np.sqrt(periods_per_year) if std > 0 else 0.0
+    return (previous / initial_capital - 1.0) * 100, max_dd * 100, std * np.sqrt(periods_per_year) * 100, sharpe
+
+
+@njit(cache=True)
+def _simulate_metrics(close, high, low, above, prev_above, sl, tp, initial_capital,
+                      periods_per_year, start, end, buy_hold, out_row):
+    """Tek kombinasyonu simüle edip metrikleri out_row'a yaz
+
+    Pozisyon dışındaki barlarda portföy değeri sabit olduğundan getiri,
+    tepe ve drawdown güncellemesi atlanır; sadece kesişim kontrol edilir.
+    """
+    cash = initial_capital
+    entry = 0.0
+    shares = 0.0
+    in_position = False
+    previous = initial_capital
+    peak = initial_capital
+    max_dd = 0.0
+    sum_ret = 0.0
+    sum_ret2 = 0.0
+    buys = 0
+    sells = 0
+    wins = 0
+
+    for t in range(start, end):
+        is_above = above[t]
+        if in_position:
+            ratio = 0.0
+            if low[t] <= entry * (1.0 - sl):
+                ratio = 1.0 - sl
+            elif high[t] >= entry * (1.0 + tp):
+                ratio = 1.0 + tp
+            elif prev_above and not is_above:
+                ratio = close[t] / entry
+
+            if ratio > 0.0:
+                cash *= ratio
+                in_position = False
+                sells += 1
+                if ratio > 1.0:
+                    wins += 1
+                value = cash
+            else:
+                value = shares * close[t]
+
+            ret = value / previous - 1.0
+            sum_ret += ret
+            sum_ret2 += ret * ret
+            if value > peak:
+                peak = value
+            dd = value / peak - 1.0
+            if dd < max_dd:
+                max_dd = dd
+            previous = value
+        elif is_above and not prev_above:
+            # Giriş barında değer cash'e eşittir, getiri 0
+            entry = close[t]
+            shares = cash / entry
+            in_position = True
+            buys += 1
+        prev_above = is_above
+
+    count = max(end - start, 1)
+    mean = sum_ret / count
+    std = np.sqrt(max(sum_ret2 / count - mean * mean, 0.0))
+
+    out_row[0] = (previous / initial_capital - 1.0) * 100
+    out_row[1] = buy_hold
+    out_row[2] = max_dd * 100
+    out_row[3] = std * np.sqrt(periods_per_year) * 100
+    out_row[4] = mean / std * np.sqrt(periods_per_year) if std > 0 else 0.0
+    out_row[5] = buys + sells
+    out_row[6] = buys
+    out_row[7] = sells
+    out_row[8] = wins / sells * 100 if sells > 0 else 0.0
+    out_row[9] = previous
+
+
+@njit(parallel=True, cache=True)
+def _grid_kernel(close, high, low, ma_matrix, short_cols, long_cols, stop_loss, take_profit,
+                 order, pair_bounds, initial_capital, periods_per_year, start, end, out):
+    """(short, long) çiftlerini prange ile paralel simüle et
+
+    order kombinasyonları çifte göre sıralar, pair_bounds her çiftin order
+    içindeki aralığıdır. short > long dizisi çift başına bir kez çıkarılır
+    ve o çiftin tüm SL/TP kombinasyonları bu diziyi paylaşır.
+    Sonuçlar (n_combos, len(METRIC_COLUMNS) + 1) boyutlu out matrisine yazılır.
+    """
+    n_pairs = len(pair_bounds) - 1
+    buy_hold = (close[end - 1] / close[start] - 1.0) * 100
+
+    for p in prange(n_pairs):
+        first = order[pair_bounds[p]]
+        s = short_cols[first]
+        l = long_cols[first]
+        above = np.zeros(end, dtype=np.bool_)
+        for t in range(start, end):
+            above[t] = ma_matrix[t, s] > ma_matrix[t, l]
+        prev_above = ma_matrix[start - 1, s] > ma_matrix[start - 1, l] if start > 0 else False
+
+        for i in range(pair_bounds[p], pair_bounds[p + 1]):
+            k = order[i]
+            _simulate_metrics(close, high, low, above, prev_above, stop_loss[k], take_profit[k],
+                              initial_capital, periods_per_year, start, end, buy_hold, out[k])
+
+
+def evaluate_grid_numba(close, high, low, ma_matrix, short_cols, long_cols, stop_loss, take_profit,
+                        start=0, end=None, initial_capital=100000, periods_per_year=252,
+                        progress_callback=None, progress_steps=20):
+    """evaluate_grid ile aynı girdi/çıktı sözleşmesine sahip derlenmiş motor
+
+    progress_callback(done_pairs, total_pairs) verilirse MA çiftleri
+    progress_steps parça halinde işlenir ve her parçadan sonra çağrılır.
+    """
+    end = len(close) if end is None else end
+    close = np.ascontiguousarray(close, dtype=np.float64)
+    high = np.ascontiguousarray(high, dtype=np.float64)
+    low = np.ascontiguousarray(low, dtype=np.float64)
+    ma_matrix = np.ascontiguousarray(ma_matrix, dtype=np.float64)
+    short_cols = np.asarray(short_cols, dtype=np.int64)
+    long_cols = np.asarray(long_cols, dtype=np.int64)
+    stop_loss = np.asarray(stop_loss, dtype=np.float64)
+    take_profit = np.asarray(take_profit, dtype=np.float64)
+
+    pair_key = short_cols * (int(long_cols.max(initial=0)) + 1) + long_cols
+    order = np.argsort(pair_key, kind='stable')
+    pair_bounds = np.flatnonzero(np.diff(pair_key[order], prepend=-1, append=-1)).astype(np.int64)
+    n_pairs = len(pair_bounds) - 1
+
+    out = np.zeros((len(short_cols), 10))
+    steps = progress_steps if progress_callback else 1
+    edges = np.unique(np.linspace(0, n_pairs, steps + 1).astype(np.int64))
+    for first, last in zip(edges[:-1], edges[1:]):
+        _grid_kernel(close, high, low, ma_matrix, short_cols, long_cols, stop_loss, take_profit,
+                     order, np.ascontiguousarray(pair_bounds[first:last + 1]),
+                     float(initial_capital), float(periods_per_year), int(start), int(end), out)
+        if progress_callback:
+            progress_callback(int(last), n_pairs)
+
+    metrics = {name: out[:, i] for i, name in enumerate(METRIC_COLUMNS)}
+    for name in ('total_trades', 'buy_trades', 'sell_trades'):
+        metrics[name] = metrics[name].astype(np.int64)
+    metrics['final_value'] = out[:, 9]
+    return metrics
+
+
+def simulate_segment(close, high, low, short_ma, long_ma, stop_loss, take_profit,
+                     initial_capital=100000, start=0, end=None):
+    """[start, end) aralığını tek parametre setiyle simüle et
+
+    MA dizileri tüm seri üzerinden hesaplanmış olabilir; start'tan önceki
+    bar sadece kesişim durumunu belirlemek için kullanılır, böylece sonuç
+    evaluate_grid(start=..., end=...) ile aynıdır.
+    Dönüş: (portfolio_value, signal, fill_price, exit_reason)
+    """
+    end = len(close) if end is None else end
+    prev_above = bool(short_ma[start - 1] > long_ma[start - 1]) if start > 0 else False
+    segment = slice(start, end)
+    return _simulate(
+        np.ascontiguousarray(close[segment], dtype=np.float64),
+        np.ascontiguousarray(high[segment], dtype=np.float64),
+        np.ascontiguousarray(low[segment], dtype=np.float64),
+        np.ascontiguousarray(short_ma[segment], dtype=np.float64),
+        np.ascontiguousarray(long_ma[segment], dtype=np.float64),
+        float(stop_loss), float(take_profit), float(initial_capital), prev_above
+    )
+
+
+def equity_metrics(portfolio_value, initial_capital, periods_per_year):
+    """Portföy serisinden (toplam getiri, max drawdown, volatilite, sharpe)"""
+    return _equity_metrics(np.ascontiguousarray(portfolio_value, dtype=np.float64),
+                           float(initial_capital), float(periods_per_year))
+
+
+class NumbaBacktester:
+    """GPU gerektirmeyen, numba ile derlenmiş MA crossover backtester
+
+    CUDABacktester ile aynı arayüzü sunar (run_ma_crossover_backtest,
+    calculate_performance_metrics). numba kurulu değilse aynı döngüler saf
+    Python olarak çalışır.
+    """
+
+    backend = 'numba' if NUMBA_AVAILABLE else 'python'
+
+    def __init__(self, initial_capital=100000):
+        self.initial_capital = initial_capital
+
+    def run_ma_crossover_backtest(self, data, short_window=10, long_window=30,
+                                  stop_loss=0.02, take_profit=0.04):
+        """MA crossover backtest'i çalıştır; (results, trades) döner"""
+        close, high, low = price_arrays(data)
+        ma = moving_average_matrix(close, [short_window, long_window])
+
+        portfolio_value, signal, fill_price, exit_reason = _simulate(
+            close, high, low, np.ascontiguousarray(ma[:, 0]), np.ascontiguousarray(ma[:, 1]),
+            float(stop_loss), float(take_profit), float(self.initial_capital), False
+        )
+
+        results = data.rename(columns=lambda c: str(c).lower()).copy()
+        results['short_ma'] = ma[:, 0]
+        results['long_ma'] = ma[:, 1]
+        results['signal'] = signal
+        results['position'] = np.cumsum(signal)
+        results['portfolio_value'] = portfolio_value
+        results['returns'] = results['portfolio_value'].pct_change().fillna(0.0)
+
+        trades = TradeLog.from_signals(results.index, signal, fill_price, exit_reason, portfolio_value, close)
+        return results, trades
+
+    def calculate_performance_metrics(self, results, trades):
+        """Backtest sonuçlarından performans metriklerini hesapla"""
+        if results is None or results.empty:
+            return {}
+
+        portfolio_value = results['portfolio_value'].to_numpy(dtype=np.float64)
+        total_return, max_drawdown, volatility, sharpe = _equity_metrics(
+            portfolio_value, float(self.initial_capital), float(infer_periods_per_year(results.index))
+        )
+        if isinstance(trades, TradeLog):
+            is_sell = trades['type'] == SELL
+            n_sells = int(is_sell.sum())
+            wins = int((trades['pnl'][is_sell] > 0).sum())
+        else:
+            sells = [t for t in trades if t['type'] == 'SELL']
+            n_sells = len(sells)
+            wins = sum(1 for t in sells if t['pnl'] > 0)
+
+        return {
+            'total_return': total_return,
+            'buy_hold_return': (results['close'].iloc[-1] / results['close'].iloc[0] - 1) * 100,
+            'max_drawdown': max_drawdown,
+            'volatility': volatility,
+            'sharpe_ratio': sharpe,
+            'total_trades': len(trades),
+            'buy_trades': len(trades) - n_sells,
+            'sell_trades': n_sells,
+            'win_rate': wins / n_sells * 100 if n_sells else 0.0,
+            'final_value': portfolio_value[-1],
+        }
+
+    def calculate_performance_metrics_batch(self, results_list, trades_list):
+        """Aynı bar aralığındaki çok sayıda backtest sonucunun metrikleri
+
+        Portföy serileri tek bir (backtest × bar) matrisinde toplanır ve
+        metrikler batch_performance_metrics ile dizi işlemleriyle hesaplanır.
+        Dönüş: her satırı bir backtest olan metrik tablosu.
+        """
+        from backtesting.batch_metrics import batch_performance_metrics, trade_list_arrays
+        if not results_list:
+            return pd.DataFrame()
+
+        first = results_list[0]
+        equity = np.stack([r['portfolio_value'].to_numpy(dtype=np.float64) for r in results_list])
+        metrics = batch_performance_metrics(
+            equity, np.stack([r['close'].to_numpy(dtype=np.float64) for r in results_list]),
+            *trade_list_arrays(trades_list),
+            initial_capital=float(self.initial_capital),
+            periods_per_year=float(infer_periods_per_year(first.index))
+        )
+        return pd.DataFrame(metrics)
+
+    def run_parameter_sets(self, data, short_windows, long_windows, stop_losses, take_profits):
+        """Birden çok parametre setini tek çağrıda paralel çalıştır
+
+        Dönüş: her satırı bir parametre seti olan metrik tablosu.
+        """
+        close, high, low = price_arrays(data)
+        short_windows = np.asarray(short_windows, dtype=np.int64)
+        long_windows = np.asarray(long_windows, dtype=np.int64)
+        windows = np.unique(np.concatenate([short_windows, long_windows]))
+        ma = moving_average_matrix(close, windows)
+
+        metrics = evaluate_grid_numba(
+            close, high, low, ma,
+            np.searchsorted(windows, short_windows), np.searchsorted(windows, long_windows),
+            stop_losses, take_profits,
+            initial_capital=self.initial_capital,
+            periods_per_year=infer_periods_per_year(data.index)
+        )
+        table = pd.DataFrame({
+            'short_window': short_windows, 'long_window': long_windows,
+            'stop_loss': np.asarray(stop_losses, dtype=np.float64),
+            'take_profit': np.asarray(take_profits, dtype=np.float64),
+        })
+        for name, values in metrics.items():
+            table[name] = values
+        return table
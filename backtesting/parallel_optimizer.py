@@ -0,0 +1,183 @@
+# backtesting/parallel_optimizer.py
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+import numpy as np
+import pandas as pd
+
+from backtesting.vectorized_optimizer import (
+    METRIC_COLUMNS, VectorizedOptimizer, evaluate_grid,
+    infer_periods_per_year, moving_average_matrix, price_arrays
+)
+
+# Worker process içindeki paylaşılan bellek görünümleri
+_worker_state = {}
+
+
+def _attach_shared_memory(name, n_bars, n_windows):
+    """Worker başlangıcı: fiyat ve MA matrisi bloğuna kopyalamadan bağlan"""
+    shm = shared_memory.SharedMemory(name=name)
+    prices = np.ndarray((3, n_bars), dtype=np.float64, buffer=shm.buf)
+    ma_matrix = np.ndarray((n_bars, n_windows), dtype=np.float64, buffer=shm.buf, offset=prices.nbytes)
+    _worker_state.update(shm=shm, prices=prices, ma_matrix=ma_matrix)
+
+
+def _evaluate_chunk(chunk_id, short_cols, long_cols, stop_loss, take_profit,
+                    initial_capital, periods_per_year, start=0, end=None):
+    """Bir grid parçasını paylaşılan veri üzerinde değerlendir ([start, end) bar aralığında)"""
+    close, high, low = _worker_state['prices']
+    metrics = evaluate_grid(
+        close, high, low, _worker_state['ma_matrix'],
+        short_cols, long_cols, stop_loss, take_profit,
+        start=start, end=end,
+        initial_capital=initial_capital, periods_per_year=periods_per_year
+    )
+    return chunk_id, metrics
+
+
+def _pair_chunks(order, short_cols, long_cols, n_chunks):
+    """Sıralı grid'i MA çifti sınırlarından yaklaşık eşit n_chunks parçaya böl
+
+    evaluate_grid kesişim sinyallerini parça içindeki her çift için bir kez
+    hesaplar; bir çift iki parçaya bölünmezse bu iş tekrarlanmaz.
+    """
+    pair_short, pair_long = short_cols[order], long_cols[order]
+    starts = np.flatnonzero(np.r_[True, (pair_short[1:] != pair_short[:-1]) |
+                                        (pair_long[1:] != pair_long[:-1])])
+    starts = np.append(starts, len(order))
+    targets = np.arange(1, n_chunks) * len(order) / n_chunks
+    cuts = np.unique(starts[np.searchsorted(starts, targets)])
+    return [c for c in np.split(order, cuts) if len(c)]
+
+
+class ParallelOptimizer(VectorizedOptimizer):
+    """Grid'i process havuzuna parçalayan çok çekirdekli optimizer
+
+    Sembolün close/high/low dizileri ve MA matrisi bir kez
+    multiprocessing.shared_memory'ye yazılır; worker'lar bu bloğa kopyasız
+    bağlanır. Grid MA çiftlerine göre sıralanıp çift sınırlarından parçalanır, parçalar
+    tamamlandıkça sonuçlar ve o ana kadarki en iyi değer raporlanır.
+    """
+
+    def __init__(self, backtester=None, initial_capital=100000, objective='sharpe_ratio',
+                 min_trades=2, workers=None, chunks_per_worker=4, min_parallel_combos=2000,
+                 result_cache=None):
+        super().__init__(backtester, initial_capital, objective, min_trades, result_cache=result_cache)
+        self.workers = workers or os.cpu_count() or 1
+        self.chunks_per_worker = chunks_per_worker
+        self.min_parallel_combos = min_parallel_combos
+
+    def _evaluate_table(self, data, grid, progress_callback=None):
+        """Grid'i worker'lara dağıt ve birleşik metrik tablosunu döndür
+
+        progress_callback(done, total, best) her parça tamamlandığında çağrılır.
+        """
+        n_combos = len(grid['short_window'])
+        if self.workers <= 1 or n_combos < self.min_parallel_combos:
+            def report_pairs(done, total):
+                if progress_callback:
+                    progress_callback(done * n_combos // max(1, total), n_combos, None)
+
+            return super()._evaluate_table(data, grid, report_pairs)
+
+        close, high, low = price_arrays(data)
+        windows, inverse = np.unique(
+            np.concatenate((grid['short_window'], grid['long_window'])), return_inverse=True
+        )
+        short_cols, long_cols = inverse[:n_combos], inverse[n_combos:]
+        ma_matrix = moving_average_matrix(close, windows)
+        periods_per_year = infer_periods_per_year(data.index)
+
+        # Aynı MA çiftine ait kombinasyonlar aynı parçaya düşsün
+        order = np.lexsort((grid['take_profit'], grid['stop_loss'], long_cols, short_cols))
+        chunks = _pair_chunks(order, short_cols, long_cols, self.workers * self.chunks_per_worker)
+
+        n_bars = len(close)
+        shm = shared_memory.SharedMemory(create=True, size=(3 + len(windows)) * n_bars * 8)
+        try:
+            prices = np.ndarray((3, n_bars), dtype=np.float64, buffer=shm.buf)
+            prices[:] = (close, high, low)
+            shared_ma = np.ndarray(ma_matrix.shape, dtype=np.float64, buffer=shm.buf, offset=prices.nbytes)
+            shared_ma[:] = ma_matrix
+            del ma_matrix
+
+            metrics = {column: np.zeros(n_combos) for column in METRIC_COLUMNS + ['final_value']}
+            best = None
+            done = 0
+
+            # Ebeveynde numba (TBB/OpenMP) iş parçacıkları çalışmış olabilir; fork
+            # edilen child bu kilitleri kopyalayıp çıkışta kilitlenebilir. Worker'lar
+            # spawn ile temiz başlar, veri zaten paylaşılan bellekten okunur.
+            with ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_attach_shared_memory,
+                initargs=(shm.name, n_bars, len(windows)),
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        _evaluate_chunk, i, short_cols[idx], long_cols[idx],
+                        grid['stop_loss'][idx], grid['take_profit'][idx],
+                        self.initial_capital, periods_per_year
+                    )
+                    for i, idx in enumerate(chunks)
+                ]
+
+                try:
+                    for future in as_completed(futures):
+                        chunk_id, chunk_metrics = future.result()
+                        idx = chunks[chunk_id]
+                        for column, values in chunk_metrics.items():
+                            metrics[column][idx] = values
+
+                        score = np.where(chunk_metrics['sell_trades'] >= self.min_trades,
+                                         chunk_metrics[self.objective], -np.inf)
+                        chunk_best = score.max()
+                        if best is None or chunk_best > best:
+                            best = chunk_best
+
+                        done += len(idx)
+                        if progress_callback:
+                            progress_callback(done, n_combos, best)
+                except BaseException:
+                    # İptal ya da hata: bekleyen parçaları başlatmadan çık
+                    for future in futures:
+                        future.cancel()
+                    raise
+
+            del prices, shared_ma
+        finally:
+            shm.close()
+            shm.unlink()
+
+        table = pd.DataFrame(grid)
+        for column in METRIC_COLUMNS + ['final_value']:
+            table[column] = metrics[column]
+        for column in ('total_trades', 'buy_trades', 'sell_trades'):
+            table[column] = table[column].astype(np.int64)
+        return table
+
+    def optimize_ma_parameters(self, data, param_ranges, progress_callback=None):
+        """En iyi parametreleri ve metriklerini döndür
+
+        progress_callback(percent, message) verilirse parça bazında ilerleme raporlanır.
+        """
+        start_time = time.time()
+
+        def report(done, total, best=None):
+            if not progress_callback:
+                return
+            rate = done / max(time.time() - start_time, 1e-6)
+            message = f"{done:,}/{total:,} kombinasyon ({rate:,.0f}/sn)"
+            if best is not None and np.isfinite(best):
+                message += f" | En iyi {self.objective}: {best:.2f}"
+            progress_callback(int(done * 100 / max(1, total)), message)
+
+        table = self.run_grid(data, param_ranges, progress_callback=report)
+        self._record_results(table)
+
+        print(f"⚡ {len(table):,} kombinasyon {self.workers} worker ile "
+              f"{time.time() - start_time:.2f} saniyede değerlendirildi")
+        return self.best_from_table(table)
@@ -0,0 +1,253 @@
+# backtesting/result_cache.py
+import hashlib
+import json
+import os
+import pickle
+import threading
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'cache', 'results')
+
+PARAM_COLUMNS = ['short_window', 'long_window', 'stop_loss', 'take_profit']
+
+
+def data_fingerprint(data):
+    """OHLCV dizileri ve zaman indeksinden içerik özeti"""
+    digest = hashlib.blake2b(digest_size=16)
+    index = pd.DatetimeIndex(data.index)
+    digest.update(np.ascontiguousarray(index.values.astype('datetime64[ns]').view(np.int64)).tobytes())
+    for name in ('open', 'high', 'low', 'close', 'volume'):
+        for key in (name, name.capitalize()):
+            if key in data.columns:
+                digest.update(key.lower().encode())
+                digest.update(np.ascontiguousarray(data[key].to_numpy(dtype=np.float64)).tobytes())
+                break
+    return digest.hexdigest()
+
+
+def _normalize(value):
+    """Parametreyi JSON anahtarı için kararlı hale getir"""
+    if isinstance(value, (float, np.floating)):
+        return round(float(value), 8)
+    if isinstance(value, np.integer):
+        return int(value)
+    return value
+
+
+class ResultCache:
+    """İçerik adresli, iki katmanlı backtest sonuç önbelleği
+
+    Anahtar veri özeti + strateji adı + parametrelerden üretilir. Bellekte
+    boyut sınırlı bir LRU katmanı, diskte ise boyut sınırlı ve en eski
+    erişilen dosyadan başlayarak temizlenen bir pickle katmanı tutulur.
+    """
+
+    def __init__(self, cache_dir=None, memory_bytes=256 * 1024 ** 2, disk_bytes=2 * 1024 ** 3):
+        self.cache_dir = cache_dir or DEFAULT_CACHE_DIR
+        self.memory_bytes = memory_bytes
+        self.disk_bytes = disk_bytes
+        self._memory = OrderedDict()
+        self._memory_size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    @staticmethod
+    def key(fingerprint, strategy, params):
+        """(veri özeti, strateji, parametreler) için önbellek anahtarı"""
+        payload = json.dumps({k: _normalize(v) for k, v in params.items()}, sort_keys=True)
+        return hashlib.blake2b(f"{fingerprint}|{strategy}|{payload}".encode(), digest_size=20).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.pkl")
+
+    def _remember(self, key, blob):
+        """Bellek katmanına ekle ve sınır aşılırsa en eskileri çıkar"""
+        with self._lock:
+            if key in self._memory:
+                self._memory_size -= len(self._memory.pop(key))
+            if len(blob) > self.memory_bytes:
+                return
+            self._memory[key] = blob
+            self._memory_size += len(blob)
+            while self._memory_size > self.memory_bytes:
+                _, evicted = self._memory.popitem(last=False)
+                self._memory_size -= len(evicted)
+
+    def get(self, key):
+        """Önbellekteki değeri döndür; yoksa None"""
+        with self._lock:
+            blob = self._memory.get(key)
+            if blob is not None:
+                self._memory.move_to_end(key)
+
+        if blob is None:
+            path = self._path(key)
+            try:
+                with open(path, 'rb') as f:
+                    blob = f.read()
+                os.utime(path)
+            except OSError:
+                self.misses += 1
+                return None
+            self._remember(key, blob)
+
+        self.hits += 1
+        # Her okuma ayrı bir kopya döndürür; çağıran değiştirse de önbellek bozulmaz
+        return pickle.loads(blob)
+
+    def put(self, key, value):
+        """Değeri iki katmana da yaz"""
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        self._remember(key, blob)
+
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(blob)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"⚠️ Sonuç önbelleğe yazılamadı: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return
+        self._evict_disk()
+
+    def _evict_disk(self):
+        """Disk katmanı sınırı aşarsa en eski erişilen dosyaları sil"""
+        entries = []
+        total = 0
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if entry.name.endswith('.pkl'):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+                    total += stat.st_size
+        if total <= self.disk_bytes:
+            return
+
+        for _, size, path in sorted(entries):
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            if total <= self.disk_bytes:
+                break
+
+    def get_or_compute(self, key, compute):
+        """Önbellekte varsa döndür, yoksa compute() sonucunu kaydedip döndür"""
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def cached_grid(self, fingerprint, strategy, settings, grid, evaluate):
+        """Grid metrik tablosunu önceki taramalarla birleştirerek döndür
+
+        Daha önce aynı veri ve ayarlarla değerlendirilmiş kombinasyonlar
+        önbellekten gelir; evaluate(missing_grid) sadece eksik kombinasyonlar
+        için çağrılır. Tablo grid sırasıyla döner.
+        """
+        key = self.key(fingerprint, f"{strategy}:grid", settings)
+        known = self.get(key)
+
+        table = pd.DataFrame(grid)
+        table['stop_loss'] = table['stop_loss'].round(8)
+        table['take_profit'] = table['take_profit'].round(8)
+
+        if known is not None and not known.empty:
+            merged = table.merge(known, on=PARAM_COLUMNS, how='left', indicator=True)
+            missing = (merged['_merge'] == 'left_only').to_numpy()
+            merged = merged.drop(columns='_merge')
+        else:
+            merged = None
+            missing = np.ones(len(table), dtype=bool)
+
+        if not missing.any():
+            return merged
+
+        missing_grid = {name: np.asarray(grid[name])[missing] for name in PARAM_COLUMNS}
+        fresh = evaluate(missing_grid)
+        fresh['stop_loss'] = fresh['stop_loss'].round(8)
+        fresh['take_profit'] = fresh['take_profit'].round(8)
+
+        if merged is None:
+            result = fresh.reset_index(drop=True)
+        else:
+            result = merged.copy()
+            for column in fresh.columns:
+                if column not in PARAM_COLUMNS:
+                    values = result[column].to_numpy(dtype=np.float64, na_value=np.nan, copy=True)
+                    values[missing] = fresh[column].to_numpy(dtype=np.float64)
+                    result[column] = values
+            for column in ('total_trades', 'buy_trades', 'sell_trades'):
+                if column in result:
+                    result[column] = result[column].astype(np.int64)
+
+        combined = fresh if known is None else pd.concat([known, fresh], ignore_index=True)
+        self.put(key, combined.drop_duplicates(PARAM_COLUMNS, keep='last').reset_index(drop=True))
+        return result
+
+    def clear(self):
+        """Tüm önbelleği temizle"""
+        with self._lock:
+            self._memory.clear()
+            self._memory_size = 0
+        for name in os.listdir(self.cache_dir):
+            if name.endswith('.pkl'):
+                try:
+                    os.remove(os.path.join(self.cache_dir, name))
+                except OSError:
+                    pass
+
+
+class CachedBacktester:
+    """Herhangi bir backtester'ı sonuç önbelleğiyle saran katman
+
+    run_ma_crossover_backtest aynı veri ve parametrelerle tekrar
+    çağrıldığında (results, trades) önbellekten döner; metrikler aynı
+    kayıtta saklandığından calculate_performance_metrics de hesaplama yapmaz.
+    Diğer tüm nitelikler sarılan backtester'a yönlendirilir.
+    """
+
+    def __init__(self, backtester, cache=None, strategy='ma_crossover'):
+        self.backtester = backtester
+        self.cache = cache or ResultCache()
+        self.strategy = strategy
+        self._last = None
+
+    def __getattr__(self, name):
+        return getattr(self.backtester, name)
+
+    def run_ma_crossover_backtest(self, data, short_window=10, long_window=30,
+                                  stop_loss=0.02, take_profit=0.04):
+        params = {
+            'short_window': short_window, 'long_window': long_window,
+            'stop_loss': stop_loss, 'take_profit': take_profit,
+            'initial_capital': getattr(self.backtester, 'initial_capital', None),
+            'backend': type(self.backtester).__name__,
+        }
+        key = self.cache.key(data_fingerprint(data), self.strategy, params)
+
+        def compute():
+            results, trades = self.backtester.run_ma_crossover_backtest(
+                data, short_window=short_window, long_window=long_window,
+                stop_loss=stop_loss, take_profit=take_profit
+            )
+            metrics = self.backtester.calculate_performance_metrics(results, trades)
+            return {'results': results, 'trades': trades, 'metrics': metrics}
+
+        entry = self.cache.get_or_compute(key, compute)
+        self._last = (entry['results'], entry['metrics'])
+        return entry['results'], entry['trades']
+
+    def calculate_performance_metrics(self, results, trades):
+        if self._last is not None and self._last[0] is results:
+            return dict(self._last[1])
+        return self.backtester.calculate_performance_metrics(results, trades)
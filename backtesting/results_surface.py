@@ -0,0 +1,100 @@
+# backtesting/results_surface.py
+import json
+import os
+import numpy as np
+import pandas as pd
+
+from backtesting.vectorized_optimizer import METRIC_COLUMNS
+
+DEFAULT_SURFACE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'cache', 'surfaces')
+
+PARAM_COLUMNS = ['short_window', 'long_window', 'stop_loss', 'take_profit']
+
+SURFACE_DTYPE = np.dtype(
+    [('short_window', np.int32), ('long_window', np.int32),
+     ('stop_loss', np.float32), ('take_profit', np.float32)]
+    + [(name, np.int32 if name.endswith('_trades') else np.float32) for name in METRIC_COLUMNS]
+    + [('final_value', np.float64)]
+)
+
+
+class ResultsSurface:
+    """Tüm kombinasyonları ve metriklerini tutan kompakt sonuç yüzeyi
+
+    Veri tek bir NumPy structured array'dir (kombinasyon başına ~60 byte).
+    Yüzey .npz dosyasına kaydedilip geri yüklenebilir; ısı haritaları ve
+    parametre kararlılığı yeniden backtest yapmadan hesaplanır.
+    """
+
+    def __init__(self, records, meta=None):
+        self.records = records
+        self.meta = dict(meta or {})
+
+    @classmethod
+    def from_table(cls, table, meta=None):
+        """Optimizer metrik tablosundan yüzey oluştur"""
+        records = np.zeros(len(table), dtype=SURFACE_DTYPE)
+        for name in SURFACE_DTYPE.names:
+            if name in table.columns:
+                records[name] = table[name].to_numpy()
+        return cls(records, meta)
+
+    def __len__(self):
+        return len(self.records)
+
+    def to_frame(self):
+        """Yüzeyi DataFrame olarak döndür"""
+        return pd.DataFrame(self.records)
+
+    def top_k(self, objective='sharpe_ratio', k=20, larger_is_better=True, min_trades=0):
+        """Objective'e göre en iyi k kombinasyon"""
+        records = self.records
+        if min_trades:
+            records = records[records['sell_trades'] >= min_trades]
+        scores = records[objective].astype(np.float64)
+        if not larger_is_better:
+            scores = -scores
+        order = np.argsort(-np.nan_to_num(scores, nan=-np.inf), kind='stable')[:k]
+        return pd.DataFrame(records[order])
+
+    def heatmap(self, x='short_window', y='long_window', value='sharpe_ratio', agg='max'):
+        """İki parametre üzerinde metrik ısı haritası (diğer parametreler agg ile indirgenir)"""
+        return self.to_frame().pivot_table(index=y, columns=x, values=value, aggfunc=agg)
+
+    def stability(self, params, value='sharpe_ratio', radius=1):
+        """Bir parametre setinin komşuluğundaki metrik dağılımı
+
+        Komşuluk, her parametrede grid üzerinde en fazla radius adım uzaktaki
+        kombinasyonlardır. Tepe değeri komşularından çok yüksekse sonuç
+        kırılgandır.
+        """
+        mask = np.ones(len(self.records), dtype=bool)
+        for name in PARAM_COLUMNS:
+            values = np.unique(self.records[name])
+            position = np.searchsorted(values, np.asarray(params[name], dtype=values.dtype))
+            low = values[max(0, position - radius)]
+            high = values[min(len(values) - 1, position + radius)]
+            mask &= (self.records[name] >= low) & (self.records[name] <= high)
+
+        neighbors = self.records[value][mask].astype(np.float64)
+        if len(neighbors) == 0:
+            return {'neighbors': 0}
+        return {
+            'neighbors': int(len(neighbors)),
+            'mean': float(np.mean(neighbors)),
+            'std': float(np.std(neighbors)),
+            'min': float(np.min(neighbors)),
+            'max': float(np.max(neighbors)),
+        }
+
+    def save(self, path):
+        """Yüzeyi sıkıştırılmış .npz dosyasına kaydet"""
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        np.savez_compressed(path, records=self.records, meta=np.array(json.dumps(self.meta, default=str)))
+        return path
+
+    @classmethod
+    def load(cls, path):
+        """Kaydedilmiş yüzeyi yükle"""
+        with np.load(path) as f:
+            return cls(f['records'], json.loads(str(f['meta'])))
@@ -0,0 +1,212 @@
+# backtesting/trade_log.py
+from collections.abc import Mapping
+import numpy as np
+import pandas as pd
+
+# İşlem yönü kodları
+BUY = 1
+SELL = -1
+TRADE_TYPES = {BUY: 'BUY', SELL: 'SELL'}
+
+# Çıkış sebebi kodları (AL işlemleri de kesişimle açıldığı için EXIT_CROSS taşır)
+EXIT_NONE = 0
+EXIT_STOP_LOSS = 1
+EXIT_TAKE_PROFIT = 2
+EXIT_CROSS = 3
+
+EXIT_REASONS = {
+    EXIT_STOP_LOSS: 'Stop Loss',
+    EXIT_TAKE_PROFIT: 'Take Profit',
+    EXIT_CROSS: 'MA Cross',
+}
+
+TRADE_DTYPE = np.dtype([
+    ('date', 'datetime64[ns]'), ('type', np.int8), ('reason', np.int8),
+    ('price', np.float64), ('shares', np.float64), ('pnl', np.float64),
+])
+
+_TYPE_CODES = {name: code for code, name in TRADE_TYPES.items()}
+_REASON_CODES = {name: code for code, name in EXIT_REASONS.items()}
+_REASON_NAMES = np.array([EXIT_REASONS.get(code, '') for code in range(max(EXIT_REASONS) + 1)], dtype=object)
+
+
+class TradeRecord(Mapping):
+    """TradeLog'daki tek işlemin sözlük görünümü (kopya oluşturmaz)
+
+    Eski list-of-dicts arayüzüyle uyumludur: trade['date'], trade['type'],
+    trade.get('pnl', 0) vb. çalışır.
+    """
+
+    __slots__ = ('_log', '_row')
+
+    def __init__(self, log, row):
+        self._log = log
+        self._row = row
+
+    def __getitem__(self, key):
+        if key not in TRADE_DTYPE.names:
+            raise KeyError(key)
+        value = self._log.records[key][self._row]
+        if key == 'date':
+            return self._log._timestamp(value)
+        if key == 'type':
+            return TRADE_TYPES[int(value)]
+        if key == 'reason':
+            return EXIT_REASONS.get(int(value), '')
+        return float(value)
+
+    def __iter__(self):
+        return iter(TRADE_DTYPE.names)
+
+    def __len__(self):
+        return len(TRADE_DTYPE.names)
+
+    def __repr__(self):
+        return repr(dict(self))
+
+
+class TradeLog:
+    """Kolon bazlı, NumPy structured array tabanlı işlem kaydı
+
+    İşlem başına sabit 34 byte tutulur; tip ve sebep int8 kodlarıdır.
+    Backtester'lar kaydı from_signals ile tek seferde ya da append ile
+    yerinde doldurur. Liste gibi indekslenip gezilebilir; her eleman
+    TradeRecord sözlük görünümüdür. Saat dilimli verilerde tarihler yerel
+    duvar saati olarak saklanır, dilim tz'de tutulur ve trade['date'] ile
+    to_frame() dilimli zaman döndürür.
+    """
+
+    def __init__(self, capacity=0, tz=None):
+        self._records = np.empty(capacity, dtype=TRADE_DTYPE)
+        self._size = 0
+        self.tz = tz
+
+    @classmethod
+    def from_records(cls, records, tz=None):
+        log = cls(tz=tz)
+        log._records = records
+        log._size = len(records)
+        return log
+
+    def _timestamp(self, value):
+        stamp = pd.Timestamp(value)
+        return stamp.tz_localize(self.tz) if self.tz is not None else stamp
+
+    @classmethod
+    def from_signals(cls, index, signal, fill_price, exit_reason, portfolio_value, close):
+        """Simülasyon dizilerinden işlem kaydını dizi işlemleriyle oluştur
+
+        AL ve SAT sırayla gelir; SAT işleminin lot ve kâr/zararı bir önceki
+        AL işleminden türetilir.
+        """
+        bars = np.flatnonzero(signal)
+        records = np.empty(len(bars), dtype=TRADE_DTYPE)
+        side = np.asarray(signal)[bars]
+        price = np.asarray(fill_price, dtype=np.float64)[bars]
+        sells = np.flatnonzero(side == SELL)
+
+        shares = np.asarray(portfolio_value, dtype=np.float64)[bars] / np.asarray(close, dtype=np.float64)[bars]
+        shares[sells] = shares[sells - 1]
+        pnl = np.zeros(len(bars))
+        pnl[sells] = (price[sells] / price[sells - 1] - 1) * 100
+
+        index = pd.DatetimeIndex(index)
+        records['date'] = index.tz_localize(None).values[bars]
+        records['type'] = side
+        records['reason'] = np.where(side == BUY, EXIT_CROSS, np.asarray(exit_reason)[bars])
+        records['price'] = price
+        records['shares'] = shares
+        records['pnl'] = pnl
+        return cls.from_records(records, index.tz)
+
+    @classmethod
+    def from_dicts(cls, trades):
+        """list-of-dicts işlem listesinden dönüştür"""
+        log = cls(len(trades))
+        for trade in trades:
+            log.append(trade['date'], trade['type'], trade['price'], trade.get('shares', 0.0),
+                       trade.get('reason', ''), trade.get('pnl', 0.0))
+        return log
+
+    def append(self, date, trade_type, price, shares, reason, pnl=0.0):
+        """Tek işlem ekle; kapasite dolarsa iki katına çıkar"""
+        if self._size == len(self._records):
+            grown = np.empty(max(16, 2 * len(self._records)), dtype=TRADE_DTYPE)
+            grown[:self._size] = self._records[:self._size]
+            self._records = grown
+        if isinstance(trade_type, str):
+            trade_type = _TYPE_CODES[trade_type]
+        if isinstance(reason, str):
+            reason = _REASON_CODES.get(reason, EXIT_NONE)
+        date = pd.Timestamp(date)
+        if date.tz is not None:
+            if self.tz is None and self._size == 0:
+                self.tz = date.tz
+            date = date.tz_convert(self.tz).tz_localize(None) if self.tz is not None else date.tz_localize(None)
+        self._records[self._size] = (np.datetime64(date, 'ns'), trade_type, reason,
+                                     price, shares, pnl)
+        self._size += 1
+
+    @property
+    def records(self):
+        """Doldurulmuş kısmın structured array görünümü"""
+        return self._records[:self._size]
+
+    @property
+    def nbytes(self):
+        return self.records.nbytes
+
+    def __len__(self):
+        return self._size
+
+    def __bool__(self):
+        return self._size > 0
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return TradeLog.from_records(self.records[item], self.tz)
+        if isinstance(item, str):
+            return self.records[item]
+        if item < 0:
+            item += self._size
+        if not 0 <= item < self._size:
+            raise IndexError("işlem indeksi aralık dışında")
+        return TradeRecord(self, item)
+
+    def __iter__(self):
+        for row in range(self._size):
+            yield TradeRecord(self, row)
+
+    def __getstate__(self):
+        return {'records': self.records.copy(), 'tz': self.tz}
+
+    def __setstate__(self, state):
+        self._records = state['records']
+        self._size = len(self._records)
+        self.tz = state.get('tz')
+
+    def __repr__(self):
+        return f"TradeLog({self._size} işlem)"
+
+    def sells(self):
+        """Sadece SAT işlemlerinin kaydı"""
+        return TradeLog.from_records(self.records[self.records['type'] == SELL], self.tz)
+
+    def to_frame(self):
+        """İşlemleri DataFrame olarak döndür (kodlar metne çevrilir)"""
+        records = self.records
+        dates = pd.DatetimeIndex(records['date'])
+        if self.tz is not None:
+            dates = dates.tz_localize(self.tz)
+        return pd.DataFrame({
+            'date': dates,
+            'type': pd.Categorical.from_codes((records['type'] == SELL).astype(np.int8), ['BUY', 'SELL']),
+            'price': records['price'],
+            'shares': records['shares'],
+            'reason': _REASON_NAMES[records['reason']],
+            'pnl': records['pnl'],
+        })
+
+    def to_dicts(self):
+        """Eski list-of-dicts biçimine dönüştür"""
+        return [dict(trade) for trade in self]
@@ -0,0 +1,115 @@
+# backtesting/universe_scanner.py
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import pandas as pd
+
+from backtesting.numba_backtester import NumbaBacktester
+from backtesting.vectorized_optimizer import METRIC_COLUMNS
+
+# Worker process'inin kendi database bağlantısı ve backtester'ı
+_worker_db = None
+_worker_backtester = None
+
+
+def _init_scan_worker(initial_capital):
+    """Scan worker başlangıcı: process başına bir database yöneticisi ve backtester"""
+    global _worker_db, _worker_backtester
+    from database.backend import get_database_manager
+    _worker_db = get_database_manager()
+    _worker_backtester = NumbaBacktester(initial_capital=initial_capital)
+
+
+def _scan_symbol(symbol, timeframe, params, min_bars, db=None, backtester=None):
+    """Tek sembolün verisini yükle ve backtest et; metrik satırı döndür"""
+    db = db or _worker_db
+    backtester = backtester or _worker_backtester
+    row = {'symbol': symbol, 'timeframe': timeframe, 'bars': 0, 'error': None}
+    try:
+        data = db.get_symbol_data(symbol, timeframe)
+        if data is None or len(data) < min_bars:
+            row['bars'] = 0 if data is None else len(data)
+            row['error'] = "Yetersiz veri"
+            return row
+
+        results, trades = backtester.run_ma_crossover_backtest(data, **params)
+        metrics = backtester.calculate_performance_metrics(results, trades)
+        row['bars'] = len(data)
+        row.update({key: metrics.get(key) for key in METRIC_COLUMNS + ['final_value']})
+    except Exception as e:
+        row['error'] = str(e)
+    return row
+
+
+class UniverseScanner:
+    """Tek bir stratejiyi tüm sembollerde paralel çalıştıran tarayıcı
+
+    Her worker process kendi database bağlantısını açar ve sembol verisini
+    kendisi okur (önbellek varsa memory-map ile); ana process'e sadece
+    metrik satırları döner. Sonuçlar geldikçe iter_scan ile akıtılır.
+    """
+
+    def __init__(self, db=None, workers=None, initial_capital=100000):
+        self.db = db
+        self.workers = workers or os.cpu_count() or 1
+        self.initial_capital = initial_capital
+
+    def _database(self):
+        if self.db is None:
+            from database.backend import get_database_manager
+            self.db = get_database_manager()
+        return self.db
+
+    def _symbols(self, symbols):
+        if symbols is not None:
+            return list(symbols)
+        return self._database().get_available_symbols()
+
+    def iter_scan(self, timeframe, params, symbols=None, min_bars=None):
+        """Her sembolün metrik satırını tamamlandıkça üret"""
+        symbols = self._symbols(symbols)
+        min_bars = min_bars or params.get('long_window', 30) + 2
+
+        if self.workers <= 1 or len(symbols) <= 1:
+            db = self._database()
+            backtester = NumbaBacktester(initial_capital=self.initial_capital)
+            for symbol in symbols:
+                yield _scan_symbol(symbol, timeframe, params, min_bars, db, backtester)
+            return
+
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_scan_worker,
+                                 initargs=(self.initial_capital,)) as executor:
+            futures = [executor.submit(_scan_symbol, symbol, timeframe, params, min_bars)
+                       for symbol in symbols]
+            try:
+                for future in as_completed(futures):
+                    yield future.result()
+            finally:
+                for future in futures:
+                    future.cancel()
+
+    def scan(self, timeframe, params, symbols=None, rank_by='sharpe_ratio', min_bars=None, on_result=None):
+        """Tüm evreni tara ve rank_by'a göre sıralı metrik tablosu döndür
+
+        on_result(row, done, total) her sembol tamamlandığında çağrılır.
+        Hatalı ya da verisi yetersiz semboller tablonun sonunda yer alır.
+        """
+        symbols = self._symbols(symbols)
+        start_time = time.time()
+        rows = []
+
+        for row in self.iter_scan(timeframe, params, symbols=symbols, min_bars=min_bars):
+            rows.append(row)
+            if on_result:
+                on_result(row, len(rows), len(symbols))
+
+        metric_columns = METRIC_COLUMNS + ['final_value']
+        table = pd.DataFrame(rows, columns=['symbol', 'timeframe', 'bars'] + metric_columns + ['error'])
+        table[metric_columns] = table[metric_columns].apply(pd.to_numeric)
+        table = table.sort_values(rank_by, ascending=False, na_position='last').reset_index(drop=True)
+        table.index = table.index + 1
+        table.index.name = 'rank'
+
+        print(f"⚡ {len(symbols)} sembol {time.time() - start_time:.2f} saniyede tarandı "
+              f"({table['error'].isna().sum()} başarılı)")
+        return table
@@ -0,0 +1,409 @@
+# backtesting/vectorized_optimizer.py
+import time
+import numpy as np
+import pandas as pd
+
+# BIST sürekli işlem seansı (10:00 - 18:00)
+SESSION_SECONDS = 8 * 60 * 60
+TRADING_DAYS = 252
+
+METRIC_COLUMNS = [
+    'total_return', 'buy_hold_return', 'max_drawdown', 'volatility',
+    'sharpe_ratio', 'total_trades', 'buy_trades', 'sell_trades', 'win_rate'
+]
+
+
+def build_param_grid(param_ranges):
+    """Arayüzdeki min/max/step aralıklarından parametre grid'i oluştur
+
+    Stop loss / take profit değerleri yüzde olarak gelir, oran olarak döner.
+    Short >= long olan anlamsız kombinasyonlar elenir.
+    """
+    shorts = np.arange(param_ranges['short_min'], param_ranges['short_max'] + 1, param_ranges['short_step'])
+    longs = np.arange(param_ranges['long_min'], param_ranges['long_max'] + 1, param_ranges['long_step'])
+    sls = np.arange(param_ranges['sl_min'] / 100, param_ranges['sl_max'] / 100 + 0.001, param_ranges['sl_step'] / 100)
+    tps = np.arange(param_ranges['tp_min'] / 100, param_ranges['tp_max'] / 100 + 0.001, param_ranges['tp_step'] / 100)
+
+    s, l, sl, tp = np.meshgrid(shorts, longs, np.round(sls, 4), np.round(tps, 4), indexing='ij')
+    valid = s < l
+
+    return {
+        'short_window': s[valid].astype(np.int64),
+        'long_window': l[valid].astype(np.int64),
+        'stop_loss': sl[valid].astype(np.float64),
+        'take_profit': tp[valid].astype(np.float64),
+    }
+
+
+# Backtest ve optimizer'ın okuduğu bar kolonları
+PRICE_COLUMNS = ['high', 'low', 'close']
+
+
+def price_arrays(data):
+    """DataFrame'den close/high/low dizilerini al (high/low yoksa close kullanılır)"""
+    def column(name):
+        for key in (name, name.capitalize()):
+            if key in data.columns:
+                return data[key].to_numpy(dtype=np.float64)
+        return None
+
+    close = column('close')
+    if close is None:
+        raise ValueError("Veride 'close' kolonu bulunamadı")
+    high = column('high')
+    low = column('low')
+    return close, close if high is None else high, close if low is None else low
+
+
+def infer_periods_per_year(index):
+    """Bar aralığından yıllık periyot sayısını tahmin et"""
+    if not isinstance(index, pd.DatetimeIndex) or len(index) < 2:
+        return TRADING_DAYS
+
+    step = np.median((index[1:1000] - index[:999]).total_seconds())
+    if step <= 0 or step >= 24 * 60 * 60:
+        return TRADING_DAYS
+    return TRADING_DAYS * max(1.0, SESSION_SECONDS / step)
+
+
+def moving_average_matrix(close, windows):
+    """Her pencere için basit hareketli ortalamayı bir kez hesapla
+
+    Dönüş (n_bars, n_windows) şeklindedir; her satır bir bara ait tüm
+    ortalamaları bitişik tutar. Pencere dolmadan önceki değerler NaN'dır.
+    """
+    close = np.asarray(close, dtype=np.float64)
+    windows = np.asarray(windows, dtype=np.int64)
+    n = len(close)
+
+    csum = np.concatenate(([0.0], np.cumsum(close)))
+    matrix = np.full((n, len(windows)), np.nan)
+    for j, window in enumerate(windows):
+        if window <= n:
+            matrix[window - 1:, j] = (csum[window:] - csum[:-window]) / window
+    return matrix
+
+
+def _concat_ranges(starts, lengths):
+    """Ardışık [start, start + length) aralıklarını tek indeks dizisine aç"""
+    offsets = np.cumsum(lengths) - lengths
+    positions = np.arange(lengths.sum()) - np.repeat(offsets, lengths)
+    return positions + np.repeat(starts, lengths), offsets
+
+
+def _segment_running(values, offset, how):
+    """Segment içi kümülatif max/min
+
+    offset her segment için değerlerden büyük, artan bir kaydırmadır
+    (segment_no * big); böylece tek bir accumulate segment sınırlarını aşmaz.
+    """
+    if how == 'max':
+        return np.maximum.accumulate(values + offset) - offset
+    return np.minimum.accumulate(values - offset) + offset
+
+
+def _crossover_events(ma_matrix, short_cols, long_cols, start, end):
+    """Her çift için yukarı kesişim barlarını ve ardından gelen çıkış barını bul
+
+    Kesişimler bir çift için sırayla yukarı/aşağı gelir; pozisyon her zaman
+    bir sonraki aşağı kesişimde kapandığı için her yukarı kesişim bir
+    girişe denk gelir. Aşağı kesişim yoksa işlem end - 1'de açık kalır.
+    """
+    span = end - start
+    above = (ma_matrix[start:end, short_cols] > ma_matrix[start:end, long_cols]).T
+    if start > 0:
+        prev = ma_matrix[start - 1, short_cols] > ma_matrix[start - 1, long_cols]
+    else:
+        prev = np.zeros(len(short_cols), dtype=bool)
+    before = np.concatenate((prev[:, None], above[:, :-1]), axis=1)
+
+    up_pair, up_bar = np.nonzero(above & ~before)
+    dn_pair, dn_bar = np.nonzero(~above & before)
+
+    dn_keys = dn_pair * span + dn_bar
+    nxt = np.searchsorted(dn_keys, up_pair * span + up_bar, side='right')
+    found = nxt < len(dn_keys)
+    found[found] = dn_pair[nxt[found]] == up_pair[found]
+
+    exit_bar = np.full(len(up_bar), span - 1)
+    exit_bar[found] = dn_bar[nxt[found]]
+    return up_pair, up_bar + start, exit_bar + start, found
+
+
+def evaluate_grid(close, high, low, ma_matrix, short_cols, long_cols, stop_loss, take_profit,
+                  start=0, end=None, initial_capital=100000.0, periods_per_year=TRADING_DAYS,
+                  progress_callback=None, max_chunk_bars=4_000_000):
+    """Tüm kombinasyonları dizi işlemleriyle tek geçişte değerlendir
+
+    Kurallar: short MA long MA'yı yukarı keserse kapanıştan tüm sermaye ile
+    AL; aşağı keserse kapanıştan SAT. Pozisyondayken low stop seviyesine
+    inerse stop fiyatından, high hedefe çıkarsa take profit fiyatından çıkılır
+    (aynı barda ikisi de olursa stop önceliklidir). Portföy kapanışlarla
+    değerlenir; Sharpe/volatilite bar getirilerinden hesaplanır.
+
+    short_cols/long_cols her kombinasyon için ma_matrix kolon indeksidir.
+    start/end ile [start, end) aralığı değerlendirilir; ortalamalar tüm
+    geçmişten hesaplandığı için pencere ısınması gerekmez.
+    """
+    close = np.asarray(close, dtype=np.float64)
+    high = np.asarray(high, dtype=np.float64)
+    low = np.asarray(low, dtype=np.float64)
+    end = len(close) if end is None else end
+    stop_loss = np.asarray(stop_loss, dtype=np.float64)
+    take_profit = np.asarray(take_profit, dtype=np.float64)
+    n_combos = len(stop_loss)
+
+    pairs, pair_of_combo = np.unique(
+        np.stack((short_cols, long_cols), axis=1), axis=0, return_inverse=True
+    )
+    pair_of_combo = pair_of_combo.ravel()
+    sl_values, sl_code = np.unique(stop_loss, return_inverse=True)
+    tp_values, tp_code = np.unique(take_profit, return_inverse=True)
+
+    # Bar getirileri için önek toplamları
+    bar_ret = np.zeros(len(close))
+    bar_ret[1:] = close[1:] / close[:-1] - 1
+    ret_sum = np.cumsum(bar_ret)
+    ret_sq_sum = np.cumsum(bar_ret * bar_ret)
+    big = 4 * max(high[start:end].max(), close[start:end].max()) + 4
+
+    final_log = np.zeros(n_combos)
+    max_dd = np.zeros(n_combos)
+    sum_ret = np.zeros(n_combos)
+    sum_ret2 = np.zeros(n_combos)
+    buys = np.zeros(n_combos, dtype=np.int64)
+    sells = np.zeros(n_combos, dtype=np.int64)
+    wins = np.zeros(n_combos, dtype=np.int64)
+
+    chunk = max(1, max_chunk_bars // max(1, end - start))
+    for first in range(0, len(pairs), chunk):
+        chunk_pairs = np.arange(first, min(first + chunk, len(pairs)))
+        trade_pair, entry_bar, exit_bar, crossed = _crossover_events(
+            ma_matrix, pairs[chunk_pairs, 0], pairs[chunk_pairs, 1], start, end
+        )
+        trade_pair += first
+        n_trades = len(entry_bar)
+
+        # İşlem pencereleri [giriş, aşağı kesişim] ve segment içi istatistikler
+        window_len = exit_bar - entry_bar + 1
+        bars, offsets = _concat_ranges(entry_bar, window_len)
+        segments = np.repeat(np.arange(n_trades), window_len)
+        entry_mask = np.zeros(len(bars), dtype=bool)
+        entry_mask[offsets] = True
+
+        shift = segments * big
+        path = close[bars]
+        run_max = _segment_running(path, shift, 'max')
+        run_min = _segment_running(path, shift, 'min')
+        run_dd = _segment_running(path / run_max, segments * 2.0, 'min')
+        # Giriş barında stop/hedef tetiklenmez
+        low_min = _segment_running(np.where(entry_mask, big / 2, low[bars]), shift, 'min')
+        high_max = _segment_running(np.where(entry_mask, 0.0, high[bars]), shift, 'max')
+        stop_key = shift + (big / 2 - low_min)
+        tp_key = shift + high_max
+
+        # İlk dokunuş barları (işlem x SL) ve (işlem x TP) tabloları olarak aranır;
+        # sorgular sıralı olduğu için searchsorted önbellek dostudur
+        entry_px_t = close[entry_bar]
+        trade_shift = np.arange(n_trades)[:, None] * big
+        stop_table = np.searchsorted(
+            stop_key, (trade_shift + (big / 2 - entry_px_t[:, None] * (1 - sl_values))).ravel()
+        ).reshape(n_trades, len(sl_values))
+        tp_table = np.searchsorted(
+            tp_key, (trade_shift + entry_px_t[:, None] * (1 + tp_values)).ravel()
+        ).reshape(n_trades, len(tp_values))
+
+        # Her kombinasyon, çiftinin tüm işlemlerini zaman sırasıyla alır
+        combos = np.nonzero(np.isin(pair_of_combo, chunk_pairs))[0]
+        trades_per_pair = np.bincount(trade_pair - first, minlength=len(chunk_pairs))
+        pair_first_trade = np.cumsum(trades_per_pair) - trades_per_pair
+        local_pair = pair_of_combo[combos] - first
+        counts = trades_per_pair[local_pair]
+        trade, _ = _concat_ranges(pair_first_trade[local_pair], counts)
+        combo = np.repeat(combos, counts)
+
+        entry_px = entry_px_t[trade]
+        stop_px = entry_px * (1 - stop_loss[combo])
+        tp_px = entry_px * (1 + take_profit[combo])
+        window_end = offsets[trade] + window_len[trade]
+
+        stop_pos = stop_table[trade, sl_code[combo]]
+        tp_pos = tp_table[trade, tp_code[combo]]
+        hit_stop = stop_pos < window_end
+        hit_tp = tp_pos < window_end
+        by_stop = hit_stop & (~hit_tp | (stop_pos <= tp_pos))
+        by_tp = hit_tp & ~by_stop
+
+        exit_pos = window_end - 1
+        exit_pos = np.where(by_stop, stop_pos, np.where(by_tp, tp_pos, exit_pos))
+        exit_px = np.where(by_stop, stop_px, np.where(by_tp, tp_px, close[bars[exit_pos]]))
+        closed = by_stop | by_tp | crossed[trade]
+
+        # Getiri toplamları: (giriş, çıkış) arası piyasa getirisi + çıkış barı
+        entry_b = entry_bar[trade]
+        exit_b = bars[exit_pos]
+        has_bars = exit_b > entry_b
+        prev_b = np.maximum(exit_b - 1, entry_b)
+        last_ret = np.where(has_bars, exit_px / close[prev_b] - 1, 0.0)
+        trade_ret = ret_sum[prev_b] - ret_sum[entry_b] + last_ret
+        trade_ret2 = ret_sq_sum[prev_b] - ret_sq_sum[entry_b] + last_ret * last_ret
+
+        # Drawdown: işlem öncesi tepeye göre ve işlem içi tepeye göre düşüş
+        before_exit = np.maximum(exit_pos - 1, offsets[trade])
+        path_max = np.maximum(run_max[before_exit], exit_px)
+        path_min = np.minimum(run_min[before_exit], exit_px)
+        intra_dd = np.minimum(run_dd[before_exit], exit_px / run_max[before_exit])
+
+        log_ratio = np.log(exit_px / entry_px)
+        combo_start = np.cumsum(counts) - counts
+        csum = np.cumsum(log_ratio)
+        seg_base = np.repeat(csum[combo_start] - log_ratio[combo_start], counts)
+        capital = initial_capital * np.exp(csum - log_ratio - seg_base)
+        peak = capital * path_max / entry_px
+        prior_peak = pd.Series(peak).groupby(combo).cummax().groupby(combo).shift(
+            1, fill_value=initial_capital).to_numpy()
+        prior_peak = np.maximum(prior_peak, initial_capital)
+        trade_dd = np.minimum(capital * path_min / entry_px / prior_peak, intra_dd) - 1
+
+        final_log += np.bincount(combo, log_ratio, n_combos)
+        sum_ret += np.bincount(combo, trade_ret, n_combos)
+        sum_ret2 += np.bincount(combo, trade_ret2, n_combos)
+        buys += np.bincount(combo, minlength=n_combos)
+        sells += np.bincount(combo, closed, n_combos).astype(np.int64)
+        wins += np.bincount(combo, closed & (exit_px > entry_px), n_combos).astype(np.int64)
+        np.minimum.at(max_dd, combo, trade_dd)
+
+        if progress_callback:
+            progress_callback(chunk_pairs[-1] + 1, len(pairs))
+
+    bars_count = max(1, end - start)
+    mean = sum_ret / bars_count
+    std = np.sqrt(np.maximum(sum_ret2 / bars_count - mean * mean, 0.0))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        sharpe = np.where(std > 0, mean / std * np.sqrt(periods_per_year), 0.0)
+        win_rate = np.where(sells > 0, wins / sells * 100, 0.0)
+    final_value = initial_capital * np.exp(final_log)
+
+    return {
+        'total_return': (final_value / initial_capital - 1) * 100,
+        'buy_hold_return': np.full(n_combos, (close[end - 1] / close[start] - 1) * 100),
+        'max_drawdown': max_dd * 100,
+        'volatility': std * np.sqrt(periods_per_year) * 100,
+        'sharpe_ratio': sharpe,
+        'total_trades': buys + sells,
+        'buy_trades': buys,
+        'sell_trades': sells,
+        'win_rate': win_rate,
+        'final_value': final_value,
+    }
+
+
+class VectorizedOptimizer:
+    """MA crossover parametre grid'ini tek geçişte değerlendiren NumPy optimizer
+
+    FastOptimizer ile aynı arayüzü sunar; her kombinasyonu ayrı backtest
+    etmek yerine tüm short/long ortalamaları bir matris olarak bir kez
+    hesaplar ve tüm SL/TP kombinasyonlarını dizi işlemleriyle değerlendirir.
+    engine='numba' ile aynı grid derlenmiş döngü motorunda çalıştırılır.
+    result_cache (ResultCache) verilirse aynı veri üzerinde daha önce
+    değerlendirilmiş kombinasyonlar tekrar hesaplanmaz.
+    """
+
+    def __init__(self, backtester=None, initial_capital=100000, objective='sharpe_ratio', min_trades=2,
+                 engine='numpy', result_cache=None):
+        self.backtester = backtester
+        self.engine = engine
+        self.result_cache = result_cache
+        self.last_surface = None
+        self.initial_capital = getattr(backtester, 'initial_capital', initial_capital)
+        self.objective = objective
+        self.min_trades = min_trades
+        self.last_results = None
+
+    def run_grid(self, data, param_ranges, progress_callback=None):
+        """Tüm grid'i çalıştır ve metrik tablosunu döndür"""
+        grid = param_ranges if 'short_window' in param_ranges else build_param_grid(param_ranges)
+        if self.result_cache is None or len(grid['short_window']) == 0:
+            return self._evaluate_table(data, grid, progress_callback)
+
+        from backtesting.result_cache import data_fingerprint
+        return self.result_cache.cached_grid(
+            data_fingerprint(data), 'ma_crossover', {'initial_capital': self.initial_capital}, grid,
+            lambda missing: self._evaluate_table(data, missing, progress_callback)
+        )
+
+    def _evaluate_table(self, data, grid, progress_callback=None):
+        """Grid'i değerlendir ve parametre + metrik tablosunu döndür"""
+        close, high, low = price_arrays(data)
+        table = pd.DataFrame(grid)
+        if table.empty:
+            return table.reindex(columns=list(grid) + METRIC_COLUMNS + ['final_value'])
+
+        windows, inverse = np.unique(
+            np.concatenate((grid['short_window'], grid['long_window'])), return_inverse=True
+        )
+        n_combos = len(grid['short_window'])
+        ma_matrix = moving_average_matrix(close, windows)
+
+        if self.engine == 'numpy':
+            evaluate = evaluate_grid
+        else:
+            from backtesting.backend import get_grid_engine
+            evaluate = get_grid_engine(self.engine)
+
+        metrics = evaluate(
+            close, high, low, ma_matrix,
+            inverse[:n_combos], inverse[n_combos:],
+            grid['stop_loss'], grid['take_profit'],
+            initial_capital=self.initial_capital,
+            periods_per_year=infer_periods_per_year(data.index),
+            progress_callback=progress_callback,
+        )
+
+        for column in METRIC_COLUMNS + ['final_value']:
+            table[column] = metrics[column]
+        return table
+
+    def _record_results(self, table):
+        """Tüm sonuçları sakla: kompakt sonuç yüzeyi (top-K ve ısı haritaları buradan)"""
+        from backtesting.results_surface import ResultsSurface
+        self.last_results = table
+        self.last_surface = ResultsSurface.from_table(table, {'objective': self.objective})
+
+    def best_from_table(self, table):
+        """Metrik tablosundan en iyi parametreleri seç"""
+        candidates = table[table['sell_trades'] >= self.min_trades]
+        if candidates.empty:
+            candidates = table
+        if candidates.empty:
+            return None, None
+
+        best = candidates.loc[candidates[self.objective].idxmax()]
+        best_params = {
+            'short_window': int(best['short_window']),
+            'long_window': int(best['long_window']),
+            'stop_loss': float(best['stop_loss']),
+            'take_profit': float(best['take_profit']),
+        }
+        best_metrics = {
+            key: int(best[key]) if key.endswith('_trades') else float(best[key])
+            for key in METRIC_COLUMNS
+        }
+        return best_params, best_metrics
+
+    def optimize_ma_parameters(self, data, param_ranges, progress_callback=None):
+        """En iyi parametreleri ve metriklerini döndür
+
+        progress_callback(percent, message) verilirse ilerleme raporlanır.
+        """
+        start_time = time.time()
+
+        def report(done, total):
+            if progress_callback:
+                progress_callback(int(done * 100 / max(1, total)), f"{done}/{total} MA çifti değerlendirildi")
+
+        table = self.run_grid(data, param_ranges, progress_callback=report)
+        self._record_results(table)
+
+        print(f"⚡ {len(table):,} kombinasyon {time.time() - start_time:.2f} saniyede değerlendirildi")
+        return self.best_from_table(table)
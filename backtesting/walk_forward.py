@@ -0,0 +1,247 @@
+# backtesting/walk_forward.py
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+import numpy as np
+import pandas as pd
+
+from backtesting.vectorized_optimizer import (
+    METRIC_COLUMNS, VectorizedOptimizer, build_param_grid,
+    infer_periods_per_year, moving_average_matrix, price_arrays
+)
+from backtesting.parallel_optimizer import _attach_shared_memory, _evaluate_chunk
+from backtesting.numba_backtester import simulate_segment, equity_metrics
+
+
+def make_folds(n_bars, n_folds=5, train_bars=None, test_bars=None, anchored=False):
+    """Walk-forward fold sınırlarını üret
+
+    Varsayılan olarak seri n_folds + 2 eşit parçaya bölünür; her fold iki
+    parçalık in-sample ve bir parçalık out-of-sample penceresi kullanır.
+    anchored=True ise in-sample her zaman serinin başından başlar.
+    Dönüş: [(train_start, train_end, test_start, test_end), ...]
+    """
+    if test_bars is None:
+        segment = n_bars // (n_folds + 2) if train_bars is None else (n_bars - train_bars) // n_folds
+        test_bars = segment
+    if train_bars is None:
+        train_bars = 2 * test_bars
+    if train_bars <= 0 or test_bars <= 0:
+        raise ValueError(f"Walk-forward için yetersiz veri: {n_bars} bar, {n_folds} fold")
+
+    folds = []
+    test_start = train_bars
+    while test_start < n_bars and len(folds) < n_folds:
+        test_end = min(test_start + test_bars, n_bars)
+        if len(folds) == n_folds - 1:
+            test_end = n_bars
+        train_start = 0 if anchored else test_start - train_bars
+        folds.append((train_start, test_start, test_start, test_end))
+        test_start = test_end
+    return folds
+
+
+class WalkForwardOptimizer(VectorizedOptimizer):
+    """Kayan pencereli (walk-forward) MA crossover optimizasyonu
+
+    MA matrisi tüm geçmiş için bir kez hesaplanır; her fold'un in-sample
+    grid'i bu matrisin ilgili bar aralığında değerlendirilir, bu yüzden
+    fold'lar pencere başında ısınma kaybı yaşamaz ve toplam iş yaklaşık tek
+    bir tam grid taraması kadardır. Fold'lar worker process'lerde paralel
+    çalışır. Her fold'un en iyi parametreleri sonraki out-of-sample pencerede
+    işletilir ve bu pencereler tek bir özsermaye eğrisinde birleştirilir.
+    """
+
+    def __init__(self, backtester=None, initial_capital=100000, objective='sharpe_ratio', min_trades=2,
+                 engine='auto', n_folds=5, train_bars=None, test_bars=None, anchored=False, workers=None):
+        super().__init__(backtester, initial_capital, objective, min_trades, engine=engine)
+        self.n_folds = n_folds
+        self.train_bars = train_bars
+        self.test_bars = test_bars
+        self.anchored = anchored
+        self.workers = workers or os.cpu_count() or 1
+        self.last_walk_forward = None
+
+    def _in_sample_tables(self, grid, close, high, low, ma_matrix, short_cols, long_cols,
+                          folds, periods_per_year, progress_callback):
+        """Her fold'un in-sample grid tablosunu döndür"""
+        tables = [None] * len(folds)
+
+        def store(fold_id, metrics):
+            table = pd.DataFrame(grid)
+            for column in METRIC_COLUMNS + ['final_value']:
+                table[column] = metrics[column]
+            tables[fold_id] = table
+            if progress_callback:
+                done = sum(t is not None for t in tables)
+                progress_callback(done, len(folds))
+
+        if self.workers <= 1 or len(folds) <= 1:
+            from backtesting.backend import get_grid_engine
+            evaluate = get_grid_engine(self.engine)
+            for fold_id, (train_start, train_end, _, _) in enumerate(folds):
+                store(fold_id, evaluate(
+                    close, high, low, ma_matrix, short_cols, long_cols,
+                    grid['stop_loss'], grid['take_profit'],
+                    start=train_start, end=train_end,
+                    initial_capital=self.initial_capital, periods_per_year=periods_per_year
+                ))
+            return tables
+
+        n_bars, n_windows = ma_matrix.shape
+        shm = shared_memory.SharedMemory(create=True, size=(3 + n_windows) * n_bars * 8)
+        try:
+            prices = np.ndarray((3, n_bars), dtype=np.float64, buffer=shm.buf)
+            prices[:] = (close, high, low)
+            shared_ma = np.ndarray(ma_matrix.shape, dtype=np.float64, buffer=shm.buf, offset=prices.nbytes)
+            shared_ma[:] = ma_matrix
+
+            # Ebeveynde numba (TBB/OpenMP) iş parçacıkları çalışmış olabilir; fork
+            # edilen child bu kilitleri kopyalayıp çıkışta kilitlenebilir. Worker'lar
+            # spawn ile temiz başlar, veri zaten paylaşılan bellekten okunur.
+            with ProcessPoolExecutor(
+                max_workers=min(self.workers, len(folds)),
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_attach_shared_memory,
+                initargs=(shm.name, n_bars, n_windows),
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        _evaluate_chunk, fold_id, short_cols, long_cols,
+                        grid['stop_loss'], grid['take_profit'],
+                        self.initial_capital, periods_per_year, train_start, train_end
+                    )
+                    for fold_id, (train_start, train_end, _, _) in enumerate(folds)
+                ]
+                for future in as_completed(futures):
+                    store(*future.result())
+
+            del prices, shared_ma
+        finally:
+            shm.close()
+            shm.unlink()
+        return tables
+
+    def run_walk_forward(self, data, param_ranges, progress_callback=None):
+        """Walk-forward optimizasyonu çalıştır
+
+        progress_callback(done_folds, total_folds) her in-sample fold
+        tamamlandığında çağrılır. Dönüş sözlüğü:
+            folds:   fold başına tarih aralıkları, seçilen parametreler,
+                     in-sample skor ve out-of-sample metrikler
+            equity:  birleştirilmiş out-of-sample portföy değeri
+            metrics: birleştirilmiş out-of-sample performans metrikleri
+        """
+        grid = param_ranges if 'short_window' in param_ranges else build_param_grid(param_ranges)
+        close, high, low = price_arrays(data)
+        folds = make_folds(len(close), self.n_folds, self.train_bars, self.test_bars, self.anchored)
+
+        windows, inverse = np.unique(
+            np.concatenate((grid['short_window'], grid['long_window'])), return_inverse=True
+        )
+        n_combos = len(grid['short_window'])
+        short_cols, long_cols = inverse[:n_combos], inverse[n_combos:]
+        ma_matrix = moving_average_matrix(close, windows)
+        periods_per_year = infer_periods_per_year(data.index)
+
+        tables = self._in_sample_tables(grid, close, high, low, ma_matrix, short_cols, long_cols,
+                                        folds, periods_per_year, progress_callback)
+
+        capital = float(self.initial_capital)
+        equity_parts = []
+        fold_rows = []
+        total_buys = total_sells = total_wins = 0
+
+        for fold_id, (train_start, train_end, test_start, test_end) in enumerate(folds):
+            best_params, best_metrics = self.best_from_table(tables[fold_id])
+            row = {
+                'fold': fold_id + 1,
+                'train_start': data.index[train_start], 'train_end': data.index[train_end - 1],
+                'test_start': data.index[test_start], 'test_end': data.index[test_end - 1],
+            }
+            if best_params is None:
+                fold_rows.append(row)
+                continue
+
+            s = np.searchsorted(windows, best_params['short_window'])
+            l = np.searchsorted(windows, best_params['long_window'])
+            portfolio_value, signal, fill_price, _ = simulate_segment(
+                close, high, low, ma_matrix[:, s], ma_matrix[:, l],
+                best_params['stop_loss'], best_params['take_profit'],
+                initial_capital=capital, start=test_start, end=test_end
+            )
+
+            entries = fill_price[signal == 1]
+            exits = fill_price[signal == -1]
+            wins = int((exits > entries[:len(exits)]).sum())
+            total_return, max_drawdown, volatility, sharpe = equity_metrics(
+                portfolio_value, capital, periods_per_year
+            )
+
+            row.update(best_params)
+            row[f'is_{self.objective}'] = best_metrics[self.objective]
+            row.update({
+                'oos_return': total_return, 'oos_max_drawdown': max_drawdown,
+                'oos_sharpe_ratio': sharpe, 'oos_trades': len(entries) + len(exits),
+                'oos_win_rate': wins / len(exits) * 100 if len(exits) else 0.0,
+            })
+            fold_rows.append(row)
+
+            total_buys += len(entries)
+            total_sells += len(exits)
+            total_wins += wins
+            # Her fold pozisyonsuz başlar: fold sonunda açık kalan pozisyon son kapanıştan
+            # değerlenir, sonraki fold'a pozisyon değil sadece bu özsermaye devreder
+            equity_parts.append(pd.Series(portfolio_value, index=data.index[test_start:test_end]))
+            capital = float(portfolio_value[-1])
+
+        equity = pd.concat(equity_parts) if equity_parts else pd.Series(dtype=np.float64)
+        metrics = {}
+        if len(equity):
+            total_return, max_drawdown, volatility, sharpe = equity_metrics(
+                equity.to_numpy(), self.initial_capital, periods_per_year
+            )
+            first_bar = folds[0][2]
+            metrics = {
+                'total_return': total_return,
+                'buy_hold_return': (close[-1] / close[first_bar] - 1) * 100,
+                'max_drawdown': max_drawdown,
+                'volatility': volatility,
+                'sharpe_ratio': sharpe,
+                'total_trades': total_buys + total_sells,
+                'buy_trades': total_buys,
+                'sell_trades': total_sells,
+                'win_rate': total_wins / total_sells * 100 if total_sells else 0.0,
+            }
+
+        result = {'folds': pd.DataFrame(fold_rows), 'equity': equity, 'metrics': metrics}
+        self.last_walk_forward = result
+        return result
+
+    def optimize_ma_parameters(self, data, param_ranges, progress_callback=None):
+        """Son fold'un parametrelerini ve birleşik out-of-sample metrikleri döndür
+
+        progress_callback(percent, message) verilirse fold bazında ilerleme raporlanır.
+        """
+        start_time = time.time()
+
+        def report(done, total):
+            if progress_callback:
+                progress_callback(int(done * 100 / max(1, total)), f"{done}/{total} walk-forward fold tamamlandı")
+
+        result = self.run_walk_forward(data, param_ranges, progress_callback=report)
+        folds = result['folds']
+        print(f"⚡ {len(folds)} fold walk-forward {time.time() - start_time:.2f} saniyede tamamlandı")
+
+        if folds.empty or 'short_window' not in folds or folds['short_window'].isna().all():
+            return None, None
+        last = folds.dropna(subset=['short_window']).iloc[-1]
+        best_params = {
+            'short_window': int(last['short_window']),
+            'long_window': int(last['long_window']),
+            'stop_loss': float(last['stop_loss']),
+            'take_profit': float(last['take_profit']),
+        }
+        return best_params, result['metrics']
@@ -1,22 +1,23 @@
 # check_database.py
-from database.bist_data_loader import BISTDatabaseManager
+from database.backend import get_database_manager
 
 def check_database_status():
     """Database durumunu kontrol et"""
     print("📊 Database Durum Kontrolü")
     print("=" * 50)
     
-    db = BISTDatabaseManager()
+    db = get_database_manager()
     
-    # Özet istatistikler
-    summary = db.get_data_summary()
+    # Özet istatistikler (bar verisi okunmadan, katalog tablosundan)
+    catalog = db.get_data_catalog()
     
-    if summary:
+    if not catalog.empty:
         print(f"✅ Database dolu!")
         
         # Tüm sembolleri listele
-        symbols = db.get_available_symbols()
+        symbols = sorted(catalog['symbol'].unique())
         print(f"\n📈 Toplam Sembol: {len(symbols)}")
+        print(f"📦 Toplam Kayıt: {catalog['row_count'].sum():,}")
         
         # İlk 10 sembolü göster
         print("🔍 İlk 10 Sembol:")
@@ -27,18 +28,19 @@ def check_database_status():
             print(f"   ... ve {len(symbols) - 10} sembol daha")
         
         # Timeframe dağılımı
-        timeframes = db.get_available_timeframes()
+        timeframes = sorted(catalog['timeframe'].unique())
         print(f"\n⏰ Timeframe'ler: {timeframes}")
+        for tf, rows in catalog.groupby('timeframe')['row_count'].sum().items():
+            print(f"   {tf}: {rows:,} kayıt")
         
         # Örnek sembol detayları
         if symbols:
             sample_symbol = symbols[0]
             print(f"\n🧪 Örnek Sembol Detayı: {sample_symbol}")
             
-            for tf in timeframes:
-                data = db.get_symbol_data(sample_symbol, tf)
-                if data is not None:
-                    print(f"   {tf}: {len(data):,} kayıt | {data.index[0].date()} - {data.index[-1].date()}")
+            for row in catalog[catalog['symbol'] == sample_symbol].itertuples():
+                print(f"   {row.timeframe}: {row.row_count:,} kayıt | "
+                      f"{row.first_timestamp.date()} - {row.last_timestamp.date()}")
     
     else:
         print("❌ Database boş veya erişilemiyor!")
@@ -0,0 +1,23 @@
+# database/backend.py
+import os
+
+# Depolama arka ucu: 'postgres' (varsayılan) ya da 'parquet'
+STORAGE_ENV = 'BIST_STORAGE'
+
+
+def get_database_manager(backend=None, **kwargs):
+    """Veri yöneticisi örneği döndür
+
+    backend verilmezse BIST_STORAGE ortam değişkeni okunur. 'parquet'
+    database sunucusu gerektirmeyen ParquetDatabaseManager'ı, 'postgres'
+    FastBISTDatabaseManager'ı seçer.
+    """
+    backend = (backend or os.environ.get(STORAGE_ENV) or 'postgres').lower()
+    if backend == 'parquet':
+        from database.parquet_database_manager import ParquetDatabaseManager
+        return ParquetDatabaseManager(**kwargs)
+    if backend != 'postgres':
+        raise ValueError(f"Bilinmeyen depolama arka ucu: {backend}")
+
+    from database.fast_database_manager import FastBISTDatabaseManager
+    return FastBISTDatabaseManager(**kwargs)
@@ -0,0 +1,146 @@
+# database/bar_cache.py
+import json
+import os
+import re
+import numpy as np
+import pandas as pd
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'cache', 'bars')
+
+MAGIC = b'BARCACHE1\n'
+ALIGN = 64
+
+
+class BarCache:
+    """(sembol, timeframe) başına tek dosyalık kolonlu bar önbelleği
+
+    Dosya düzeni: MAGIC + 8 byte başlık uzunluğu + JSON başlık + kolonlar.
+    Her kolon (timestamp dahil) 64 byte hizalı, bitişik bir bloktur; okuma
+    tüm dosyayı bir kez memory-map eder ve kolonları kopyalamadan görünüm
+    olarak döndürür.
+    """
+
+    def __init__(self, cache_dir=None):
+        self.cache_dir = cache_dir or DEFAULT_CACHE_DIR
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def path(self, symbol, timeframe):
+        """Önbellek dosyasının yolu"""
+        key = re.sub(r'[^A-Za-z0-9_.-]', '_', f"{symbol}_{timeframe}")
+        return os.path.join(self.cache_dir, f"{key}.bars")
+
+    def _stale_marker(self, symbol, timeframe):
+        return self.path(symbol, timeframe) + '.stale'
+
+    def exists(self, symbol, timeframe):
+        """Geçerli bir önbellek dosyası var mı"""
+        return (os.path.exists(self.path(symbol, timeframe))
+                and not os.path.exists(self._stale_marker(symbol, timeframe)))
+
+    def write(self, symbol, timeframe, df):
+        """DataFrame'in sayısal kolonlarını ve zaman indeksini dosyaya yaz"""
+        index = pd.DatetimeIndex(df.index)
+        columns = [('__index__', index.values.astype('datetime64[ns]').view(np.int64))]
+        for name in df.columns:
+            if pd.api.types.is_numeric_dtype(df[name]):
+                columns.append((str(name), np.ascontiguousarray(df[name].to_numpy())))
+
+        layout = []
+        offset = 0
+        for name, values in columns:
+            layout.append([name, values.dtype.str, offset])
+            offset += -(-values.nbytes // ALIGN) * ALIGN
+
+        header = json.dumps({
+            'rows': len(df),
+            'columns': layout,
+            'index_name': df.index.name,
+            'tz': str(index.tz) if index.tz is not None else None,
+        }).encode('utf-8')
+        data_start = -(-(len(MAGIC) + 8 + len(header)) // ALIGN) * ALIGN
+
+        path = self.path(symbol, timeframe)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(MAGIC)
+                f.write(len(header).to_bytes(8, 'little'))
+                f.write(header)
+                for (name, values), (_, _, col_offset) in zip(columns, layout):
+                    f.seek(data_start + col_offset)
+                    f.write(values.tobytes())
+                f.truncate(data_start + offset)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            # Windows'ta map edilmiş dosyanın üzerine yazılamaz; önbelleği atla
+            print(f"⚠️ Önbellek yazılamadı ({symbol} {timeframe}): {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return False
+
+        marker = self._stale_marker(symbol, timeframe)
+        if os.path.exists(marker):
+            os.remove(marker)
+        return True
+
+    def read_arrays(self, symbol, timeframe):
+        """Kolonları memory-mapped, salt okunur dizi sözlüğü olarak döndür
+
+        'timestamp' anahtarı int64 nanosaniye zaman damgalarını içerir.
+        Önbellekte yoksa None döner.
+        """
+        if not self.exists(symbol, timeframe):
+            return None
+
+        raw = np.memmap(self.path(symbol, timeframe), dtype=np.uint8, mode='r')
+        if bytes(raw[:len(MAGIC)]) != MAGIC:
+            return None
+        header_len = int.from_bytes(bytes(raw[len(MAGIC):len(MAGIC) + 8]), 'little')
+        header_end = len(MAGIC) + 8 + header_len
+        header = json.loads(bytes(raw[len(MAGIC) + 8:header_end]).decode('utf-8'))
+        data_start = -(-header_end // ALIGN) * ALIGN
+
+        rows = header['rows']
+        arrays = {}
+        for name, dtype, offset in header['columns']:
+            dtype = np.dtype(dtype)
+            start = data_start + offset
+            column = raw[start:start + rows * dtype.itemsize].view(dtype)
+            arrays['timestamp' if name == '__index__' else name] = column
+
+        arrays['__meta__'] = header
+        return arrays
+
+    def read(self, symbol, timeframe):
+        """Önbellekten DataFrame oluştur (yoksa None)"""
+        arrays = self.read_arrays(symbol, timeframe)
+        if arrays is None:
+            return None
+
+        meta = arrays.pop('__meta__')
+        index = pd.DatetimeIndex(arrays.pop('timestamp').view('datetime64[ns]'), name=meta['index_name'])
+        if meta['tz']:
+            index = index.tz_localize('UTC').tz_convert(meta['tz'])
+        # copy=False: kolonlar memmap görünümü olarak kalır, veri kopyalanmaz
+        return pd.DataFrame(arrays, index=index, copy=False)
+
+    def invalidate(self, symbol, timeframe):
+        """(sembol, timeframe) önbelleğini geçersiz kıl"""
+        path = self.path(symbol, timeframe)
+        if not os.path.exists(path):
+            return
+        try:
+            os.remove(path)
+        except OSError:
+            # Dosya hâlâ map edilmiş (Windows); okuyucular işaret dosyasını görür
+            open(self._stale_marker(symbol, timeframe), 'w').close()
+
+    def clear(self):
+        """Tüm önbelleği temizle"""
+        for filename in os.listdir(self.cache_dir):
+            if filename.endswith('.bars'):
+                path = os.path.join(self.cache_dir, filename)
+                try:
+                    os.remove(path)
+                except OSError:
+                    open(path + '.stale', 'w').close()
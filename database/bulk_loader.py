@@ -0,0 +1,257 @@
+# database/bulk_loader.py
+import io
+import time
+import numpy as np
+import pandas as pd
+
+MARKET_DATA_TABLE = 'market_data'
+KEY_COLUMNS = ('symbol', 'timeframe', 'timestamp')
+VALUE_COLUMNS = ('open', 'high', 'low', 'close', 'volume')
+STAGING_TABLE = 'market_data_staging'
+
+# (symbol, timeframe, timestamp) tekil indeksinin kolonları (pg_attribute adları, sıralı)
+_KEY_INDEX_COLUMNS = sorted(KEY_COLUMNS)
+
+
+def ensure_key_index(engine, table=MARKET_DATA_TABLE):
+    """market_data üzerinde (symbol, timeframe, timestamp) bileşik indeksini kur
+
+    Şema kurulumunda / yükleme başında bir kez çağrılır; yükleyiciler ve
+    okuma yolu DDL çalıştırmaz. Önce ON CONFLICT upsert'inin kullandığı
+    tekil indeks denenir; tabloda mükerrer kayıt varsa tekil olmayan arama
+    indeksi kurulur. Dönüş: tekil indeks var mı.
+    """
+    connection = engine.raw_connection()
+    try:
+        with connection.cursor() as cursor:
+            try:
+                cursor.execute(f"CREATE UNIQUE INDEX IF NOT EXISTS ix_{table}_symbol_tf_ts "
+                               f"ON {table} (symbol, timeframe, timestamp)")
+                connection.commit()
+                return True
+            except Exception as e:
+                connection.rollback()
+                print(f"⚠️ Tekil indeks oluşturulamadı, arama indeksi kurulacak: {e}")
+                cursor.execute(f"CREATE INDEX IF NOT EXISTS ix_{table}_symbol_tf_ts_lookup "
+                               f"ON {table} (symbol, timeframe, timestamp)")
+                connection.commit()
+                return False
+    finally:
+        connection.close()
+
+
+def has_unique_key_index(cursor, table=MARKET_DATA_TABLE):
+    """Tabloda (symbol, timeframe, timestamp) üzerinde tekil indeks var mı (katalogdan okunur)"""
+    cursor.execute("""
+        SELECT 1 FROM pg_index i
+        JOIN pg_class t ON t.oid = i.indrelid
+        WHERE t.relname = %s AND i.indisunique
+          AND (SELECT array_agg(a.attname::text ORDER BY a.attname::text)
+               FROM pg_attribute a
+               WHERE a.attrelid = t.oid AND a.attnum = ANY(i.indkey)) = %s
+        LIMIT 1
+    """, (table, _KEY_INDEX_COLUMNS))
+    return cursor.fetchone() is not None
+
+
+def value_columns(columns=None):
+    """İstenen bar kolonlarını doğrula; None ise tüm OHLCV kolonları"""
+    if columns is None:
+        return list(VALUE_COLUMNS)
+    columns = [str(c).lower() for c in columns]
+    unknown = [c for c in columns if c not in VALUE_COLUMNS]
+    if unknown:
+        raise ValueError(f"Bilinmeyen kolon(lar): {unknown}")
+    return columns
+
+
+def widen_prices(df):
+    """float32 kolonları dosyadaki ondalık basamağa yuvarlayarak float64'e çevir
+
+    Hızlı CSV okuyucusu fiyatları float32 tutar; database'e float32
+    gürültüsü (12.350000381) yazılmaması için basamak sayısı
+    df.attrs['price_decimals'] ile geri kazanılır.
+    """
+    narrow = [c for c in df.columns if df[c].dtype == np.float32]
+    if not narrow:
+        return df
+    decimals = df.attrs.get('price_decimals')
+    df = df.copy()
+    for column in narrow:
+        values = df[column].to_numpy(dtype=np.float64)
+        df[column] = values.round(decimals) if decimals is not None else values
+    return df
+
+
+def normalize_ohlcv(df):
+    """Loader çıktısını market_data kolon düzenine getir
+
+    Kolon adları küçük harfe çevrilir, sadece OHLCV kolonları tutulur,
+    indeks DatetimeIndex olur ve tekrar eden zaman damgaları atılır.
+    """
+    data = widen_prices(df).rename(columns=lambda c: str(c).strip().lower())
+    data = data[[c for c in VALUE_COLUMNS if c in data.columns]]
+    data.index = pd.DatetimeIndex(data.index)
+    data = data[~data.index.duplicated(keep='last')]
+    return data.sort_index()
+
+
+def frame_to_copy_csv(df, symbol, timeframe):
+    """DataFrame'i COPY için CSV metnine çevir; (metin, satır sayısı) döner"""
+    data = normalize_ohlcv(df)
+    rows = pd.DataFrame({
+        'symbol': symbol,
+        'timeframe': timeframe,
+        'timestamp': data.index.strftime('%Y-%m-%d %H:%M:%S'),
+    })
+    for column in VALUE_COLUMNS:
+        rows[column] = data[column].to_numpy() if column in data.columns else None
+    return rows.to_csv(header=False, index=False), len(rows)
+
+
+class BulkMarketDataLoader:
+    """market_data tablosuna PostgreSQL COPY ile toplu yükleme
+
+    Satırlar bellekte CSV olarak biriktirilir; batch_rows'a ulaşınca geçici
+    staging tablosuna COPY ile aktarılır ve tek bir INSERT ... SELECT ile
+    (sembol, timeframe, timestamp) çakışmaları atlanarak market_data'ya
+    eklenir. Her batch tek transaction'dır. Tekil indeks bu sınıf
+    tarafından kurulmaz (bkz. ensure_key_index); yoksa ON CONFLICT yerine
+    NOT EXISTS kullanılır.
+
+    Kullanım:
+        with BulkMarketDataLoader(db.engine) as loader:
+            loader.add(df, 'AKBNK', '5m')
+    """
+
+    def __init__(self, engine, batch_rows=500_000, table=MARKET_DATA_TABLE):
+        self.engine = engine
+        self.batch_rows = batch_rows
+        self.table = table
+        self.connection = None
+        self.buffer = io.StringIO()
+        self.buffered_rows = 0
+        self.rows_copied = 0
+        self.rows_inserted = 0
+        self.copy_seconds = 0.0
+        self.started_at = None
+        self.touched_keys = set()
+        self._use_conflict_clause = True
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.flush()
+        self.close()
+        return False
+
+    def open(self):
+        """Ham DBAPI bağlantısını aç ve staging tablosunu hazırla"""
+        self.connection = self.engine.raw_connection()
+        self.started_at = time.time()
+        columns = ', '.join(KEY_COLUMNS + VALUE_COLUMNS)
+
+        with self.connection.cursor() as cursor:
+            cursor.execute(f"""
+                CREATE TEMP TABLE IF NOT EXISTS {STAGING_TABLE} (
+                    symbol VARCHAR(20), timeframe VARCHAR(10), timestamp TIMESTAMP,
+                    open DOUBLE PRECISION, high DOUBLE PRECISION, low DOUBLE PRECISION,
+                    close DOUBLE PRECISION, volume DOUBLE PRECISION
+                ) ON COMMIT DELETE ROWS
+            """)
+            # ON CONFLICT için (symbol, timeframe, timestamp) tekil indeksi gerekir
+            self._use_conflict_clause = has_unique_key_index(cursor, self.table)
+            self.connection.commit()
+
+        self._insert_sql = f"""
+            INSERT INTO {self.table} ({columns})
+            SELECT DISTINCT ON (symbol, timeframe, timestamp) {columns}
+            FROM {STAGING_TABLE} s
+        """
+        if self._use_conflict_clause:
+            self._insert_sql += " ON CONFLICT (symbol, timeframe, timestamp) DO NOTHING"
+        else:
+            self._insert_sql += f"""
+            WHERE NOT EXISTS (
+                SELECT 1 FROM {self.table} m
+                WHERE m.symbol = s.symbol AND m.timeframe = s.timeframe AND m.timestamp = s.timestamp
+            )
+            """
+
+    def add(self, df, symbol, timeframe):
+        """Bir DataFrame'i yükleme kuyruğuna ekle (gerekirse batch'i yaz)"""
+        if df is None or df.empty:
+            return 0
+
+        csv_text, row_count = frame_to_copy_csv(df, symbol, timeframe)
+        return self.add_csv(csv_text, row_count, symbol, timeframe)
+
+    def add_csv(self, csv_text, row_count, symbol, timeframe):
+        """frame_to_copy_csv ile hazırlanmış satırları kuyruğa ekle"""
+        self.buffer.write(csv_text)
+        self.buffered_rows += row_count
+        self.touched_keys.add((symbol, timeframe))
+
+        if self.buffered_rows >= self.batch_rows:
+            self.flush()
+        return row_count
+
+    def flush(self):
+        """Biriken satırları COPY ile staging'e aktar ve market_data'ya ekle"""
+        if self.buffered_rows == 0:
+            return 0
+
+        start_time = time.time()
+        self.buffer.seek(0)
+        copy_sql = (f"COPY {STAGING_TABLE} ({', '.join(KEY_COLUMNS + VALUE_COLUMNS)}) "
+                    f"FROM STDIN WITH (FORMAT csv)")
+
+        try:
+            with self.connection.cursor() as cursor:
+                if hasattr(cursor, 'copy_expert'):
+                    cursor.copy_expert(copy_sql, self.buffer)
+                else:
+                    # psycopg 3
+                    with cursor.copy(copy_sql) as copy:
+                        copy.write(self.buffer.getvalue())
+                cursor.execute(self._insert_sql)
+                inserted = cursor.rowcount
+            self.connection.commit()
+        except Exception:
+            self.connection.rollback()
+            raise
+
+        self.copy_seconds += time.time() - start_time
+        self.rows_copied += self.buffered_rows
+        self.rows_inserted += max(inserted, 0)
+        print(f"   📦 {self.buffered_rows:,} satır COPY edildi, {max(inserted, 0):,} yeni "
+              f"({self.buffered_rows / max(time.time() - start_time, 1e-6):,.0f} satır/sn)")
+
+        self.buffer = io.StringIO()
+        self.buffered_rows = 0
+        return inserted
+
+    def close(self):
+        """Bağlantıyı havuza geri ver"""
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+    @property
+    def rows_per_second(self):
+        """Başlangıçtan bu yana toplam satır/sn"""
+        if self.started_at is None:
+            return 0.0
+        return self.rows_copied / max(time.time() - self.started_at, 1e-6)
+
+    def summary(self):
+        """Yükleme istatistikleri"""
+        return {
+            'rows_copied': self.rows_copied,
+            'rows_inserted': self.rows_inserted,
+            'copy_seconds': self.copy_seconds,
+            'rows_per_second': self.rows_per_second,
+        }
@@ -0,0 +1,134 @@
+# database/connection_pool.py
+import os
+import threading
+from contextlib import contextmanager
+import numpy as np
+import pandas as pd
+from sqlalchemy import create_engine
+
+# Process başına havuz ayarları (ortam değişkeniyle değiştirilebilir)
+DEFAULT_POOL_SIZE = int(os.environ.get('BIST_DB_POOL_SIZE', 5))
+DEFAULT_MAX_OVERFLOW = int(os.environ.get('BIST_DB_MAX_OVERFLOW', 10))
+DEFAULT_POOL_RECYCLE = 1800
+
+# Sunucu taraflı cursor'dan tek seferde çekilecek satır sayısı
+STREAM_CHUNK_ROWS = 100_000
+
+_engines = {}
+_lock = threading.Lock()
+
+
+def _reset_after_fork():
+    """Fork sonrası child'da ebeveynin bağlantılarını kullanmadan havuzları bırak
+
+    dispose(close=False) ebeveynin soketlerini kapatmaz (ebeveyn onları
+    kullanmaya devam eder); child ilk sorguda kendi bağlantılarını açar.
+    """
+    global _lock
+    _lock = threading.Lock()
+    for engine in _engines.values():
+        engine.dispose(close=False)
+    _engines.clear()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def get_engine(url, pool_size=None, max_overflow=None, pool_pre_ping=True, pool_recycle=DEFAULT_POOL_RECYCLE):
+    """URL başına process içinde paylaşılan havuzlu engine
+
+    Aynı process'teki tüm yöneticiler aynı havuzu kullanır, böylece her
+    BISTDatabaseManager() yeni bağlantı el sıkışması yapmaz. pool_pre_ping
+    kopmuş bağlantıları kullanmadan önce eler. Fork edilen worker'lar
+    havuzu otomatik olarak yeniden kurar; spawn ile başlayan worker'lar
+    (Windows) zaten kendi havuzlarını açar.
+    """
+    pool_size = DEFAULT_POOL_SIZE if pool_size is None else pool_size
+    max_overflow = DEFAULT_MAX_OVERFLOW if max_overflow is None else max_overflow
+    key = (str(url), pool_size, max_overflow, pool_pre_ping, pool_recycle)
+    with _lock:
+        engine = _engines.get(key)
+        if engine is None:
+            engine = create_engine(
+                url, pool_size=pool_size, max_overflow=max_overflow,
+                pool_pre_ping=pool_pre_ping, pool_recycle=pool_recycle
+            )
+            _engines[key] = engine
+        return engine
+
+
+def dispose_engines():
+    """Bu process'teki tüm havuzları kapat"""
+    with _lock:
+        for engine in _engines.values():
+            engine.dispose()
+        _engines.clear()
+
+
+@contextmanager
+def read_only_connection(engine, chunk_rows=STREAM_CHUNK_ROWS):
+    """Salt okunur, sunucu taraflı cursor kullanan bağlantı
+
+    Sonuçlar istemci tarafında bir kerede tamponlanmak yerine chunk_rows'luk
+    parçalarla akıtılır; büyük bar sorgularında bellek sıçraması olmaz.
+    PostgreSQL'de işlem READ ONLY açılır, yanlışlıkla yazma reddedilir.
+    """
+    with engine.connect() as conn:
+        options = {'stream_results': True, 'max_row_buffer': chunk_rows}
+        if engine.dialect.name == 'postgresql':
+            options['postgresql_readonly'] = True
+        yield conn.execution_options(**options)
+
+
+def iter_frames(conn, query, params=None, index_col=None, parse_dates=None, chunk_rows=STREAM_CHUNK_ROWS):
+    """Sorgu sonucunu chunk_rows'luk DataFrame parçaları olarak akıt
+
+    Sonucu tek tabloda tutması gerekmeyen tüketiciler (dışa aktarım, parça
+    parça yazma) bellekte her an en fazla bir parça tutar.
+    """
+    yield from pd.read_sql(query, conn, params=params, index_col=index_col,
+                           parse_dates=parse_dates, chunksize=chunk_rows)
+
+
+def read_frame(conn, query, params=None, index_col=None, parse_dates=None, chunk_rows=STREAM_CHUNK_ROWS):
+    """Sorgu sonucunu parça parça okuyup tek DataFrame'de birleştir
+
+    Parçalar listede biriktirilip concat edilmez (tepe bellek sonucun iki
+    katına çıkar). Her kolon için bir parça boyunda dizi ayrılır, gelen parça
+    doğrudan bu dizilere yazılıp bırakılır; dolan dizi iki katına büyütülür ve
+    sonda fazlası kırpılır. Ön COUNT sorgusu yapılmaz: sunucu sorguyu iki kez
+    çalıştırıp sıralamak zorunda kalmaz.
+    """
+    columns = {}
+    rows = 0
+    first = None
+    for chunk in iter_frames(conn, query, params=params, parse_dates=parse_dates, chunk_rows=chunk_rows):
+        if first is None:
+            first = chunk.iloc[:0]
+        n = len(chunk)
+        for column in chunk.columns:
+            values = chunk[column].to_numpy()
+            target = columns.get(column)
+            if target is None:
+                target = np.empty(max(chunk_rows, n), dtype=values.dtype)
+            elif not np.can_cast(values.dtype, target.dtype, casting='safe'):
+                # Parçalar arasında tip değişebilir (ör. int -> NaN'lı float): ortak tipe yükselt
+                target = target.astype(np.result_type(target.dtype, values.dtype))
+            if rows + n > len(target):
+                target.resize(max(rows + n, 2 * len(target)), refcheck=False)
+            target[rows:rows + n] = values
+            columns[column] = target
+        rows += n
+        del chunk
+
+    if first is None:
+        return pd.DataFrame()
+    if rows == 0:
+        return first.set_index(index_col) if index_col else first
+    for target in columns.values():
+        if len(target) != rows:
+            target.resize(rows, refcheck=False)
+    # Tamamı NULL olan bir parça kolonu object yapar; read_sql gibi tip yeniden çıkarılır
+    frame = pd.DataFrame(columns, copy=False).infer_objects()
+    return frame.set_index(index_col) if index_col else frame
@@ -0,0 +1,122 @@
+# database/data_catalog.py
+from datetime import datetime
+import pandas as pd
+from sqlalchemy import Column, String, BigInteger, DateTime, bindparam, text
+
+from database.bist_data_loader import Base
+
+# Bu sayının üzerindeki anahtar güncellemelerinde tek GROUP BY ile tüm özet yenilenir
+FULL_REFRESH_THRESHOLD = 50
+
+REFRESH_SQL = """
+    INSERT INTO market_data_summary (symbol, timeframe, row_count, first_timestamp, last_timestamp, updated_at)
+    SELECT symbol, timeframe, COUNT(*), MIN(timestamp), MAX(timestamp), CURRENT_TIMESTAMP
+    FROM market_data
+    {where}
+    GROUP BY symbol, timeframe
+    ON CONFLICT (symbol, timeframe) DO UPDATE SET
+        row_count = EXCLUDED.row_count,
+        first_timestamp = EXCLUDED.first_timestamp,
+        last_timestamp = EXCLUDED.last_timestamp,
+        updated_at = EXCLUDED.updated_at
+"""
+
+
+class MarketDataSummary(Base):
+    """(sembol, timeframe) başına kayıt sayısı ve tarih aralığı özeti"""
+    __tablename__ = 'market_data_summary'
+
+    symbol = Column(String(20), primary_key=True)
+    timeframe = Column(String(10), primary_key=True)
+    row_count = Column(BigInteger, nullable=False)
+    first_timestamp = Column(DateTime)
+    last_timestamp = Column(DateTime)
+    updated_at = Column(DateTime, default=datetime.now)
+
+
+class DataCatalog:
+    """market_data için bar çekmeden özet bilgi veren katalog
+
+    Özet tablo yazma işlemlerinden sonra ilgili anahtarlar için yenilenir;
+    her anahtarın COUNT/MIN/MAX sorgusu (symbol, timeframe, timestamp)
+    indeksini kullanır. Katalog okumaları sadece bu küçük tabloya gider.
+    """
+
+    def __init__(self, engine):
+        self.engine = engine
+        Base.metadata.create_all(engine, tables=[MarketDataSummary.__table__])
+
+    def refresh(self, keys=None):
+        """Özet tabloyu yenile; keys verilmezse tümü yeniden hesaplanır"""
+        with self.engine.begin() as conn:
+            if keys is None or len(keys) > FULL_REFRESH_THRESHOLD:
+                conn.execute(text("DELETE FROM market_data_summary"))
+                conn.execute(text(REFRESH_SQL.format(where='')))
+                return
+
+            # Barları silinmiş anahtarın eski özet satırı kalmasın
+            delete = text("DELETE FROM market_data_summary WHERE symbol = :symbol AND timeframe = :timeframe")
+            statement = text(REFRESH_SQL.format(where='WHERE symbol = :symbol AND timeframe = :timeframe'))
+            for symbol, timeframe in keys:
+                conn.execute(delete, {'symbol': symbol, 'timeframe': timeframe})
+                conn.execute(statement, {'symbol': symbol, 'timeframe': timeframe})
+
+    def get_catalog(self, symbols=None, timeframe=None):
+        """Katalog tablosunu DataFrame olarak döndür
+
+        Kolonlar: symbol, timeframe, row_count, first_timestamp,
+        last_timestamp, updated_at. Özet tablo boşsa (yükseltilmiş database,
+        recreate_tables.py) filtreden bağımsız önce tümüyle doldurulur.
+        symbols verilirse market_data'da olup özette olmayan istenen
+        anahtarlar (özeti güncellemeyen yollarla yazılmış) de yenilenir.
+        """
+        catalog = self._read(symbols, timeframe)
+        with self.engine.connect() as conn:
+            if catalog.empty and not conn.execute(text("SELECT EXISTS (SELECT 1 FROM market_data_summary)")).scalar():
+                if not conn.execute(text("SELECT EXISTS (SELECT 1 FROM market_data)")).scalar():
+                    return catalog
+                missing = None
+            elif symbols is not None:
+                missing = self._missing_keys(conn, symbols, timeframe, catalog)
+                if not missing:
+                    return catalog
+            else:
+                return catalog
+
+        # missing None ise özet tümüyle, değilse sadece eksik anahtarlar için hesaplanır
+        self.refresh(missing)
+        return self._read(symbols, timeframe)
+
+    def _read(self, symbols, timeframe):
+        conditions = []
+        params = {}
+        if timeframe is not None:
+            conditions.append("timeframe = :timeframe")
+            params['timeframe'] = timeframe
+        if symbols is not None:
+            conditions.append("symbol IN :symbols")
+            params['symbols'] = list(symbols)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ''
+
+        query = text(f"SELECT * FROM market_data_summary {where} ORDER BY symbol, timeframe")
+        if symbols is not None:
+            query = query.bindparams(bindparam('symbols', expanding=True))
+        with self.engine.connect() as conn:
+            return pd.read_sql(query, conn, params=params)
+
+    def _missing_keys(self, conn, symbols, timeframe, catalog):
+        """İstenen sembollerin market_data'da olup özette olmayan (symbol, timeframe) anahtarları"""
+        symbols = list(symbols)
+        if not symbols:
+            return []
+        conditions = ["symbol IN :symbols"]
+        params = {'symbols': symbols}
+        if timeframe is not None:
+            conditions.append("timeframe = :timeframe")
+            params['timeframe'] = timeframe
+        query = text(
+            f"SELECT DISTINCT symbol, timeframe FROM market_data WHERE {' AND '.join(conditions)}"
+        ).bindparams(bindparam('symbols', expanding=True))
+        known = set(zip(catalog['symbol'], catalog['timeframe']))
+        return [(row.symbol, row.timeframe) for row in conn.execute(query, params)
+                if (row.symbol, row.timeframe) not in known]
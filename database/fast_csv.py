@@ -0,0 +1,225 @@
+# database/fast_csv.py
+import re
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Başlık adı (küçük harf, Türkçe karakterler sadeleştirilmiş) -> standart kolon
+COLUMN_ALIASES = {
+    'date': 'date', 'tarih': 'date', 'datetime': 'date', 'timestamp': 'date', 'zaman': 'date',
+    'time': 'time', 'saat': 'time',
+    'open': 'Open', 'acilis': 'Open', 'acilisfiyati': 'Open',
+    'high': 'High', 'yuksek': 'High', 'enyuksek': 'High',
+    'low': 'Low', 'dusuk': 'Low', 'endusuk': 'Low',
+    'close': 'Close', 'kapanis': 'Close', 'kapanisfiyati': 'Close', 'son': 'Close',
+    'volume': 'Volume', 'hacim': 'Volume', 'lot': 'Volume', 'vol': 'Volume',
+}
+
+# Başlıksız dosyalarda beklenen kolon sırası
+DEFAULT_LAYOUT = ['date', 'time', 'Open', 'High', 'Low', 'Close', 'Volume']
+
+# Denenecek tarih formatları; ilk satırla eşleşen ilk format tüm dosyada kullanılır
+DATE_FORMATS = [
+    '%d.%m.%Y %H:%M:%S', '%d.%m.%Y %H:%M', '%d.%m.%Y',
+    '%Y-%m-%d %H:%M:%S', '%Y-%m-%d %H:%M', '%Y-%m-%d',
+    '%Y.%m.%d %H:%M:%S', '%Y.%m.%d %H:%M', '%Y.%m.%d',
+    '%d/%m/%Y %H:%M:%S', '%d/%m/%Y %H:%M', '%d/%m/%Y',
+    '%Y%m%d %H:%M:%S', '%Y%m%d %H%M%S', '%Y%m%d',
+    '%Y-%m-%dT%H:%M:%S',
+]
+
+PRICE_COLUMNS = ['Open', 'High', 'Low', 'Close']
+
+# Fiyatlarda denenecek en fazla ondalık basamak
+MAX_PRICE_DECIMALS = 8
+
+_TRANSLATE = str.maketrans('çğıöşüÇĞİÖŞÜ', 'cgiosuCGIOSU')
+
+
+def _normalize_name(name):
+    return re.sub(r'[^a-z]', '', name.strip().strip('"').translate(_TRANSLATE).lower())
+
+
+def _detect_date_format(sample):
+    """Örnek tarih metni için format; epoch sayıları için 's' / 'ms'"""
+    sample = sample.strip().strip('"')
+    if sample.isdigit() and len(sample) in (10, 13):
+        return 's' if len(sample) == 10 else 'ms'
+    for fmt in DATE_FORMATS:
+        try:
+            pd.to_datetime(sample, format=fmt)
+            return fmt
+        except (ValueError, TypeError):
+            continue
+    return None
+
+
+def _parse_unique(values, fmt):
+    """Metin kolonunu tekil değerleri bir kez çözerek datetime dizisine çevir"""
+    codes, uniques = pd.factorize(values)
+    parsed = pd.to_datetime(pd.Index(uniques).str.strip(), format=fmt)
+    return parsed.take(codes)
+
+
+def price_decimals(values):
+    """Fiyat dizisini tam temsil eden en küçük ondalık basamak sayısı; yoksa None
+
+    Tüm kolona bakılır: ilk satırlar '12,3' olup sonradan '12,35' gelen
+    dosyalarda da basamak sayısı doğru bulunur.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    values = values[np.isfinite(values)]
+    if len(values) == 0:
+        return 0
+    tolerance = 1e-9 * np.maximum(1.0, np.abs(values))
+    for decimals in range(MAX_PRICE_DECIMALS + 1):
+        if np.all(np.abs(values - np.round(values, decimals)) <= tolerance):
+            return decimals
+    return None
+
+
+def _fits_float32(values, decimals):
+    """float32'ye daraltılan değerler decimals basamağa yuvarlanınca aynen geri gelir mi"""
+    if decimals is None or len(values) == 0:
+        return decimals is not None
+    # float32 göreli hassasiyeti ~6e-8: yarım basamak aralığının altında kalmalı
+    return np.nanmax(np.abs(values)) * 2.0 ** -23 < 0.5 * 10.0 ** -decimals
+
+
+def sniff_bist_csv(path, sample_lines=20):
+    """Dosya düzenini ilk satırlardan bir kez tespit et
+
+    Dönüş sözlüğü: encoding, sep, decimal, header (satır no ya da None),
+    columns (dosyadaki sıra ile standart adlar), date_format (ayrı saat
+    kolonu varsa 'gün saat' birleşik formatı). Fiyat hassasiyeti ve hacmin
+    tamsayı olup olmadığı örnekten değil, okuma sırasında tüm kolondan
+    çıkarılır. Düzen tanınamazsa None.
+    """
+    for encoding in ('utf-8-sig', 'cp1254'):
+        try:
+            with open(path, 'r', encoding=encoding) as f:
+                lines = [line.rstrip('\r\n') for _, line in zip(range(sample_lines), f)]
+            break
+        except UnicodeDecodeError:
+            continue
+    else:
+        return None
+    lines = [line for line in lines if line.strip()]
+    if not lines:
+        return None
+
+    first = lines[0]
+    sep = max((';', ',', '\t', '|'), key=first.count)
+    if first.count(sep) < 4:
+        return None
+
+    fields = first.split(sep)
+    names = [COLUMN_ALIASES.get(_normalize_name(name)) for name in fields]
+    if sum(name is not None for name in names) >= 5:
+        header = 0
+        columns = [name or f'_skip{i}' for i, name in enumerate(names)]
+        data_lines = lines[1:]
+    else:
+        header = None
+        columns = (DEFAULT_LAYOUT if len(fields) >= 7 else ['date'] + DEFAULT_LAYOUT[2:])[:len(fields)]
+        columns += [f'_skip{i}' for i in range(len(columns), len(fields))]
+        data_lines = lines
+    if not data_lines or 'date' not in columns or 'Close' not in columns:
+        return None
+
+    values = [line.split(sep) for line in data_lines]
+    row = values[0]
+    date_text = row[columns.index('date')].strip().strip('"')
+    if 'time' in columns:
+        time_text = row[columns.index('time')].strip().strip('"')
+        date_format = _detect_date_format(f"{date_text} {time_text}")
+        if date_format is None:
+            return None
+    else:
+        date_format = _detect_date_format(date_text)
+        if date_format is None:
+            return None
+
+    # Ondalık ayıracı: ';' ile ayrılmış dosyalarda fiyatlar '12,35' olabilir
+    price_fields = [r[columns.index('Close')] for r in values if len(r) == len(columns)]
+    decimal = ',' if sep != ',' and any(',' in v for v in price_fields) else '.'
+
+    return {
+        'encoding': encoding, 'sep': sep, 'decimal': decimal, 'header': header,
+        'columns': columns, 'date_format': date_format,
+    }
+
+
+def read_bist_csv(path, layout=None, compact=True, engine='auto'):
+    """BIST CSV dosyasını tespit edilen düzenle hızlı oku
+
+    Tarihler satır satır tahmin edilmeden tek bir açık format (ya da epoch
+    tamsayı dönüşümü) ile çözülür. Fiyatlar float64 okunur; compact=True ise
+    tüm kolonlardan bulunan ondalık basamak float32'de kayıpsız geri
+    kazanılabiliyorsa fiyatlar float32'ye, tüm değerleri tam sayı olan hacim
+    int64'e daraltılır. Basamak sayısı df.attrs['price_decimals'] içinde
+    saklanır (widen_prices bunu kullanır). engine='auto' pyarrow kuruluysa
+    ve ondalık ayıracı '.' ise pyarrow CSV motorunu kullanır.
+    Dönüş: DatetimeIndex'li Open/High/Low/Close/Volume DataFrame'i.
+    """
+    layout = layout or sniff_bist_csv(path)
+    if layout is None:
+        raise ValueError(f"CSV düzeni tanınamadı: {path}")
+
+    columns = layout['columns']
+    wanted = [c for c in columns if not c.startswith('_skip')]
+    dtype = {c: np.float64 for c in PRICE_COLUMNS if c in wanted}
+    dtype['date'] = np.int64 if layout['date_format'] in ('s', 'ms') else str
+    if 'time' in wanted:
+        dtype['time'] = str
+    if 'Volume' in wanted:
+        dtype['Volume'] = np.float64
+
+    if engine == 'auto':
+        engine = 'pyarrow' if PYARROW_AVAILABLE and layout['decimal'] == '.' else 'c'
+
+    options = dict(sep=layout['sep'], header=layout['header'], names=columns,
+                   dtype=dtype, encoding=layout['encoding'], engine=engine)
+    if engine != 'pyarrow':
+        # pyarrow motoru names ile birlikte verilen usecols'u çözemiyor;
+        # orada gereksiz kolonlar okunduktan sonra atılır
+        options['usecols'] = wanted
+        options['decimal'] = layout['decimal']
+    df = pd.read_csv(path, **options)
+    if len(wanted) < len(columns):
+        df = df[wanted]
+
+    date_format = layout['date_format']
+    if date_format in ('s', 'ms'):
+        index = pd.to_datetime(df['date'], unit=date_format)
+    elif 'time' in df.columns:
+        # Gün ve saat değerleri çok tekrar eder: sadece tekil değerler çözülür
+        day_format, _, clock_format = date_format.rpartition(' ')
+        index = (_parse_unique(df['date'], day_format)
+                 + (_parse_unique(df['time'], clock_format) - pd.Timestamp('1900-01-01')))
+    else:
+        index = pd.to_datetime(df['date'].str.strip(), format=date_format)
+
+    df = df.drop(columns=[c for c in ('date', 'time') if c in df.columns])
+    df.index = pd.DatetimeIndex(index, name='timestamp')
+    prices = [c for c in PRICE_COLUMNS if c in df.columns]
+    df = df.dropna(subset=prices)
+    if not df.index.is_monotonic_increasing:
+        df = df.sort_index(kind='stable')
+
+    price_values = df[prices].to_numpy(dtype=np.float64).ravel()
+    decimals = price_decimals(price_values)
+    if compact and _fits_float32(price_values, decimals):
+        df = df.astype({c: np.float32 for c in prices})
+    if compact and 'Volume' in df.columns:
+        volume = df['Volume'].to_numpy()
+        if np.all(volume == np.floor(volume)):
+            df['Volume'] = volume.astype(np.int64)
+    df.attrs['price_decimals'] = decimals
+    return df
+
@@ -0,0 +1,389 @@
+# database/fast_database_manager.py
+import time
+import numpy as np
+import pandas as pd
+from sqlalchemy import bindparam, text
+from database.bist_data_loader import BISTDatabaseManager
+from database.bar_cache import BarCache
+from database.bulk_loader import MARKET_DATA_TABLE, BulkMarketDataLoader, ensure_key_index, value_columns, widen_prices
+from database.parallel_ingest import ParallelIngestPipeline
+from database.ingest_manifest import IncrementalIngestor
+from database.data_catalog import DataCatalog
+from database.connection_pool import get_engine, read_frame, read_only_connection
+from database.fast_loader import FastBISTDataLoader
+from database.resampler import TIMEFRAME_MINUTES, bucket_range, can_resample, resample_ohlcv, timeframe_minutes
+
+
+def _naive_timestamp(value):
+    value = pd.Timestamp(value)
+    return value.tz_localize(None) if value.tz is not None else value
+
+
+def _slice_arrays(arrays, start, end, columns):
+    """Memory-mapped önbellek dizilerinden [start, end] dilimini DataFrame yap
+
+    Sadece dilimin istenen kolonları kopyalanır.
+    """
+    meta = arrays.pop('__meta__')
+    timestamps = arrays['timestamp']
+
+    def position(bound, side):
+        bound = pd.Timestamp(bound)
+        if meta['tz']:
+            # Önbellek UTC nanosaniye tutar; saf sınırlar verinin saat diliminde yorumlanır
+            bound = bound.tz_localize(meta['tz']) if bound.tz is None else bound
+            bound = bound.tz_convert('UTC')
+        return int(np.searchsorted(timestamps, _naive_timestamp(bound).as_unit('ns').value, side=side))
+
+    first = 0 if start is None else position(start, 'left')
+    last = len(timestamps) if end is None else position(end, 'right')
+    index = pd.DatetimeIndex(np.array(timestamps[first:last]).view('datetime64[ns]'), name=meta['index_name'])
+    if meta['tz']:
+        index = index.tz_localize('UTC').tz_convert(meta['tz'])
+    return pd.DataFrame({c: np.array(arrays[c][first:last]) for c in columns if c in arrays}, index=index)
+
+
+class FastBISTDatabaseManager(BISTDatabaseManager):
+    """Disk önbellekli BISTDatabaseManager
+
+    get_symbol_data ilk okumada market_data sorgusunu (sembol, timeframe)
+    başına bir kolonlu önbellek dosyasına yazar; sonraki okumalar SQL'e
+    gitmeden memory-map ile açılır. save_to_database yeni satır yazdığında
+    ilgili anahtarın önbelleği geçersiz kılınır. Engine process başına
+    paylaşılan havuzdan alınır; bar sorguları salt okunur, sunucu taraflı
+    cursor'la parça parça okunur.
+    """
+
+    def __init__(self, *args, cache_dir=None, use_cache=True, pool_size=None, max_overflow=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Aynı URL'deki tüm yöneticiler process başına tek havuzu paylaşır
+        base_engine = self.engine
+        self.engine = get_engine(base_engine.url, pool_size=pool_size, max_overflow=max_overflow)
+        if self.engine is not base_engine:
+            base_engine.dispose()
+            session_factory = getattr(self, 'Session', None)
+            if hasattr(session_factory, 'configure'):
+                session_factory.configure(bind=self.engine)
+        # CSV'ler tek seferlik düzen tespiti ve açık tarih formatıyla okunur
+        self.loader = FastBISTDataLoader()
+        self.bar_cache = BarCache(cache_dir) if use_cache else None
+        self._catalog = None
+
+    def read_session(self):
+        """Salt okunur, sunucu taraflı cursor'lu bağlantı (with bloğunda kullanılır)"""
+        return read_only_connection(self.engine)
+
+    @property
+    def catalog(self):
+        """market_data_summary tablosu üzerinden DataCatalog (ilk erişimde kurulur)"""
+        if self._catalog is None:
+            self._catalog = DataCatalog(self.engine)
+        return self._catalog
+
+    def _after_write(self, keys):
+        """Yazılan (sembol, timeframe) anahtarlarının önbelleğini ve katalog özetini güncelle"""
+        keys = list(keys)
+        if not keys:
+            return
+        if self.bar_cache is not None:
+            for symbol, timeframe in keys:
+                self.bar_cache.invalidate(symbol, timeframe)
+                # Bu barlardan türetilmiş daha büyük timeframe'ler de eskidi
+                for derived in TIMEFRAME_MINUTES:
+                    if can_resample(timeframe, derived):
+                        self.bar_cache.invalidate(symbol, derived)
+        try:
+            self.catalog.refresh(keys)
+        except Exception as e:
+            print(f"⚠️ Katalog özeti güncellenemedi: {e}")
+
+    def get_symbol_data(self, symbol, timeframe, start=None, end=None, columns=None):
+        """Sembol verisini önbellekten, yoksa database'den getir
+
+        Timeframe database'de yoksa sembolün kayıtlı en ince timeframe'inden
+        (ör. 5m) seans açılışına hizalı olarak türetilir ve önbelleğe yazılır.
+        start/end (dahil) ya da columns verilirse sadece o dilim döner:
+        önbellekteki dosya memory-map üzerinden kesilir. Önbellek boşsa önce
+        tam okumayla doldurulur, sonraki dilimler SQL'e gitmez; önbellek
+        kapalıysa aralık ve kolonlar SQL sorgusuna eklenir.
+        """
+        if start is not None or end is not None or columns is not None:
+            return self._get_symbol_slice(symbol, timeframe, start, end, value_columns(columns))
+
+        if self.bar_cache is not None:
+            data = self.bar_cache.read(symbol, timeframe)
+            if data is not None:
+                return data
+
+        data = self._query_range(symbol, timeframe, None, None, value_columns())
+        if data.empty:
+            source = self._resample_source(symbol, timeframe)
+            if source is not None:
+                data = resample_ohlcv(self.get_symbol_data(symbol, source), timeframe)
+
+        if self.bar_cache is not None and data is not None and not data.empty:
+            self.bar_cache.write(symbol, timeframe, data)
+        return data
+
+    def _get_symbol_slice(self, symbol, timeframe, start, end, columns):
+        """get_symbol_data'nın tarih aralığı / kolon alt kümesi yolu"""
+        if self.bar_cache is not None:
+            arrays = self.bar_cache.read_arrays(symbol, timeframe)
+            if arrays is None:
+                data = self.get_symbol_data(symbol, timeframe)
+                if data is None or data.empty:
+                    return data
+                arrays = self.bar_cache.read_arrays(symbol, timeframe)
+                if arrays is None:
+                    # Önbellek yazılamadı (ör. Windows'ta map edilmiş dosya); tam veriden kes
+                    return data.loc[start:end, [c for c in columns if c in data.columns]]
+            return _slice_arrays(arrays, start, end, columns)
+
+        data = self._query_range(symbol, timeframe, start, end, columns)
+        if data.empty:
+            source = self._resample_source(symbol, timeframe)
+            if source is not None:
+                # Aralığın ilk ve son barı yarım kalmasın diye kaynak kova sınırlarına genişletilir
+                source_start, source_end = bucket_range(start, end, timeframe)
+                data = resample_ohlcv(
+                    self._get_symbol_slice(symbol, source, source_start, source_end, columns), timeframe
+                )
+        return data
+
+    def _query_range(self, symbol, timeframe, start, end, columns):
+        """Aralık ve kolon filtresini SQL'e indirerek market_data'dan oku
+
+        (symbol, timeframe, timestamp) indeksi ingest sırasında kurulur
+        (ensure_key_index); okuma yolu DDL çalıştırmaz.
+        """
+        conditions = ["symbol = :symbol", "timeframe = :timeframe"]
+        params = {'symbol': symbol, 'timeframe': timeframe}
+        if start is not None:
+            conditions.append("timestamp >= :start")
+            params['start'] = _naive_timestamp(start).ceil('us').to_pydatetime()
+        if end is not None:
+            conditions.append("timestamp <= :end")
+            # DB-API mikro saniye taşır; dahil sınırlar içeri doğru yuvarlanır
+            params['end'] = _naive_timestamp(end).floor('us').to_pydatetime()
+        query = text(
+            f"SELECT timestamp, {', '.join(columns)} FROM {MARKET_DATA_TABLE} "
+            f"WHERE {' AND '.join(conditions)} ORDER BY timestamp"
+        )
+        with self.read_session() as conn:
+            data = read_frame(conn, query, params=params, index_col='timestamp', parse_dates=['timestamp'])
+        data.index = pd.DatetimeIndex(data.index, name='timestamp')
+        return data
+
+    def _stored_timeframes(self, symbol):
+        """Sembol için market_data'ya yüklenmiş timeframe'ler
+
+        Doğrudan taban tablodan, (symbol, timeframe, timestamp) indeksi
+        üzerinden okunur; özet tablo henüz doldurulmamış ya da eski olsa da
+        türetilecek timeframe'in kaynağı bulunur.
+        """
+        query = text(f"SELECT DISTINCT timeframe FROM {MARKET_DATA_TABLE} WHERE symbol = :symbol")
+        with self.engine.connect() as conn:
+            return [row.timeframe for row in conn.execute(query, {'symbol': symbol})]
+
+    def _resample_source(self, symbol, timeframe):
+        """timeframe'in türetileceği en ince kayıtlı timeframe; yoksa None"""
+        stored = self._stored_timeframes(symbol)
+        if timeframe in stored:
+            return None
+        candidates = [tf for tf in stored if can_resample(tf, timeframe)]
+        return min(candidates, key=timeframe_minutes) if candidates else None
+
+    def get_available_timeframes(self, symbol=None, include_derived=True):
+        """Kayıtlı timeframe'ler; include_derived ise türetilebilenler de eklenir"""
+        stored = super().get_available_timeframes(symbol) if symbol else super().get_available_timeframes()
+        if not include_derived:
+            return stored
+        available = set(stored)
+        for timeframe in TIMEFRAME_MINUTES:
+            if any(can_resample(source, timeframe) for source in stored):
+                available.add(timeframe)
+        return sorted(available, key=lambda tf: timeframe_minutes(tf) or 0)
+
+    def get_symbol_arrays(self, symbol, timeframe):
+        """Kolonları kopyasız memory-mapped diziler olarak getir
+
+        Önbellek boşsa önce database'den doldurulur. Veri yoksa None döner.
+        """
+        if self.bar_cache is None:
+            data = self.get_symbol_data(symbol, timeframe)
+            if data is None or data.empty:
+                return None
+            arrays = {name: data[name].to_numpy() for name in data.columns}
+            arrays['timestamp'] = data.index.values.astype('datetime64[ns]').view('int64')
+            return arrays
+
+        arrays = self.bar_cache.read_arrays(symbol, timeframe)
+        if arrays is None:
+            data = self.get_symbol_data(symbol, timeframe)
+            if data is None or data.empty:
+                return None
+            arrays = self.bar_cache.read_arrays(symbol, timeframe)
+        if arrays is not None:
+            arrays.pop('__meta__', None)
+        return arrays
+
+    def save_to_database(self, df, symbol, timeframe):
+        """Veriyi kaydet ve ilgili önbelleği geçersiz kıl"""
+        success = super().save_to_database(widen_prices(df), symbol, timeframe)
+        if success:
+            self._after_write([(symbol, timeframe)])
+        return success
+
+    def initialize_database(self, *args, **kwargs):
+        """Database'i doldur, tüm önbelleği temizle ve katalog özetini yenile"""
+        result = super().initialize_database(*args, **kwargs)
+        ensure_key_index(self.engine)
+        if self.bar_cache is not None:
+            self.bar_cache.clear()
+        self.catalog.refresh()
+        return result
+
+    def initialize_database_bulk(self, batch_rows=500_000):
+        """Tüm CSV'leri PostgreSQL COPY ile toplu yükle
+
+        initialize_database ile aynı (loaded_files, error_files) çıktısını
+        verir; dosya başına INSERT yerine büyük batch'ler halinde staging
+        tablosu üzerinden upsert yapar.
+        """
+        all_files = self.scan_directory_structure()
+        loaded_files = 0
+        error_files = 0
+        start_time = time.time()
+
+        print(f"📊 {len(all_files)} dosya COPY ile yüklenecek (batch: {batch_rows:,} satır)")
+        ensure_key_index(self.engine)
+
+        loader = BulkMarketDataLoader(self.engine, batch_rows=batch_rows)
+        try:
+            with loader:
+                for symbol, year, filename, full_path in all_files:
+                    symbol_from_file, timeframe, _ = self.loader.parse_bist_filename(filename)
+                    if not symbol_from_file or not timeframe:
+                        print(f"⚠️ Dosya adı parse edilemedi: {filename}")
+                        error_files += 1
+                        continue
+
+                    try:
+                        df = self.loader.load_bist_data(full_path)
+                    except Exception as e:
+                        print(f"❌ {filename} okunamadı: {e}")
+                        error_files += 1
+                        continue
+
+                    if df is None or df.empty:
+                        error_files += 1
+                        continue
+
+                    loader.add(df, symbol_from_file, timeframe)
+                    loaded_files += 1
+        finally:
+            self._after_write(loader.touched_keys)
+
+        duration = time.time() - start_time
+        stats = loader.summary()
+        print(f"✅ {stats['rows_copied']:,} satır okundu, {stats['rows_inserted']:,} yeni kayıt eklendi")
+        print(f"⚡ {duration:.2f} saniye | {stats['rows_copied'] / max(duration, 1e-6):,.0f} satır/sn "
+              f"(COPY: {stats['copy_seconds']:.2f} sn)")
+        return loaded_files, error_files
+
+    def initialize_database_parallel(self, parse_workers=None, writer_workers=2, queue_size=32,
+                                     batch_rows=200_000):
+        """CSV'leri process havuzunda parse edip paralel COPY writer'larıyla yükle
+
+        Dönüş initialize_database ile aynıdır: (loaded_files, error_files).
+        """
+        all_files = self.scan_directory_structure()
+        # Writer'lar indeksi kurmaya yarışmasın: şema bir kez burada hazırlanır
+        ensure_key_index(self.engine)
+        pipeline = ParallelIngestPipeline(
+            self.engine, parse_workers=parse_workers, writer_workers=writer_workers,
+            queue_size=queue_size, batch_rows=batch_rows
+        )
+        print(f"📊 {len(all_files)} dosya | {pipeline.parse_workers} parse worker, "
+              f"{writer_workers} writer, kuyruk: {queue_size}")
+
+        try:
+            loaded_files, error_files = pipeline.run(all_files)
+        finally:
+            self._after_write(pipeline.touched_keys)
+
+        for error in pipeline.errors[:10]:
+            print(f"   ⚠️ {error}")
+        if len(pipeline.errors) > 10:
+            print(f"   ... ve {len(pipeline.errors) - 10} hata daha")
+        return loaded_files, error_files
+
+    def initialize_database_incremental(self, batch_rows=500_000):
+        """Sadece yeni/değişmiş dosyaları ve son kayıttan sonraki barları yükle
+
+        Dönüş: (loaded_files, error_files, skipped_files)
+        """
+        all_files = self.scan_directory_structure()
+        ensure_key_index(self.engine)
+        ingestor = IncrementalIngestor(self.engine, self.loader, batch_rows=batch_rows)
+
+        try:
+            return ingestor.run(all_files)
+        finally:
+            self._after_write(ingestor.touched_keys)
+
+    def get_universe_data(self, symbols, timeframe, fields=('close', 'volume'), layout='wide'):
+        """Birden çok sembolün verisini tek sorgu / önbellek taramasıyla getir
+
+        symbols None ise tüm semboller alınır. layout='wide' ise kolonları
+        (alan, sembol) MultiIndex olan, ortak zaman indeksine hizalı bir panel
+        döner (ör. panel['close']); layout='long' ise symbol, timestamp ve
+        alan kolonlarından oluşan uzun tablo döner.
+        """
+        if symbols is None:
+            symbols = self.get_available_symbols()
+        fields = list(fields)
+        frames = []
+        missing = []
+
+        # Önbellekte olanlar SQL'e gitmeden okunur
+        for symbol in symbols:
+            arrays = None
+            if self.bar_cache is not None:
+                arrays = self.bar_cache.read_arrays(symbol, timeframe)
+            if arrays is None or any(f not in arrays for f in fields):
+                missing.append(symbol)
+                continue
+            part = {'symbol': symbol, 'timestamp': arrays['timestamp'].view('datetime64[ns]')}
+            part.update({f: arrays[f] for f in fields})
+            frames.append(pd.DataFrame(part))
+
+        if missing:
+            query = text(
+                f"SELECT symbol, timestamp, {', '.join(fields)} FROM market_data "
+                f"WHERE timeframe = :timeframe AND symbol IN :symbols ORDER BY symbol, timestamp"
+            ).bindparams(bindparam('symbols', expanding=True))
+            with self.read_session() as conn:
+                frames.append(read_frame(conn, query, params={'timeframe': timeframe, 'symbols': missing}))
+
+        if not frames:
+            long_data = pd.DataFrame(columns=['symbol', 'timestamp'] + fields)
+        else:
+            long_data = pd.concat(frames, ignore_index=True)
+        long_data['timestamp'] = pd.to_datetime(long_data['timestamp'])
+
+        if layout == 'long':
+            return long_data
+
+        long_data = long_data.drop_duplicates(['symbol', 'timestamp'], keep='last')
+        panel = long_data.set_index(['timestamp', 'symbol'])[fields].unstack('symbol')
+        return panel.sort_index()
+
+    def get_data_catalog(self, symbols=None, timeframe=None):
+        """(sembol, timeframe) başına kayıt sayısı ve ilk/son bar zamanı
+
+        Bar verisi okunmaz; sonuç market_data_summary tablosundan gelir.
+        Kolonlar: symbol, timeframe, row_count, first_timestamp,
+        last_timestamp, updated_at.
+        """
+        return self.catalog.get_catalog(symbols=symbols, timeframe=timeframe)
@@ -0,0 +1,22 @@
+# database/fast_loader.py
+from database.bist_data_loader import BISTDataLoader
+from database.fast_csv import read_bist_csv
+
+
+class FastBISTDataLoader(BISTDataLoader):
+    """load_bist_data'yı hızlı CSV yolu ile değiştiren BISTDataLoader
+
+    Düzen tanınamaz ya da hızlı okuma başarısız olursa orijinal
+    (satır bazlı tarih tahmini yapan) okuyucuya düşülür.
+    """
+
+    def __init__(self, *args, compact=True, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.compact = compact
+
+    def load_bist_data(self, full_path):
+        try:
+            return read_bist_csv(full_path, compact=self.compact)
+        except Exception as e:
+            print(f"⚠️ Hızlı CSV okuma başarısız, standart okuyucu kullanılıyor ({full_path}): {e}")
+            return super().load_bist_data(full_path)
@@ -0,0 +1,209 @@
+# database/ingest_manifest.py
+import hashlib
+import os
+import time
+from datetime import datetime
+import pandas as pd
+from sqlalchemy import Column, String, BigInteger, Float, Integer, DateTime, select, text
+from sqlalchemy.dialects.postgresql import insert
+
+from database.bist_data_loader import Base
+from database.bulk_loader import BulkMarketDataLoader, normalize_ohlcv
+
+# Watermark'ı olmayan anahtarları market_data'daki son bar zamanıyla ekle. Anahtarlar
+# (symbol, timeframe, timestamp) indeksinde gevşek indeks taramasıyla (anahtar başına
+# bir indeks araması) bulunur; tablo baştan sona taranmaz.
+SEED_WATERMARKS_SQL = """
+    WITH RECURSIVE keys AS (
+        (SELECT symbol, timeframe FROM market_data ORDER BY symbol, timeframe LIMIT 1)
+        UNION ALL
+        SELECT following.symbol, following.timeframe
+        FROM keys, LATERAL (
+            SELECT m.symbol, m.timeframe FROM market_data m
+            WHERE (m.symbol, m.timeframe) > (keys.symbol, keys.timeframe)
+            ORDER BY m.symbol, m.timeframe LIMIT 1
+        ) AS following
+    )
+    INSERT INTO ingest_watermark (symbol, timeframe, last_timestamp, updated_at)
+    SELECT k.symbol, k.timeframe,
+           (SELECT MAX(m.timestamp) FROM market_data m
+            WHERE m.symbol = k.symbol AND m.timeframe = k.timeframe),
+           NOW()
+    FROM keys k
+    WHERE NOT EXISTS (
+        SELECT 1 FROM ingest_watermark w WHERE w.symbol = k.symbol AND w.timeframe = k.timeframe
+    )
+    ON CONFLICT (symbol, timeframe) DO NOTHING
+"""
+
+
+class IngestManifest(Base):
+    """Yüklenmiş her CSV dosyasının kaydı"""
+    __tablename__ = 'ingest_manifest'
+
+    path = Column(String(500), primary_key=True)
+    size = Column(BigInteger, nullable=False)
+    mtime = Column(Float, nullable=False)
+    content_hash = Column(String(40), nullable=False)
+    symbol = Column(String(20))
+    timeframe = Column(String(10))
+    rows = Column(Integer)
+    ingested_at = Column(DateTime, default=datetime.now)
+
+
+class IngestWatermark(Base):
+    """(sembol, timeframe) başına database'deki son bar zamanı"""
+    __tablename__ = 'ingest_watermark'
+
+    symbol = Column(String(20), primary_key=True)
+    timeframe = Column(String(10), primary_key=True)
+    last_timestamp = Column(DateTime, nullable=False)
+    updated_at = Column(DateTime, default=datetime.now)
+
+
+def file_hash(path, chunk_size=1 << 20):
+    """Dosya içeriğinin SHA-1 özeti"""
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class IncrementalIngestor:
+    """Manifest tabanlı artımlı (delta) CSV yükleyici
+
+    Boyutu ve mtime'ı manifest ile aynı olan dosyalar hiç açılmaz. Değişmiş
+    görünen dosyaların içerik özeti karşılaştırılır; gerçekten değişen ya da
+    yeni dosyalardan sadece (sembol, timeframe) için kayıtlı son zamandan
+    sonraki barlar eklenir. Tüm barları bu zamandan önce olan dosyalar
+    (geriye dönük doldurma) tamamen yüklenir; mevcut barlar atlanır ve
+    watermark geri çekilmez.
+    """
+
+    def __init__(self, engine, loader, batch_rows=500_000):
+        self.engine = engine
+        self.loader = loader
+        self.batch_rows = batch_rows
+        self.touched_keys = set()
+        Base.metadata.create_all(engine, tables=[IngestManifest.__table__, IngestWatermark.__table__])
+
+    def _load_state(self):
+        """Manifest ve watermark tablolarını belleğe al
+
+        market_data'da olup watermark'ı olmayan her (sembol, timeframe)
+        (ilk artımlı çalıştırma ya da toplu / paralel yüklemeyle gelen yeni
+        anahtarlar) önce mevcut son bar zamanıyla watermark tablosuna eklenir.
+        """
+        with self.engine.begin() as conn:
+            conn.execute(text(SEED_WATERMARKS_SQL))
+        with self.engine.connect() as conn:
+            manifest = {
+                row.path: row for row in conn.execute(select(IngestManifest.__table__))
+            }
+            watermarks = {
+                (row.symbol, row.timeframe): pd.Timestamp(row.last_timestamp)
+                for row in conn.execute(select(IngestWatermark.__table__))
+            }
+        return manifest, watermarks
+
+    def _save_state(self, manifest_rows, watermarks):
+        """Manifest ve watermark değişikliklerini tek transaction'da yaz"""
+        with self.engine.begin() as conn:
+            if manifest_rows:
+                stmt = insert(IngestManifest.__table__).values(manifest_rows)
+                conn.execute(stmt.on_conflict_do_update(
+                    index_elements=['path'],
+                    set_={c: stmt.excluded[c] for c in
+                          ('size', 'mtime', 'content_hash', 'symbol', 'timeframe', 'rows', 'ingested_at')}
+                ))
+            if watermarks:
+                rows = [
+                    {'symbol': s, 'timeframe': tf, 'last_timestamp': ts.to_pydatetime(),
+                     'updated_at': datetime.now()}
+                    for (s, tf), ts in watermarks.items()
+                ]
+                stmt = insert(IngestWatermark.__table__).values(rows)
+                conn.execute(stmt.on_conflict_do_update(
+                    index_elements=['symbol', 'timeframe'],
+                    set_={'last_timestamp': stmt.excluded.last_timestamp,
+                          'updated_at': stmt.excluded.updated_at}
+                ))
+
+    def run(self, files):
+        """scan_directory_structure() çıktısını artımlı yükle
+
+        Dönüş: (loaded_files, error_files, skipped_files)
+        """
+        start_time = time.time()
+        manifest, watermarks = self._load_state()
+        new_watermarks = {}
+        manifest_rows = []
+        loaded_files = error_files = skipped_files = 0
+        now = datetime.now()
+
+        bulk = BulkMarketDataLoader(self.engine, batch_rows=self.batch_rows)
+        self.touched_keys = bulk.touched_keys
+        with bulk:
+            for symbol, year, filename, full_path in files:
+                path = os.path.normcase(os.path.abspath(full_path))
+                stat = os.stat(full_path)
+                known = manifest.get(path)
+
+                if known is not None and known.size == stat.st_size and known.mtime == stat.st_mtime:
+                    skipped_files += 1
+                    continue
+
+                content_hash = file_hash(full_path)
+                entry = {'path': path, 'size': stat.st_size, 'mtime': stat.st_mtime,
+                         'content_hash': content_hash, 'ingested_at': now}
+
+                if known is not None and known.content_hash == content_hash:
+                    # Sadece dokunulmuş, içerik aynı
+                    entry.update(symbol=known.symbol, timeframe=known.timeframe, rows=known.rows)
+                    manifest_rows.append(entry)
+                    skipped_files += 1
+                    continue
+
+                symbol_from_file, timeframe, _ = self.loader.parse_bist_filename(filename)
+                if not symbol_from_file or not timeframe:
+                    error_files += 1
+                    continue
+
+                try:
+                    df = self.loader.load_bist_data(full_path)
+                except Exception as e:
+                    print(f"❌ {filename} okunamadı: {e}")
+                    error_files += 1
+                    continue
+                if df is None or df.empty:
+                    error_files += 1
+                    continue
+
+                data = normalize_ohlcv(df)
+                key = (symbol_from_file, timeframe)
+                last = watermarks.get(key)
+                if last is not None:
+                    fresh = data[data.index > last]
+                    # Tamamı watermark'tan önceyse dosya geriye dönük doldurmadır (ör. eski
+                    # IMKBH_<SYM>/2019 klasörü): hepsi eklenir, var olan barlar çakışmada atlanır
+                    if not fresh.empty:
+                        data = fresh
+
+                if not data.empty:
+                    bulk.add(data, symbol_from_file, timeframe)
+                    latest = data.index[-1]
+                    if (last is None or latest > last) and (key not in new_watermarks or latest > new_watermarks[key]):
+                        new_watermarks[key] = latest
+                    print(f"📥 {filename}: {len(data):,} yeni bar")
+
+                entry.update(symbol=symbol_from_file, timeframe=timeframe, rows=len(data))
+                manifest_rows.append(entry)
+                loaded_files += 1
+
+        # Veri commit edildikten sonra manifest güncellenir; yarıda kalırsa tekrar denenir
+        self._save_state(manifest_rows, new_watermarks)
+
+        print(f"✅ Artımlı yükleme: {loaded_files} dosya işlendi, {skipped_files} değişmemiş dosya atlandı, "
+              f"{bulk.rows_copied:,} yeni bar ({time.time() - start_time:.2f} sn)")
+        return loaded_files, error_files, skipped_files
@@ -0,0 +1,172 @@
+# database/parallel_ingest.py
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+from database.fast_loader import FastBISTDataLoader
+from database.bulk_loader import BulkMarketDataLoader, frame_to_copy_csv
+
+# Parse worker process'inin kendi loader'ı
+_worker_loader = None
+
+
+def _init_parse_worker():
+    """Parse worker başlangıcı: process başına bir (hızlı CSV yollu) loader"""
+    global _worker_loader
+    _worker_loader = FastBISTDataLoader()
+
+
+def _parse_file(filename, full_path):
+    """CSV dosyasını oku ve COPY'ye hazır CSV metnine çevir
+
+    Dönüş: (symbol, timeframe, csv_text, row_count, error)
+    """
+    try:
+        symbol, timeframe, _ = _worker_loader.parse_bist_filename(filename)
+        if not symbol or not timeframe:
+            return None, None, None, 0, f"Dosya adı parse edilemedi: {filename}"
+
+        df = _worker_loader.load_bist_data(full_path)
+        if df is None or df.empty:
+            return symbol, timeframe, None, 0, f"Boş veri: {filename}"
+
+        csv_text, row_count = frame_to_copy_csv(df, symbol, timeframe)
+        return symbol, timeframe, csv_text, row_count, None
+    except Exception as e:
+        return None, None, None, 0, f"{filename}: {e}"
+
+
+class StageCounter:
+    """Bir pipeline aşaması için thread-safe iş/satır/süre sayacı"""
+
+    def __init__(self, name):
+        self.name = name
+        self.files = 0
+        self.rows = 0
+        self.busy_seconds = 0.0
+        self.lock = threading.Lock()
+
+    def add(self, files, rows, seconds):
+        with self.lock:
+            self.files += files
+            self.rows += rows
+            self.busy_seconds += seconds
+
+    def report(self, elapsed):
+        return (f"{self.name}: {self.files:,} dosya, {self.rows:,} satır, "
+                f"{self.rows / max(elapsed, 1e-6):,.0f} satır/sn")
+
+
+class ParallelIngestPipeline:
+    """Process havuzunda parse, thread'lerde COPY yazma yapan ingest pipeline'ı
+
+    Parse worker'ları CSV'leri okuyup COPY metnine çevirir; sonuçlar sınırlı
+    bir kuyruk üzerinden writer thread'lerine akar. Her writer kendi havuz
+    bağlantısı ve BulkMarketDataLoader'ı ile yazar. Kuyruk dolduğunda yeni
+    parse işi gönderilmez (back-pressure).
+    """
+
+    def __init__(self, engine, parse_workers=None, writer_workers=2, queue_size=32,
+                 batch_rows=200_000, report_every=5.0):
+        self.engine = engine
+        self.parse_workers = parse_workers or max(1, (os.cpu_count() or 2) - writer_workers)
+        self.writer_workers = writer_workers
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.batch_rows = batch_rows
+        self.report_every = report_every
+        self.parse_counter = StageCounter("📥 Parse")
+        self.write_counter = StageCounter("📦 Yazma")
+        self.touched_keys = set()
+        self.errors = []
+        self._writer_errors = []
+
+    def _writer(self):
+        """Kuyruktan oku ve kendi bağlantısıyla COPY et"""
+        loader = BulkMarketDataLoader(self.engine, batch_rows=self.batch_rows)
+        try:
+            with loader:
+                while True:
+                    item = self.queue.get()
+                    if item is None:
+                        break
+                    symbol, timeframe, csv_text, row_count = item
+                    start_time = time.time()
+                    loader.add_csv(csv_text, row_count, symbol, timeframe)
+                    self.write_counter.add(1, row_count, time.time() - start_time)
+        except Exception as e:
+            self._writer_errors.append(e)
+            # Üreticinin bloklanmaması için kuyruğu boşalt
+            while True:
+                try:
+                    if self.queue.get_nowait() is None:
+                        break
+                except queue.Empty:
+                    time.sleep(0.05)
+        finally:
+            self.touched_keys.update(loader.touched_keys)
+
+    def run(self, files):
+        """scan_directory_structure() çıktısını yükle; (loaded, errors) döner"""
+        start_time = time.time()
+        last_report = start_time
+        loaded_files = 0
+
+        writers = [threading.Thread(target=self._writer, daemon=True) for _ in range(self.writer_workers)]
+        for writer in writers:
+            writer.start()
+
+        max_in_flight = self.parse_workers * 2
+        pending = set()
+        file_iter = iter(files)
+
+        try:
+            with ProcessPoolExecutor(max_workers=self.parse_workers, initializer=_init_parse_worker) as executor:
+                exhausted = False
+                while pending or not exhausted:
+                    while not exhausted and len(pending) < max_in_flight:
+                        try:
+                            symbol, year, filename, full_path = next(file_iter)
+                        except StopIteration:
+                            exhausted = True
+                            break
+                        future = executor.submit(_parse_file, filename, full_path)
+                        future.submitted_at = time.time()
+                        pending.add(future)
+
+                    if not pending:
+                        break
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+                    for future in done:
+                        symbol, timeframe, csv_text, row_count, error = future.result()
+                        self.parse_counter.add(1, row_count, time.time() - future.submitted_at)
+                        if error:
+                            self.errors.append(error)
+                            continue
+                        if self._writer_errors:
+                            raise self._writer_errors[0]
+                        # Kuyruk doluysa burada bekler (back-pressure)
+                        self.queue.put((symbol, timeframe, csv_text, row_count))
+                        loaded_files += 1
+
+                    now = time.time()
+                    if now - last_report >= self.report_every:
+                        elapsed = now - start_time
+                        print(f"   {self.parse_counter.report(elapsed)} | "
+                              f"{self.write_counter.report(elapsed)} | kuyruk: {self.queue.qsize()}")
+                        last_report = now
+        finally:
+            for _ in writers:
+                self.queue.put(None)
+            for writer in writers:
+                writer.join()
+
+        if self._writer_errors:
+            raise self._writer_errors[0]
+
+        elapsed = time.time() - start_time
+        print(f"   {self.parse_counter.report(elapsed)}")
+        print(f"   {self.write_counter.report(elapsed)}")
+        return loaded_files, len(self.errors)
@@ -0,0 +1,155 @@
+# database/parquet_database_manager.py
+import os
+import time
+
+from database.parquet_store import ParquetMarketStore
+from database.resampler import TIMEFRAME_MINUTES, bucket_range, can_resample, resample_ohlcv, timeframe_minutes
+
+DEFAULT_CSV_DIR = r"C:\iDealPython\data"
+
+
+class ParquetDatabaseManager:
+    """Database sunucusu olmadan Parquet deposundan çalışan yönetici
+
+    FastBISTDatabaseManager ile aynı okuma/yazma arayüzünü (get_symbol_data,
+    get_available_symbols, get_available_timeframes, get_data_catalog,
+    get_universe_data, save_to_database, initialize_database) sunar; barlar
+    ParquetMarketStore'da symbol/timeframe/year bölümleriyle tutulur.
+    Depo, ParquetMarketStore.export_from_database ile mevcut market_data
+    tablosundan ya da initialize_database ile doğrudan CSV arşivinden
+    doldurulur.
+    """
+
+    def __init__(self, dataset_dir=None, base_path=None):
+        self.store = ParquetMarketStore(dataset_dir)
+        self.base_path = base_path or DEFAULT_CSV_DIR
+        self._loader = None
+
+    @property
+    def loader(self):
+        """CSV okuyucu; sadece CSV yüklerken kurulur
+
+        BISTDataLoader database modülünde yaşar: sunucusuz okuma düğümleri
+        SQLAlchemy / PostgreSQL yığınını hiç import etmez.
+        """
+        if self._loader is None:
+            from database.fast_loader import FastBISTDataLoader
+            self._loader = FastBISTDataLoader()
+        return self._loader
+
+    def get_symbol_data(self, symbol, timeframe, start=None, end=None, columns=None):
+        """Sembol verisini depodan getir
+
+        Timeframe depoda yoksa sembolün kayıtlı en ince timeframe'inden
+        seans açılışına hizalı olarak türetilir. start/end (dahil) ve columns
+        doğrudan Parquet taramasına indirilir.
+        """
+        data = self.store.read(symbol, timeframe, start=start, end=end, columns=columns)
+        if data.empty:
+            source = self._resample_source(symbol, timeframe)
+            if source is not None:
+                source_start, source_end = bucket_range(start, end, timeframe)
+                data = resample_ohlcv(
+                    self.store.read(symbol, source, start=source_start, end=source_end, columns=columns), timeframe
+                )
+        return data
+
+    def _resample_source(self, symbol, timeframe):
+        """timeframe'in türetileceği en ince kayıtlı timeframe; yoksa None"""
+        stored = self.store.timeframes(symbol)
+        if timeframe in stored:
+            return None
+        candidates = [tf for tf in stored if can_resample(tf, timeframe)]
+        return min(candidates, key=timeframe_minutes) if candidates else None
+
+    def get_available_symbols(self):
+        return self.store.symbols()
+
+    def get_available_timeframes(self, symbol=None, include_derived=True):
+        """Kayıtlı timeframe'ler; include_derived ise türetilebilenler de eklenir"""
+        stored = self.store.timeframes(symbol)
+        if not include_derived:
+            return stored
+        available = set(stored)
+        for timeframe in TIMEFRAME_MINUTES:
+            if any(can_resample(source, timeframe) for source in stored):
+                available.add(timeframe)
+        return sorted(available, key=lambda tf: timeframe_minutes(tf) or 0)
+
+    def get_data_catalog(self, symbols=None, timeframe=None):
+        """(sembol, timeframe) başına kayıt sayısı ve ilk/son bar zamanı (Parquet metadata'sından)"""
+        return self.store.summary(symbols=symbols, timeframe=timeframe)
+
+    def get_universe_data(self, symbols, timeframe, fields=('close', 'volume'), layout='wide'):
+        """Birden çok sembolün verisini tek dataset taramasıyla getir
+
+        Dönüş FastBISTDatabaseManager.get_universe_data ile aynıdır.
+        """
+        fields = list(fields)
+        long_data = self.store.scan(timeframe, symbols=symbols, columns=fields)
+        if layout == 'long':
+            return long_data
+        panel = long_data.set_index(['timestamp', 'symbol'])[fields].unstack('symbol')
+        return panel.sort_index()
+
+    def save_to_database(self, df, symbol, timeframe):
+        """Veriyi depoya yaz; başarılıysa True"""
+        try:
+            self.store.write(df, symbol, timeframe)
+            return True
+        except Exception as e:
+            print(f"❌ {symbol} ({timeframe}) Parquet'e yazılamadı: {e}")
+            return False
+
+    def scan_directory_structure(self):
+        """base_path altındaki IMKBH_<SEMBOL>/<YIL>/*.csv dosyaları
+
+        Dönüş: (sembol, yıl, dosya adı, tam yol) listesi.
+        """
+        all_files = []
+        if not os.path.isdir(self.base_path):
+            print(f"❌ Klasör bulunamadı: {self.base_path}")
+            return all_files
+        for folder in sorted(os.listdir(self.base_path)):
+            folder_path = os.path.join(self.base_path, folder)
+            if not folder.startswith('IMKBH_') or not os.path.isdir(folder_path):
+                continue
+            symbol = folder.replace('IMKBH_', '')
+            for year in sorted(os.listdir(folder_path)):
+                year_path = os.path.join(folder_path, year)
+                if not year.isdigit() or not os.path.isdir(year_path):
+                    continue
+                for filename in sorted(os.listdir(year_path)):
+                    if filename.endswith('.csv'):
+                        all_files.append((symbol, year, filename, os.path.join(year_path, filename)))
+        return all_files
+
+    def initialize_database(self):
+        """CSV arşivini doğrudan Parquet deposuna yükle; (loaded_files, error_files) döner"""
+        all_files = self.scan_directory_structure()
+        loaded_files = 0
+        error_files = 0
+        rows = 0
+        start_time = time.time()
+
+        print(f"📊 {len(all_files)} dosya Parquet deposuna yüklenecek: {self.store.root}")
+        for symbol, year, filename, full_path in all_files:
+            symbol_from_file, timeframe, _ = self.loader.parse_bist_filename(filename)
+            if not symbol_from_file or not timeframe:
+                print(f"⚠️ Dosya adı parse edilemedi: {filename}")
+                error_files += 1
+                continue
+            try:
+                df = self.loader.load_bist_data(full_path)
+                if df is None or df.empty:
+                    error_files += 1
+                    continue
+                rows += self.store.write(df, symbol_from_file, timeframe)
+                loaded_files += 1
+            except Exception as e:
+                print(f"❌ {filename} yüklenemedi: {e}")
+                error_files += 1
+
+        duration = time.time() - start_time
+        print(f"✅ {rows:,} yeni kayıt | {duration:.2f} saniye")
+        return loaded_files, error_files
@@ -0,0 +1,275 @@
+# database/parquet_store.py
+import os
+import re
+import numpy as np
+import pandas as pd
+
+from database.bulk_loader import MARKET_DATA_TABLE, VALUE_COLUMNS, normalize_ohlcv, value_columns
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+DEFAULT_DATASET_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'market_data')
+
+PART_FILE = 'part-0.parquet'
+
+
+def _require_pyarrow():
+    if not PARQUET_AVAILABLE:
+        raise ImportError("Parquet deposu için pyarrow gerekli: pip install pyarrow")
+
+
+def _bar_schema():
+    return pa.schema([('timestamp', pa.timestamp('ns'))] + [(c, pa.float64()) for c in VALUE_COLUMNS])
+
+
+def _partition_value(name, text_value):
+    """'symbol=AKBNK' -> 'AKBNK'; eşleşmezse None"""
+    prefix = f"{name}="
+    return text_value[len(prefix):] if text_value.startswith(prefix) else None
+
+
+class ParquetMarketStore:
+    """market_data tablosunun Hive bölümlü Parquet kopyası
+
+    Düzen: root/symbol=<SEMBOL>/timeframe=<TF>/year=<YIL>/part-0.parquet;
+    CSV arşivindeki IMKBH_<SEMBOL>/<YIL> yapısıyla aynı bölümlemedir. Okuma
+    pyarrow.dataset ile yapılır: tarih aralığı önce yıl klasörlerini eler,
+    sonra satır grubu istatistikleriyle timestamp filtresi uygulanır; sadece
+    istenen kolonlar diskten okunur.
+    """
+
+    def __init__(self, root=None, row_group_size=100_000, compression='zstd'):
+        _require_pyarrow()
+        self.root = root or DEFAULT_DATASET_DIR
+        self.row_group_size = row_group_size
+        self.compression = compression
+        os.makedirs(self.root, exist_ok=True)
+
+    def _symbol_dir(self, symbol):
+        symbol = re.sub(r'[^A-Za-z0-9_.-]', '_', str(symbol))
+        return os.path.join(self.root, f"symbol={symbol}")
+
+    def _key_dir(self, symbol, timeframe):
+        return os.path.join(self._symbol_dir(symbol), f"timeframe={timeframe}")
+
+    def _year_path(self, symbol, timeframe, year):
+        return os.path.join(self._key_dir(symbol, timeframe), f"year={year}", PART_FILE)
+
+    def years(self, symbol, timeframe):
+        """(sembol, timeframe) için kayıtlı yıllar"""
+        key_dir = self._key_dir(symbol, timeframe)
+        if not os.path.isdir(key_dir):
+            return []
+        years = (_partition_value('year', name) for name in os.listdir(key_dir))
+        return sorted(int(year) for year in years if year and year.isdigit())
+
+    def write(self, df, symbol, timeframe):
+        """Barları yıl bölümlerine birleştirerek yaz; yazılan yeni satır sayısını döndür
+
+        Var olan yıl dosyası okunur, aynı zaman damgalı satırlarda yeni veri
+        kazanır ve dosya geçici ada yazılıp atomik olarak değiştirilir.
+        """
+        data = normalize_ohlcv(df)
+        if data.empty:
+            return 0
+        if data.index.tz is not None:
+            data.index = data.index.tz_localize(None)
+
+        added = 0
+        for year, part in data.groupby(data.index.year):
+            path = self._year_path(symbol, timeframe, year)
+            existing_rows = 0
+            if os.path.exists(path):
+                existing = self._read_file(path)
+                existing_rows = len(existing)
+                part = pd.concat([existing, part])
+                part = part[~part.index.duplicated(keep='last')].sort_index()
+            self._write_file(path, part)
+            added += len(part) - existing_rows
+        return added
+
+    def _write_file(self, path, data):
+        columns = {'timestamp': data.index.values.astype('datetime64[ns]')}
+        for column in VALUE_COLUMNS:
+            values = data[column].to_numpy(dtype=np.float64) if column in data.columns else np.full(len(data), np.nan)
+            columns[column] = values
+        table = pa.Table.from_pydict(columns, schema=_bar_schema())
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # '.' ile başlayan dosyalar dataset taramasında yok sayılır
+        tmp_path = os.path.join(os.path.dirname(path), f".{PART_FILE}.{os.getpid()}.tmp")
+        try:
+            pq.write_table(table, tmp_path, row_group_size=self.row_group_size,
+                           compression=self.compression)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _read_file(self, path):
+        frame = pq.read_table(path).to_pandas()
+        return frame.set_index('timestamp')
+
+    def _filter(self, start, end):
+        """Tarih aralığı için yıl bölümü + timestamp predicate'i"""
+        condition = None
+        for bound, op in ((start, 'ge'), (end, 'le')):
+            if bound is None:
+                continue
+            bound = pd.Timestamp(bound)
+            if bound.tz is not None:
+                bound = bound.tz_localize(None)
+            year = ds.field('year') >= bound.year if op == 'ge' else ds.field('year') <= bound.year
+            stamp = pa.scalar(bound.to_datetime64().astype('datetime64[ns]'), type=pa.timestamp('ns'))
+            moment = ds.field('timestamp') >= stamp if op == 'ge' else ds.field('timestamp') <= stamp
+            part = year & moment
+            condition = part if condition is None else condition & part
+        return condition
+
+    def _dataset(self, path, fields):
+        partitioning = ds.partitioning(pa.schema(fields), flavor='hive')
+        return ds.dataset(path, format='parquet', partitioning=partitioning)
+
+    def read(self, symbol, timeframe, start=None, end=None, columns=None):
+        """(sembol, timeframe) barlarını DataFrame olarak oku
+
+        start/end dahil sınırlardır; columns verilirse sadece o kolonlar
+        okunur. Veri yoksa boş DataFrame döner.
+        """
+        columns = value_columns(columns)
+        key_dir = self._key_dir(symbol, timeframe)
+        if not os.path.isdir(key_dir):
+            return pd.DataFrame(columns=columns, index=pd.DatetimeIndex([], name='timestamp'))
+
+        dataset = self._dataset(key_dir, [('year', pa.int32())])
+        table = dataset.to_table(columns=['timestamp'] + columns, filter=self._filter(start, end))
+        frame = table.to_pandas().set_index('timestamp')
+        if not frame.index.is_monotonic_increasing:
+            frame = frame.sort_index(kind='stable')
+        return frame
+
+    def scan(self, timeframe, symbols=None, start=None, end=None, columns=None):
+        """Birden çok sembolü tek dataset taramasıyla uzun tablo olarak oku
+
+        Kolonlar: symbol, timestamp ve istenen değer kolonları.
+        """
+        columns = value_columns(columns)
+        dataset = self._dataset(self.root, [('symbol', pa.string()), ('timeframe', pa.string()), ('year', pa.int32())])
+        condition = ds.field('timeframe') == timeframe
+        if symbols is not None:
+            condition = condition & ds.field('symbol').isin(list(symbols))
+        period = self._filter(start, end)
+        if period is not None:
+            condition = condition & period
+        table = dataset.to_table(columns=['symbol', 'timestamp'] + columns, filter=condition)
+        return table.to_pandas().sort_values(['symbol', 'timestamp'], kind='stable', ignore_index=True)
+
+    def symbols(self):
+        """Depodaki semboller"""
+        names = (_partition_value('symbol', name) for name in os.listdir(self.root))
+        return sorted(name for name in names if name)
+
+    def timeframes(self, symbol=None):
+        """Depodaki timeframe'ler (symbol verilirse sadece o sembolün)"""
+        symbols = [symbol] if symbol else self.symbols()
+        found = set()
+        for name in symbols:
+            symbol_dir = self._symbol_dir(name)
+            if not os.path.isdir(symbol_dir):
+                continue
+            for entry in os.listdir(symbol_dir):
+                timeframe = _partition_value('timeframe', entry)
+                if timeframe:
+                    found.add(timeframe)
+        return sorted(found)
+
+    def summary(self, symbols=None, timeframe=None):
+        """(sembol, timeframe) başına satır sayısı ve ilk/son bar
+
+        Bar verisi okunmaz; sayılar Parquet dosya metadata'sından ve
+        timestamp kolonunun satır grubu istatistiklerinden gelir. Kolonlar
+        DataCatalog ile aynıdır: symbol, timeframe, row_count,
+        first_timestamp, last_timestamp, updated_at.
+        """
+        rows = []
+        for symbol in (symbols or self.symbols()):
+            for tf in ([timeframe] if timeframe else self.timeframes(symbol)):
+                row = {'symbol': symbol, 'timeframe': tf, 'row_count': 0,
+                       'first_timestamp': None, 'last_timestamp': None, 'updated_at': None}
+                for year in self.years(symbol, tf):
+                    path = self._year_path(symbol, tf, year)
+                    if not os.path.exists(path):
+                        continue
+                    metadata = pq.ParquetFile(path).metadata
+                    row['row_count'] += metadata.num_rows
+                    for group in range(metadata.num_row_groups):
+                        stats = metadata.row_group(group).column(0).statistics
+                        if stats is None or not stats.has_min_max:
+                            continue
+                        first, last = pd.Timestamp(stats.min), pd.Timestamp(stats.max)
+                        if row['first_timestamp'] is None or first < row['first_timestamp']:
+                            row['first_timestamp'] = first
+                        if row['last_timestamp'] is None or last > row['last_timestamp']:
+                            row['last_timestamp'] = last
+                    modified = pd.Timestamp(os.path.getmtime(path), unit='s')
+                    if row['updated_at'] is None or modified > row['updated_at']:
+                        row['updated_at'] = modified
+                if row['row_count']:
+                    rows.append(row)
+        return pd.DataFrame(rows, columns=['symbol', 'timeframe', 'row_count',
+                                           'first_timestamp', 'last_timestamp', 'updated_at'])
+
+    def remove(self, symbol, timeframe):
+        """(sembol, timeframe) bölümünü sil
+
+        Yıl dosyalarıyla birlikte boş kalan timeframe klasörü, sembolün son
+        timeframe'iyse sembol klasörü de silinir; böylece timeframes() ve
+        read() silinen anahtarı görmez.
+        """
+        for year in self.years(symbol, timeframe):
+            path = self._year_path(symbol, timeframe, year)
+            if os.path.exists(path):
+                os.remove(path)
+            os.rmdir(os.path.dirname(path))
+        for directory in (self._key_dir(symbol, timeframe), self._symbol_dir(symbol)):
+            if os.path.isdir(directory) and not os.listdir(directory):
+                os.rmdir(directory)
+
+    def export_from_database(self, engine, symbols=None, timeframes=None, chunk_rows=500_000,
+                             progress_callback=None):
+        """market_data tablosunu (sembol, timeframe) sırasıyla depoya aktar
+
+        Her anahtar chunk_rows'luk parçalarla okunur; dönüş yazılan toplam
+        satır sayısıdır.
+        """
+        # Sunucusuz okuma düğümleri sqlalchemy kurmak zorunda kalmasın
+        from sqlalchemy import text
+        from database.connection_pool import iter_frames, read_only_connection
+
+        with engine.connect() as conn:
+            keys = conn.execute(text(
+                f"SELECT DISTINCT symbol, timeframe FROM {MARKET_DATA_TABLE} ORDER BY symbol, timeframe"
+            )).fetchall()
+        keys = [(s, tf) for s, tf in keys
+                if (symbols is None or s in symbols) and (timeframes is None or tf in timeframes)]
+
+        query = text(
+            f"SELECT timestamp, {', '.join(VALUE_COLUMNS)} FROM {MARKET_DATA_TABLE} "
+            f"WHERE symbol = :symbol AND timeframe = :timeframe ORDER BY timestamp"
+        )
+        total = 0
+        for i, (symbol, timeframe) in enumerate(keys):
+            with read_only_connection(engine, chunk_rows) as conn:
+                chunks = iter_frames(conn, query, params={'symbol': symbol, 'timeframe': timeframe},
+                                     index_col='timestamp', parse_dates=['timestamp'], chunk_rows=chunk_rows)
+                for chunk in chunks:
+                    total += self.write(chunk, symbol, timeframe)
+            if progress_callback:
+                progress_callback(int((i + 1) / len(keys) * 100), f"{symbol} {timeframe}")
+        return total
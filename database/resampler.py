@@ -0,0 +1,136 @@
+# database/resampler.py
+import numpy as np
+import pandas as pd
+
+# Timeframe -> dakika
+TIMEFRAME_MINUTES = {
+    '1m': 1, '5m': 5, '15m': 15, '30m': 30,
+    '1h': 60, '2h': 120, '4h': 240,
+    '1d': 1440, '1w': 10080,
+}
+
+# BIST pay piyasası sürekli işlem başlangıcı ve bitişi (gün içi kovalar buna hizalanır)
+SESSION_OPEN = '10:00:00'
+SESSION_CLOSE = '18:00:00'
+
+_MINUTE_NS = 60 * 10 ** 9
+_DAY_NS = 1440 * _MINUTE_NS
+
+
+def timeframe_minutes(timeframe):
+    """Timeframe metninin dakika karşılığı; bilinmiyorsa None"""
+    return TIMEFRAME_MINUTES.get(timeframe)
+
+
+def can_resample(source, target):
+    """source barlarından target barları türetilebilir mi"""
+    source_minutes = timeframe_minutes(source)
+    target_minutes = timeframe_minutes(target)
+    if source_minutes is None or target_minutes is None or target_minutes <= source_minutes:
+        return False
+    # Gün içi hedefler kaynağın tam katı olmalı; gün ve hafta her zaman türetilebilir
+    return target_minutes >= 1440 or target_minutes % source_minutes == 0
+
+
+def _session_bounds(session_open, session_close):
+    return pd.Timedelta(session_open).value, pd.Timedelta(session_close).value
+
+
+def bucket_keys(timestamps, timeframe, session_open=SESSION_OPEN, session_close=SESSION_CLOSE):
+    """Her bar için hedef barın başlangıç zamanı (int64 ns)
+
+    Gün içi kovalar seans açılışına hizalanır; açılıştan önceki barlar
+    (açılış seansı) ilk kovaya, kapanıştan sonraki barlar (kapanış
+    seansı) günün son kovasına eklenir. Günlük kovalar takvim günü,
+    haftalık kovalar pazartesi başlangıçlıdır.
+    """
+    minutes = timeframe_minutes(timeframe)
+    if minutes is None:
+        raise ValueError(f"Bilinmeyen timeframe: {timeframe}")
+    day = timestamps - timestamps % _DAY_NS
+    if minutes >= 10080:
+        # 1970-01-01 perşembe: (gün + 3) % 7 pazartesi için 0 verir
+        return day - ((day // _DAY_NS + 3) % 7) * _DAY_NS
+    if minutes >= 1440:
+        return day
+
+    open_ns, close_ns = _session_bounds(session_open, session_close)
+    width = minutes * _MINUTE_NS
+    offset = np.clip(timestamps - day - open_ns, 0, max(0, close_ns - open_ns - 1))
+    return day + open_ns + offset - offset % width
+
+
+def bucket_range(start, end, timeframe, session_open=SESSION_OPEN, session_close=SESSION_CLOSE):
+    """[start, end] aralığındaki hedef barları tam kuracak kaynak bar aralığı
+
+    start içinde bulunduğu kovanın başına çekilir, end de içinde bulunduğu
+    kovanın sonuna uzatılır; böylece aralığın ilk ve son barı yarım kalmaz.
+    Günün ilk kovası açılış seansını, son kovası kapanış seansını da
+    kapsadığı için bu kovalarda sınır gün başına / gün sonuna genişler.
+    None sınırlar olduğu gibi döner.
+    """
+    minutes = timeframe_minutes(timeframe)
+    if minutes is None:
+        raise ValueError(f"Bilinmeyen timeframe: {timeframe}")
+    open_ns, close_ns = _session_bounds(session_open, session_close)
+    width = minutes * _MINUTE_NS
+
+    bounds = []
+    for bound, is_end in ((start, False), (end, True)):
+        if bound is None:
+            bounds.append(None)
+            continue
+        bound = pd.Timestamp(bound)
+        if bound.tz is not None:
+            bound = bound.tz_localize(None)
+        stamp = bound.as_unit('ns').value
+        key = int(bucket_keys(np.array([stamp]), timeframe, session_open, session_close)[0])
+        day = stamp - stamp % _DAY_NS
+        if not is_end:
+            value = day if minutes < 1440 and key == day + open_ns else key
+        elif minutes < 1440 and key + width >= day + close_ns:
+            value = day + _DAY_NS - 1
+        else:
+            value = key + width - 1
+        bounds.append(pd.Timestamp(value))
+    return bounds[0], bounds[1]
+
+
+def resample_ohlcv(data, timeframe, session_open=SESSION_OPEN, session_close=SESSION_CLOSE):
+    """OHLCV barlarını reduceat ile daha büyük timeframe'e indirge
+
+    data zaman sıralı, küçük ya da büyük harf kolonlu bir DataFrame olabilir;
+    çıktı aynı kolon adlarını kullanır. Açılış kovanın ilk, kapanış son
+    barıdır; high/low max/min, hacim toplamdır. Etiket kova başlangıcıdır.
+    """
+    if data is None or data.empty:
+        return data
+    index = pd.DatetimeIndex(data.index)
+    tz = index.tz
+    if tz is not None:
+        index = index.tz_localize(None)
+    timestamps = index.values.astype('datetime64[ns]').view(np.int64)
+
+    keys = bucket_keys(timestamps, timeframe, session_open, session_close)
+    starts = np.flatnonzero(np.concatenate(([True], keys[1:] != keys[:-1])))
+    ends = np.append(starts[1:], len(keys)) - 1
+
+    columns = {str(c).lower(): c for c in data.columns}
+    result = {}
+    for name, column in columns.items():
+        values = data[column].to_numpy()
+        if name == 'open':
+            result[column] = values[starts]
+        elif name == 'close':
+            result[column] = values[ends]
+        elif name == 'high':
+            result[column] = np.maximum.reduceat(values, starts)
+        elif name == 'low':
+            result[column] = np.minimum.reduceat(values, starts)
+        elif name == 'volume':
+            result[column] = np.add.reduceat(values, starts)
+
+    labels = pd.DatetimeIndex(keys[starts].view('datetime64[ns]'), name=data.index.name)
+    if tz is not None:
+        labels = labels.tz_localize(tz)
+    return pd.DataFrame(result, index=labels)
@@ -0,0 +1,31 @@
+# decimation.py
+import numpy as np
+
+
+def minmax_decimate(x, y, start=0, end=None, n_buckets=1000):
+    """[start, end) aralığını tepe/dip koruyarak n_buckets kovaya indirge
+
+    Her kovadan en düşük ve en yüksek nokta zaman sırasıyla alınır; böylece
+    drawdown dipleri ve tepeler çizimde kaybolmaz. Aralık zaten kısaysa
+    olduğu gibi döner. Dönüş: (x, y) dilimleri ya da seçilen noktalar.
+    """
+    end = len(y) if end is None else end
+    start = max(0, start)
+    n = end - start
+    if n <= 2 * n_buckets:
+        return x[start:end], y[start:end]
+
+    bucket = -(-n // n_buckets)
+    full = n // bucket
+    values = np.asarray(y[start:start + full * bucket]).reshape(full, bucket)
+    base = start + np.arange(full) * bucket
+    picks = [[start], base + np.argmin(values, axis=1), base + np.argmax(values, axis=1), [end - 1]]
+
+    if full * bucket < n:
+        tail_base = start + full * bucket
+        tail = np.asarray(y[tail_base:end])
+        picks.append([tail_base + np.argmin(tail), tail_base + np.argmax(tail)])
+
+    # Sıralı ve tekil indeksler: ilk/son nokta ve her kovanın dibi ile tepesi
+    index = np.unique(np.concatenate(picks))
+    return x[index], y[index]
@@ -0,0 +1,64 @@
+# equity_plot.py
+import numpy as np
+import pyqtgraph as pg
+
+from decimation import minmax_decimate
+
+
+def index_seconds(index):
+    """DatetimeIndex'i DateAxisItem için epoch saniyesine çevir"""
+    return np.asarray(index.values, dtype='datetime64[ns]').astype(np.int64) / 1e9
+
+
+class DecimatedCurve:
+    """Görünen aralığa göre yeniden örneklenen çizgi
+
+    Tam seri bellekte tutulur; PlotDataItem'a sadece görünen aralığın
+    piksel başına en fazla iki noktası (kova dibi ve tepesi) verilir.
+    Kullanıcı yakınlaştırıp kaydırdıkça aralık yeniden örneklenir, bu
+    yüzden milyonlarca noktalı seriler de akıcı çizilir.
+    """
+
+    def __init__(self, plot_widget, x, y, points_per_pixel=2, **plot_kwargs):
+        self.x = np.asarray(x, dtype=np.float64)
+        self.y = np.asarray(y, dtype=np.float64)
+        self.points_per_pixel = points_per_pixel
+        self.view_box = plot_widget.getViewBox()
+        self.item = plot_widget.plot(**plot_kwargs)
+        # Yakınlaştırma sırasında en fazla 30 Hz yeniden örnekleme
+        self._proxy = pg.SignalProxy(self.view_box.sigXRangeChanged, rateLimit=30, slot=self.refresh)
+        self.refresh()
+
+    def refresh(self, *args):
+        """Görünen aralığı yeniden örnekle"""
+        if len(self.x) == 0:
+            self.item.setData([], [])
+            return
+        if args:
+            left, right = self.view_box.viewRange()[0]
+        else:
+            left, right = self.x[0], self.x[-1]
+        # Kenarlardaki çizgiler kesilmesin diye bir nokta taşarak al
+        start = max(0, int(np.searchsorted(self.x, left)) - 1)
+        end = min(len(self.x), int(np.searchsorted(self.x, right, side='right')) + 1)
+        n_buckets = max(100, int(self.view_box.width() * self.points_per_pixel / 2))
+        x, y = minmax_decimate(self.x, self.y, start, end, n_buckets)
+        self.item.setData(x, y)
+
+    def detach(self):
+        """Aralık değişimi bağlantısını kes (grafik temizlenmeden önce)"""
+        self._proxy.disconnect()
+
+
+def signal_markers(x, y, signal, size=12):
+    """AL/SAT sinyallerini tek bir ScatterPlotItem'da topla"""
+    signal = np.asarray(signal)
+    bars = np.flatnonzero(signal)
+    is_buy = signal[bars] > 0
+    buy_brush, sell_brush = pg.mkBrush('#00ff00'), pg.mkBrush('#ff0000')
+    return pg.ScatterPlotItem(
+        x=np.asarray(x)[bars], y=np.asarray(y)[bars], size=size, pen=None,
+        symbol=np.where(is_buy, 't', 't1').tolist(),
+        brush=[buy_brush if buy else sell_brush for buy in is_buy],
+        name='AL / SAT'
+    )
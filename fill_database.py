@@ -2,14 +2,14 @@
 import os
 import time
 from tqdm import tqdm
-from database.bist_data_loader import BISTDatabaseManager
+from database.backend import get_database_manager
 
 def fill_database_with_progress():
     """Progress bar ile database doldurma"""
     print("🚀 Database doldurma işlemi başlatılıyor...")
     print("⏰ Bu işlem birkaç dakika sürebilir...")
     
-    db = BISTDatabaseManager()
+    db = get_database_manager()
     
     # Database'i doldur
     print("\n📥 Veriler database'e yükleniyor...")
@@ -34,22 +34,50 @@ def fill_database_with_progress():
         print(f"✅ Başarılı! {len(symbols)} sembol yüklendi")
         print(f"📊 Timeframe'ler: {timeframes}")
         
-        # İlk 5 sembolün özeti
+        # İlk 5 sembolün özeti (katalog tablosundan, bar okumadan)
         print(f"\n📈 İlk 5 Sembol Özeti:")
-        for symbol in symbols[:5]:
+        catalog = db.get_data_catalog(symbols=symbols[:5])
+        for symbol, rows in catalog.groupby('symbol'):
             print(f"   {symbol}:")
-            for tf in timeframes:
-                data = db.get_symbol_data(symbol, tf)
-                if data is not None:
-                    print(f"     {tf}: {len(data):,} kayıt")
+            for row in rows.itertuples():
+                print(f"     {row.timeframe}: {row.row_count:,} kayıt")
     else:
         print("❌ Database hala boş görünüyor!")
 
+def bulk_fill_database():
+    """PostgreSQL COPY ile toplu database doldurma (en hızlı)"""
+    print("🚀 Bulk COPY ile Database Doldurma")
+    
+    db = get_database_manager('postgres')
+    
+    start_time = time.time()
+    loaded_files, error_files = db.initialize_database_bulk()
+    duration = time.time() - start_time
+    
+    print(f"\n✅ Bulk doldurma tamamlandı!")
+    print(f"⏱️  Toplam süre: {duration:.2f} saniye ({duration/60:.2f} dakika)")
+    print(f"📊 Başarılı dosya: {loaded_files}")
+    print(f"📊 Hatalı dosya: {error_files}")
+
+def incremental_fill_database():
+    """Sadece yeni veya değişmiş dosyaları yükle (günlük güncelleme)"""
+    print("🔄 Artımlı Database Güncelleme")
+    
+    db = get_database_manager('postgres')
+    
+    start_time = time.time()
+    loaded_files, error_files, skipped_files = db.initialize_database_incremental()
+    duration = time.time() - start_time
+    
+    print(f"\n✅ Artımlı güncelleme tamamlandı!")
+    print(f"⏱️  Toplam süre: {duration:.2f} saniye")
+    print(f"📊 İşlenen dosya: {loaded_files} | Atlanan: {skipped_files} | Hatalı: {error_files}")
+
 def quick_fill_test():
     """Hızlı test - sadece birkaç dosya yükle"""
     print("⚡ Hızlı Test - Sadece birkaç dosya yüklenecek...")
     
-    db = BISTDatabaseManager()
+    db = get_database_manager()
     
     # Sadece birkaç dosya yükle
     base_path = r"C:\iDealPython\data"
@@ -90,52 +118,43 @@ def quick_fill_test():
             print(f"⚠️ Dosya adı parse edilemedi: {filename}")
     
     # Sonuçları göster
-    symbols = db.get_available_symbols()
-    print(f"\n📊 Database durumu: {len(symbols)} sembol")
-    for symbol in symbols:
-        for tf in db.get_available_timeframes(symbol):
-            data = db.get_symbol_data(symbol, tf)
-            if data is not None:
-                print(f"   {symbol} ({tf}): {len(data)} kayıt")
+    catalog = db.get_data_catalog()
+    print(f"\n📊 Database durumu: {catalog['symbol'].nunique()} sembol")
+    for row in catalog.itertuples():
+        print(f"   {row.symbol} ({row.timeframe}): {row.row_count} kayıt")
 
 def parallel_fill_database():
     """Parallel database doldurma (daha hızlı)"""
     print("🚀 Parallel Database Doldurma")
-    print("⏰ Bu işlem daha hızlı olacak...")
-    
-    db = BISTDatabaseManager()
+    print("⏰ CSV'ler tüm çekirdeklerde parse edilip paralel yazılacak...")
     
-    # Tüm dosyaları bul
-    all_files = db.scan_directory_structure()
+    db = get_database_manager('postgres')
     
-    total_files = len(all_files)
-    print(f"📊 Toplam {total_files} dosya işlenecek...")
+    start_time = time.time()
+    loaded_files, error_files = db.initialize_database_parallel()
+    duration = time.time() - start_time
     
-    # Batch processing - her seferinde 10 dosya
-    batch_size = 10
-    loaded_files = 0
+    print(f"\n🎯 Parallel doldurma tamamlandı!")
+    print(f"⏱️  Toplam süre: {duration:.2f} saniye ({duration/60:.2f} dakika)")
+    print(f"📊 Toplam yüklenen: {loaded_files} | Hatalı: {error_files}")
+
+def export_to_parquet():
+    """market_data tablosunu database sunucusuz okuma için Parquet deposuna aktar"""
+    from database.parquet_store import ParquetMarketStore
+    print("📦 Parquet Deposuna Aktarım")
     
-    for i in range(0, total_files, batch_size):
-        batch = all_files[i:i + batch_size]
-        print(f"\n🔄 Batch {i//batch_size + 1}/{(total_files + batch_size - 1)//batch_size}")
-        
-        for symbol, year, filename, full_path in batch:
-            print(f"   📥 {filename}")
-            
-            symbol_from_file, timeframe, year_from_file = db.loader.parse_bist_filename(filename)
-            
-            if symbol_from_file and timeframe:
-                df = db.loader.load_bist_data(full_path)
-                
-                if df is not None and not df.empty:
-                    success = db.save_to_database(df, symbol_from_file, timeframe)
-                    if success:
-                        loaded_files += 1
-        
-        print(f"   ✅ Bu batch tamamlandı - Toplam: {loaded_files}/{total_files}")
+    db = get_database_manager('postgres')
+    store = ParquetMarketStore()
     
-    print(f"\n🎯 Parallel doldurma tamamlandı!")
-    print(f"📊 Toplam yüklenen: {loaded_files}/{total_files}")
+    start_time = time.time()
+    rows = store.export_from_database(
+        db.engine, progress_callback=lambda percent, message: print(f"   %{percent} {message}")
+    )
+    duration = time.time() - start_time
+    
+    print(f"\n✅ Aktarım tamamlandı: {rows:,} kayıt -> {store.root}")
+    print(f"⏱️  Toplam süre: {duration:.2f} saniye")
+    print("💡 Parquet deposunu kullanmak için: BIST_STORAGE=parquet")
 
 if __name__ == "__main__":
     print("🗄️ BIST Database Doldurma")
@@ -145,8 +164,11 @@ if __name__ == "__main__":
     print("1: Tüm database'i doldur (uzun sürebilir)")
     print("2: Hızlı test (sadece birkaç dosya)")
     print("3: Parallel doldurma (daha hızlı)")
+    print("4: Bulk COPY ile doldurma (en hızlı)")
+    print("5: Artımlı güncelleme (sadece yeni/değişen dosyalar)")
+    print("6: Database'i Parquet deposuna aktar (sunucusuz okuma)")
     
-    choice = input("\nSeçiminiz (1, 2 veya 3): ").strip()
+    choice = input("\nSeçiminiz (1-6): ").strip()
     
     if choice == "1":
         fill_database_with_progress()
@@ -154,5 +176,11 @@ if __name__ == "__main__":
         quick_fill_test()
     elif choice == "3":
         parallel_fill_database()
+    elif choice == "4":
+        bulk_fill_database()
+    elif choice == "5":
+        incremental_fill_database()
+    elif choice == "6":
+        export_to_parquet()
     else:
         print("❌ Geçersiz seçim!")
\ No newline at end of file
@@ -1,13 +1,14 @@
 # main.py
 import sys
+import os
 import pandas as pd
 import numpy as np
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, 
                            QWidget, QPushButton, QComboBox, QTextEdit, QTabWidget,
                            QLabel, QLineEdit, QSpinBox, QDoubleSpinBox, QProgressBar,
-                           QTableWidget, QTableWidgetItem, QHeaderView, QGroupBox,
+                           QTableView, QHeaderView, QGroupBox,
                            QSplitter, QFrame, QMessageBox)
-from PyQt6.QtCore import QThread, pyqtSignal, Qt
+from PyQt6.QtCore import QThread, QTimer, pyqtSignal, Qt
 from PyQt6.QtGui import QFont, QPalette, QColor
 import pyqtgraph as pg
 import warnings
@@ -15,65 +16,98 @@ import warnings
 # Uyarıları gizle
 warnings.filterwarnings('ignore')
 
-from database.bist_data_loader import BISTDatabaseManager
-from backtesting.cuda_backtester import CUDABacktester
+from database.backend import get_database_manager
+from backtesting.backend import get_backtester, get_optimizer
+from backtesting.vectorized_optimizer import PRICE_COLUMNS
+from backtesting.result_cache import ResultCache, CachedBacktester
+from backtesting.results_surface import DEFAULT_SURFACE_DIR
+from backtesting.jobs import CancelToken, Job, JobCancelled, JobQueue
+from trade_table_model import TradeTableModel, FILTERS
+from equity_plot import DecimatedCurve, index_seconds, signal_markers
+
+# Kapanışta çalışan thread'lerin durmasını bekleme / yeniden deneme aralığı (ms)
+CLOSE_POLL_MS = 200
 
 class BacktestThread(QThread):
-    """Backtest işlemi için thread"""
+    """Backtest işlemi için thread
+
+    cancel() ile durdurulabilir: iptal simülasyon ve metrik adımları
+    arasında kontrol edilir, sonuç yayınlanmadan cancelled sinyali verilir.
+    """
     finished = pyqtSignal(object, object, object)  # results, trades, metrics
     progress = pyqtSignal(str)
     error = pyqtSignal(str)
+    cancelled = pyqtSignal()
     
     def __init__(self, backtester, data, params):
         super().__init__()
         self.backtester = backtester
         self.data = data
         self.params = params
+        self.token = CancelToken()
+    
+    def cancel(self):
+        self.token.cancel()
     
     def run(self):
         try:
+            self.token.check()
             self.progress.emit("Backtest başlatılıyor...")
             results, trades = self.backtester.run_ma_crossover_backtest(
                 self.data, **self.params
             )
             
+            self.token.check()
             self.progress.emit("Performans metrikleri hesaplanıyor...")
             metrics = self.backtester.calculate_performance_metrics(results, trades)
             
+            self.token.check()
             self.finished.emit(results, trades, metrics)
             
+        except JobCancelled:
+            self.cancelled.emit()
         except Exception as e:
             self.error.emit(str(e))
 
-class OptimizationThread(QThread):
-    """Optimizasyon işlemi için thread"""
-    finished = pyqtSignal(object, object)  # best_params, best_metrics
-    progress = pyqtSignal(int, str)
+class JobWorker(QThread):
+    """JobQueue'daki optimizasyon işlerini sırayla çalıştıran thread"""
+    job_started = pyqtSignal(object)
+    job_progress = pyqtSignal(object, int, str)  # job, percent, message
+    job_finished = pyqtSignal(object)
     
-    def __init__(self, optimizer, data, param_ranges):
+    def __init__(self, queue):
         super().__init__()
-        self.optimizer = optimizer
-        self.data = data
-        self.param_ranges = param_ranges
+        self.queue = queue
     
     def run(self):
-        try:
-            best_params, best_metrics = self.optimizer.optimize_ma_parameters(
-                self.data, self.param_ranges
-            )
-            self.finished.emit(best_params, best_metrics)
-        except Exception as e:
-            print(f"Optimizasyon thread hatası: {e}")
-            self.finished.emit(None, None)
+        while True:
+            job = self.queue.next_job()
+            if job is None:
+                return
+            self.job_started.emit(job)
+            job.run(lambda percent, message, job=job: self.job_progress.emit(job, percent, message))
+            if job.status == 'failed':
+                print(f"Optimizasyon işi hatası ({job.name}): {job.error}")
+            self.job_finished.emit(job)
 
 class TradingPlatform(QMainWindow):
     def __init__(self):
         super().__init__()
-        self.db = BISTDatabaseManager()
-        self.backtester = CUDABacktester()
+        self.db = get_database_manager()
+        self.result_cache = ResultCache()
+        self.backtester = CachedBacktester(get_backtester(), self.result_cache)
+        self.last_surface = None
         self.current_results = None
         self.current_metrics = None
         
+        # Optimizasyonlar kuyrukta sırayla çalışır; çalışan iş iptal edilebilir
+        self.job_queue = JobQueue()
+        self.job_worker = JobWorker(self.job_queue)
+        self.job_worker.job_started.connect(self.on_job_started)
+        self.job_worker.job_progress.connect(self.on_job_progress)
+        self.job_worker.job_finished.connect(self.on_job_finished)
+        self.job_worker.finished.connect(self._start_jobs)
+        
         self.init_ui()
         self.load_initial_data()
     
@@ -131,10 +165,21 @@ class TradingPlatform(QMainWindow):
         timeframe_row = QHBoxLayout()
         timeframe_row.addWidget(QLabel("Timeframe:"))
         self.timeframe_combo = QComboBox()
-        self.timeframe_combo.addItems(['1d', '1h', '5m'])
+        # 5m dışındaki timeframe'ler gerekirse 5m barlarından türetilir
+        self.timeframe_combo.addItems(['1d', '4h', '1h', '30m', '15m', '5m', '1w'])
         timeframe_row.addWidget(self.timeframe_combo)
         symbol_layout.addLayout(timeframe_row)
         
+        period_row = QHBoxLayout()
+        period_row.addWidget(QLabel("Dönem:"))
+        self.period_combo = QComboBox()
+        # Kısa dönemlerde sadece ilgili tarih aralığı database'den okunur
+        for label, days in [("Tüm geçmiş", None), ("Son 3 ay", 91), ("Son 1 yıl", 365),
+                            ("Son 2 yıl", 730), ("Son 5 yıl", 1826)]:
+            self.period_combo.addItem(label, days)
+        period_row.addWidget(self.period_combo)
+        symbol_layout.addLayout(period_row)
+        
         layout.addWidget(symbol_group)
         
         # Strateji parametreleri
@@ -189,14 +234,36 @@ class TradingPlatform(QMainWindow):
         buttons_group = QGroupBox("İşlemler")
         buttons_layout = QVBoxLayout(buttons_group)
         
+        backtest_layout = QHBoxLayout()
         self.backtest_btn = QPushButton("Backtest Çalıştır")
         self.backtest_btn.clicked.connect(self.run_backtest)
-        buttons_layout.addWidget(self.backtest_btn)
+        backtest_layout.addWidget(self.backtest_btn)
+        
+        self.backtest_cancel_btn = QPushButton("⏹")
+        self.backtest_cancel_btn.setToolTip("Çalışan backtest'i durdur")
+        self.backtest_cancel_btn.clicked.connect(self.cancel_backtest)
+        self.backtest_cancel_btn.setEnabled(False)
+        backtest_layout.addWidget(self.backtest_cancel_btn)
+        buttons_layout.addLayout(backtest_layout)
         
         self.optimize_btn = QPushButton("GPU Optimizasyon Başlat")
         self.optimize_btn.clicked.connect(self.run_optimization)
         buttons_layout.addWidget(self.optimize_btn)
         
+        cancel_layout = QHBoxLayout()
+        self.cancel_btn = QPushButton("⏹ İptal")
+        self.cancel_btn.setToolTip("Çalışan optimizasyonu durdur")
+        self.cancel_btn.clicked.connect(self.cancel_current_job)
+        self.cancel_btn.setEnabled(False)
+        cancel_layout.addWidget(self.cancel_btn)
+        
+        self.cancel_all_btn = QPushButton("Kuyruğu Temizle")
+        self.cancel_all_btn.setToolTip("Çalışan ve bekleyen tüm optimizasyonları iptal et")
+        self.cancel_all_btn.clicked.connect(self.job_queue.cancel_all)
+        self.cancel_all_btn.setEnabled(False)
+        cancel_layout.addWidget(self.cancel_all_btn)
+        buttons_layout.addLayout(cancel_layout)
+        
         layout.addWidget(buttons_group)
         
         # Progress bar
@@ -301,6 +368,22 @@ class TradingPlatform(QMainWindow):
         tp_layout.addWidget(self.tp_step)
         optimization_layout.addLayout(tp_layout)
         
+        # Arama yöntemi
+        method_layout = QHBoxLayout()
+        method_layout.addWidget(QLabel("Arama Yöntemi:"))
+        self.search_method_combo = QComboBox()
+        self.search_method_combo.addItem("Tam Grid", 'grid')
+        self.search_method_combo.addItem("Bayesian (TPE)", 'tpe')
+        self.search_method_combo.addItem("Successive Halving", 'halving')
+        method_layout.addWidget(self.search_method_combo)
+        method_layout.addWidget(QLabel("Süre (sn):"))
+        self.search_time_budget = QSpinBox()
+        self.search_time_budget.setRange(0, 3600)
+        self.search_time_budget.setValue(0)
+        self.search_time_budget.setToolTip("0 = süre sınırı yok (sadece adaptif yöntemler)")
+        method_layout.addWidget(self.search_time_budget)
+        optimization_layout.addLayout(method_layout)
+        
         return optimization_group
     
     def create_right_panel(self):
@@ -316,7 +399,8 @@ class TradingPlatform(QMainWindow):
         equity_layout = QVBoxLayout(self.equity_tab)
         
         # PyQtGraph grafikleri
-        self.equity_plot = pg.PlotWidget(title="Portföy Performansı")
+        self.equity_plot = pg.PlotWidget(title="Portföy Performansı", axisItems={'bottom': pg.DateAxisItem()})
+        self.equity_curves = []
         self.equity_plot.addLegend()
         self.equity_plot.setLabel('left', 'Portföy Değeri (TL)')
         self.equity_plot.setLabel('bottom', 'Tarih')
@@ -342,11 +426,26 @@ class TradingPlatform(QMainWindow):
         trades_group = QGroupBox("İşlem Geçmişi")
         trades_layout = QVBoxLayout(trades_group)
         
-        self.trades_table = QTableWidget()
-        self.trades_table.setColumnCount(6)
-        self.trades_table.setHorizontalHeaderLabels([
-            'Tarih', 'İşlem', 'Fiyat', 'Adet', 'Sebep', 'Kar/Zarar (%)'
-        ])
+        filter_layout = QHBoxLayout()
+        filter_layout.addWidget(QLabel("Filtre:"))
+        self.trades_filter = QComboBox()
+        for label, field, code in FILTERS:
+            self.trades_filter.addItem(label, (field, code))
+        self.trades_filter.currentIndexChanged.connect(
+            lambda _: self.trades_model.set_filter(*self.trades_filter.currentData())
+        )
+        filter_layout.addWidget(self.trades_filter)
+        filter_layout.addStretch()
+        trades_layout.addLayout(filter_layout)
+        
+        # Sanal tablo: sadece görünen satırlar çizilir, binlerce işlemde de donmaz
+        self.trades_model = TradeTableModel(self)
+        self.trades_table = QTableView()
+        self.trades_table.setModel(self.trades_model)
+        self.trades_table.setSortingEnabled(True)
+        self.trades_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.trades_table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.trades_table.verticalHeader().setDefaultSectionSize(22)
         trades_layout.addWidget(self.trades_table)
         
         performance_layout.addWidget(trades_group)
@@ -403,8 +502,8 @@ class TradingPlatform(QMainWindow):
             'take_profit': self.take_profit.value() / 100
         }
         
-        # Veriyi al
-        data = self.db.get_symbol_data(symbol, timeframe)
+        # Veriyi al (seçili dönem ve sadece backtest'in kullandığı kolonlar)
+        data = self.db.get_symbol_data(symbol, timeframe, start=self._period_start(), columns=PRICE_COLUMNS)
         if data is None or data.empty:
             self.show_error(f"{symbol} verisi bulunamadı!")
             return
@@ -414,13 +513,22 @@ class TradingPlatform(QMainWindow):
         self.backtest_thread.progress.connect(self.update_progress)
         self.backtest_thread.finished.connect(self.on_backtest_finished)
         self.backtest_thread.error.connect(self.show_error)
+        self.backtest_thread.cancelled.connect(self.on_backtest_cancelled)
         
         self.backtest_btn.setEnabled(False)
+        self.backtest_cancel_btn.setEnabled(True)
         self.progress_bar.setVisible(True)
         self.status_label.setText("Backtest çalışıyor...")
         
         self.backtest_thread.start()
     
+    def _period_start(self):
+        """Seçili dönemin başlangıç zamanı; tüm geçmiş için None"""
+        days = self.period_combo.currentData()
+        if not days:
+            return None
+        return pd.Timestamp.now().normalize() - pd.Timedelta(days=days)
+    
     def run_optimization(self):
         """Optimizasyon çalıştır"""
         symbol = self.symbol_combo.currentText()
@@ -446,39 +554,117 @@ class TradingPlatform(QMainWindow):
             'tp_step': self.tp_step.value()
         }
         
-        # Kombinasyon sayısını kontrol et
+        # Kombinasyon sayısı (vektörel optimizer binlerce kombinasyonu saniyeler içinde tarar)
         combinations = self._calculate_combinations(param_ranges)
-        if combinations > 500:
-            reply = QMessageBox.question(
-                self, 'Çok Fazla Kombinasyon', 
-                f'{combinations} kombinasyon var. Devam etmek istiyor musunuz?\n(Bu işlem birkaç dakika sürebilir)',
-                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
-            )
-            if reply == QMessageBox.StandardButton.No:
-                return
         
-        # Veriyi al
-        data = self.db.get_symbol_data(symbol, timeframe)
-        if data is None or data.empty:
-            self.show_error(f"{symbol} verisi bulunamadı!")
-            return
-        
-        # Fast optimizer kullan (şimdilik basit versiyon)
-        from backtesting.fast_optimizer import FastOptimizer
-        optimizer = FastOptimizer(self.backtester)
+        # Tam grid: derlenmiş (numba) ya da paralel optimizer; TPE / halving: bütçeli adaptif arama
+        method = self.search_method_combo.currentData()
+        if method == 'grid':
+            optimizer = get_optimizer(self.backtester, result_cache=self.result_cache)
+        else:
+            optimizer = get_optimizer(self.backtester, method=method,
+                                      time_budget=self.search_time_budget.value() or None)
         
-        # Thread başlat
-        self.optimization_thread = OptimizationThread(optimizer, data, param_ranges)
-        self.optimization_thread.progress.connect(self.update_optimization_progress)
-        self.optimization_thread.finished.connect(self.on_optimization_finished)
+        start = self._period_start()
         
-        self.optimize_btn.setEnabled(False)
+        def optimize(progress):
+            data = self.db.get_symbol_data(symbol, timeframe, start=start, columns=PRICE_COLUMNS)
+            if data is None or data.empty:
+                raise ValueError(f"{symbol} verisi bulunamadı!")
+            best_params, best_metrics = optimizer.optimize_ma_parameters(
+                data, param_ranges, progress_callback=progress
+            )
+            return {
+                'symbol': symbol, 'timeframe': timeframe,
+                'best_params': best_params, 'best_metrics': best_metrics,
+                'surface': getattr(optimizer, 'last_surface', None),
+            }
+        
+        # Adaptif aramalar grid'in sadece bir kısmını değerlendirir; hız sadece tam grid'de anlamlı
+        job = Job(f"{symbol} {timeframe}", optimize, total=combinations if method == 'grid' else None)
+        self.job_queue.submit(job)
+        self.status_label.setText(f"{job.name} kuyruğa eklendi ({combinations:,} kombinasyon, "
+                                  f"bekleyen: {len(self.job_queue.pending())})")
+        self.tabs.setCurrentIndex(2)
+        self._start_jobs()
+    
+    def _start_jobs(self):
+        """Kuyrukta iş varsa worker thread'i başlat"""
+        if self.job_queue.pending() and not self.job_worker.isRunning():
+            self.job_worker.start()
+        elif not self.job_worker.isRunning():
+            self.cancel_btn.setEnabled(False)
+            self.cancel_all_btn.setEnabled(False)
+            self.progress_bar.setVisible(False)
+    
+    def cancel_current_job(self):
+        """Çalışan optimizasyonu bir sonraki parça sınırında durdur"""
+        job = self.job_queue.cancel_current()
+        if job is not None:
+            self.status_label.setText(f"⏹ {job.name} iptal ediliyor...")
+    
+    def on_job_started(self, job):
+        """Kuyruktaki iş başladığında"""
+        self.last_surface = None
         self.progress_bar.setVisible(True)
         self.progress_bar.setValue(0)
-        self.status_label.setText(f"Optimizasyon başlatıldı ({combinations} kombinasyon)")
-        self.tabs.setCurrentIndex(2)
+        self.cancel_btn.setEnabled(True)
+        self.cancel_all_btn.setEnabled(True)
+        self.status_label.setText(f"▶ {job.name} optimizasyonu başladı (bekleyen: {len(self.job_queue.pending())})")
+    
+    def on_job_progress(self, job, percent, message):
+        """Çalışan işin ilerlemesi (hız ve tahmini kalan süre dahil)"""
+        self.update_optimization_progress(percent, f"{job.name}: {message}")
+    
+    def on_job_finished(self, job):
+        """Kuyruktaki iş bittiğinde, iptal edildiğinde ya da hata verdiğinde"""
+        if job.status == 'done':
+            result = job.result
+            if result['surface'] is not None:
+                self.on_surface_ready(result['surface'], result['symbol'], result['timeframe'])
+            self.on_optimization_finished(result['best_params'], result['best_metrics'])
+            self.status_label.setText(f"✅ {job.name} optimizasyonu {job.duration:.1f} saniyede tamamlandı")
+        elif job.status == 'cancelled':
+            self.status_label.setText(f"⏹ {job.name} optimizasyonu iptal edildi ({job.duration:.1f} sn)")
+        else:
+            self.show_error(f"{job.name} optimizasyonu başarısız: {job.error}")
+    
+    def cancel_backtest(self):
+        """Çalışan backtest'i bir sonraki adım sınırında durdur"""
+        if getattr(self, 'backtest_thread', None) is not None and self.backtest_thread.isRunning():
+            self.backtest_thread.cancel()
+            self.backtest_cancel_btn.setEnabled(False)
+            self.status_label.setText("⏹ Backtest iptal ediliyor...")
+    
+    def on_backtest_cancelled(self):
+        """Backtest iptal edildiğinde"""
+        self.backtest_btn.setEnabled(True)
+        self.backtest_cancel_btn.setEnabled(False)
+        self.progress_bar.setVisible(False)
+        self.status_label.setText("⏹ Backtest iptal edildi")
+    
+    def closeEvent(self, event):
+        """Pencere kapanırken çalışan ve bekleyen işleri durdur
+
+        İşler bir sonraki parça sınırında durur. Thread'ler hâlâ çalışıyorsa
+        kapanış ertelenir ve kısa aralıklarla yeniden denenir; çalışan bir
+        QThread nesnesini yok etmek süreci çökertir.
+        """
+        self.job_queue.cancel_all()
+        threads = [self.job_worker]
+        if getattr(self, 'backtest_thread', None) is not None:
+            self.backtest_thread.cancel()
+            threads.append(self.backtest_thread)
+        
+        if all(thread.wait(CLOSE_POLL_MS) for thread in threads):
+            super().closeEvent(event)
+            return
         
-        self.optimization_thread.start()
+        event.ignore()
+        self.backtest_btn.setEnabled(False)
+        self.optimize_btn.setEnabled(False)
+        self.status_label.setText("⏳ Çalışan işler durduruluyor, bitince pencere kapanacak...")
+        QTimer.singleShot(CLOSE_POLL_MS, self.close)
     
     def _calculate_combinations(self, param_ranges):
         """Kombinasyon sayısını hesapla"""
@@ -502,6 +688,7 @@ class TradingPlatform(QMainWindow):
     def on_backtest_finished(self, results, trades, metrics):
         """Backtest tamamlandığında"""
         self.backtest_btn.setEnabled(True)
+        self.backtest_cancel_btn.setEnabled(False)
         self.progress_bar.setVisible(False)
         self.status_label.setText("Backtest tamamlandı")
         
@@ -519,6 +706,18 @@ class TradingPlatform(QMainWindow):
         
         self.tabs.setCurrentIndex(0)  # Equity curve tab'ına geç
     
+    def on_surface_ready(self, surface, symbol, timeframe):
+        """Tüm kombinasyon sonuçlarını sakla ve diske kaydet"""
+        surface.meta.update({'symbol': symbol, 'timeframe': timeframe})
+        self.last_surface = surface
+        try:
+            stamp = pd.Timestamp.now().strftime('%Y%m%d_%H%M%S')
+            path = os.path.join(DEFAULT_SURFACE_DIR, f"{symbol}_{timeframe}_{stamp}.npz")
+            surface.save(path)
+            print(f"💾 Sonuç yüzeyi kaydedildi: {path} ({len(surface):,} kombinasyon)")
+        except Exception as e:
+            print(f"⚠️ Sonuç yüzeyi kaydedilemedi: {e}")
+    
     def on_optimization_finished(self, best_params, best_metrics):
         """Optimizasyon tamamlandığında"""
         self.optimize_btn.setEnabled(True)
@@ -540,6 +739,20 @@ class TradingPlatform(QMainWindow):
             result_text += f"Sharpe Oranı: {best_metrics['sharpe_ratio']:.2f}\n"
             result_text += f"Win Rate: {best_metrics['win_rate']:.1f}%"
             
+            surface = self.last_surface
+            if surface is not None and len(surface):
+                # Tek tepe yerine en iyi adaylar ve tepe çevresinin kararlılığı
+                result_text += f"\n\n🏆 TOP 5 (Sharpe, {len(surface):,} kombinasyon):\n"
+                for row in surface.top_k('sharpe_ratio', k=5, min_trades=2).itertuples():
+                    result_text += (f"MA {row.short_window}/{row.long_window}  SL {row.stop_loss*100:.1f}%  "
+                                    f"TP {row.take_profit*100:.1f}%  →  Sharpe {row.sharpe_ratio:.2f}, "
+                                    f"Getiri {row.total_return:.1f}%\n")
+                stability = surface.stability(best_params)
+                if stability['neighbors']:
+                    result_text += (f"\n📐 Komşuluk Sharpe ({stability['neighbors']} komb.): "
+                                    f"ort {stability['mean']:.2f} ± {stability['std']:.2f}, "
+                                    f"min {stability['min']:.2f}")
+            
             self.optimization_text.setText(result_text)
             
             # Parametreleri güncelle
@@ -554,53 +767,33 @@ class TradingPlatform(QMainWindow):
     def plot_results(self, results, trades):
         """Basit ve güvenli grafik çizimi"""
         try:
+            for curve in self.equity_curves:
+                curve.detach()
             self.equity_plot.clear()
             
+            # Uzun intraday serilerde sadece görünen aralık, piksel çözünürlüğünde çizilir
+            x = index_seconds(results.index)
+            portfolio_value = results['portfolio_value'].to_numpy(dtype=np.float64)
+            
             # Portfolio değeri
-            equity_curve = self.equity_plot.plot(
-                results.index, 
-                results['portfolio_value'], 
-                pen=pg.mkPen('#00ff00', width=2), 
-                name='Portföy Değeri'
+            equity_curve = DecimatedCurve(
+                self.equity_plot, x, portfolio_value,
+                pen=pg.mkPen('#00ff00', width=2), name='Portföy Değeri'
             )
             
             # Buy & Hold karşılaştırması
             initial_value = self.backtester.initial_capital
-            buy_hold_value = (results['close'] / results['close'].iloc[0]) * initial_value
-            buy_hold_curve = self.equity_plot.plot(
-                results.index,
-                buy_hold_value,
+            close = results['close'].to_numpy(dtype=np.float64)
+            buy_hold_curve = DecimatedCurve(
+                self.equity_plot, x, close / close[0] * initial_value,
                 pen=pg.mkPen('#1f77b4', width=1, style=pg.QtCore.Qt.PenStyle.DashLine),
                 name='Buy & Hold'
             )
+            self.equity_curves = [equity_curve, buy_hold_curve]
             
-            # AL/SAT sinyalleri
-            buy_signals = results[results['signal'] == 1]
-            sell_signals = results[results['signal'] == -1]
-            
-            if len(buy_signals) > 0:
-                buy_scatter = pg.ScatterPlotItem(
-                    buy_signals.index, 
-                    buy_signals['portfolio_value'],
-                    pen=pg.mkPen('#00ff00'), 
-                    brush=pg.mkBrush('#00ff00'), 
-                    size=12,
-                    symbol='t', 
-                    name='AL'
-                )
-                self.equity_plot.addItem(buy_scatter)
-            
-            if len(sell_signals) > 0:
-                sell_scatter = pg.ScatterPlotItem(
-                    sell_signals.index,
-                    sell_signals['portfolio_value'],
-                    pen=pg.mkPen('#ff0000'), 
-                    brush=pg.mkBrush('#ff0000'), 
-                    size=12,
-                    symbol='t1', 
-                    name='SAT'
-                )
-                self.equity_plot.addItem(sell_scatter)
+            # AL/SAT sinyalleri tek scatter item
+            if results['signal'].any():
+                self.equity_plot.addItem(signal_markers(x, portfolio_value, results['signal'].to_numpy()))
             
             self.equity_plot.addLegend()
             self.equity_plot.setLabel('left', 'Portföy Değeri (TL)')
@@ -643,21 +836,12 @@ Win Rate: {metrics.get('win_rate', 0):.1f}%
     
     def show_trades(self, trades):
         """İşlem geçmişini göster"""
-        self.trades_table.setRowCount(len(trades))
-        
-        for row, trade in enumerate(trades):
-            self.trades_table.setItem(row, 0, QTableWidgetItem(str(trade['date'].date())))
-            self.trades_table.setItem(row, 1, QTableWidgetItem(trade['type']))
-            self.trades_table.setItem(row, 2, QTableWidgetItem(f"{trade['price']:.2f}"))
-            self.trades_table.setItem(row, 3, QTableWidgetItem(f"{trade.get('shares', 0):.0f}"))
-            self.trades_table.setItem(row, 4, QTableWidgetItem(trade.get('reason', '')))
-            self.trades_table.setItem(row, 5, QTableWidgetItem(f"{trade.get('pnl', 0):.1f}%" if trade.get('pnl') else ""))
-        
-        self.trades_table.resizeColumnsToContents()
+        self.trades_model.set_trades(trades)
     
     def show_error(self, message):
         """Hata mesajı göster"""
         self.backtest_btn.setEnabled(True)
+        self.backtest_cancel_btn.setEnabled(False)
         self.optimize_btn.setEnabled(True)
         self.progress_bar.setVisible(False)
         self.status_label.setText("Hata oluştu")
@@ -1,5 +1,5 @@
 # quick_backtest.py
-from database.bist_data_loader import BISTDatabaseManager
+from database.backend import get_database_manager
 from backtesting.simple_backtester import SimpleBacktester
 
 def quick_test():
@@ -7,7 +7,7 @@ def quick_test():
     print("⚡ Hızlı Backtest Testi")
     print("=" * 50)
     
-    db = BISTDatabaseManager()
+    db = get_database_manager()
     
     # AKBNK günlük verisi ile test
     data = db.get_symbol_data('AKBNK', '1d')
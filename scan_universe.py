@@ -0,0 +1,52 @@
+# scan_universe.py
+import argparse
+from backtesting.universe_scanner import UniverseScanner
+
+
+def main():
+    parser = argparse.ArgumentParser(description="MA crossover stratejisini tüm BIST sembollerinde tara")
+    parser.add_argument('--timeframe', default='1d', help="Timeframe (ör. 5m, 1h, 1d)")
+    parser.add_argument('--short', type=int, default=10, help="Kısa MA periyodu")
+    parser.add_argument('--long', type=int, default=30, help="Uzun MA periyodu")
+    parser.add_argument('--sl', type=float, default=2.0, help="Stop loss (%%)")
+    parser.add_argument('--tp', type=float, default=4.0, help="Take profit (%%)")
+    parser.add_argument('--rank-by', default='sharpe_ratio', help="Sıralama metriği")
+    parser.add_argument('--workers', type=int, default=None, help="Worker process sayısı")
+    parser.add_argument('--symbols', nargs='*', default=None, help="Sadece bu semboller")
+    parser.add_argument('--top', type=int, default=20, help="Gösterilecek sembol sayısı")
+    parser.add_argument('--output', default=None, help="Sonuç tablosu için CSV dosyası")
+    args = parser.parse_args()
+
+    params = {
+        'short_window': args.short,
+        'long_window': args.long,
+        'stop_loss': args.sl / 100,
+        'take_profit': args.tp / 100,
+    }
+
+    print("🌐 Evren Taraması")
+    print("=" * 50)
+    print(f"⏰ Timeframe: {args.timeframe} | MA {args.short}/{args.long} | SL {args.sl}% | TP {args.tp}%")
+
+    def on_result(row, done, total):
+        if row['error']:
+            print(f"   [{done}/{total}] ⚠️ {row['symbol']}: {row['error']}")
+        else:
+            print(f"   [{done}/{total}] {row['symbol']:8s} getiri: {row['total_return']:8.2f}% | "
+                  f"sharpe: {row['sharpe_ratio']:6.2f} | işlem: {row['total_trades']}")
+
+    scanner = UniverseScanner(workers=args.workers)
+    table = scanner.scan(args.timeframe, params, symbols=args.symbols,
+                         rank_by=args.rank_by, on_result=on_result)
+
+    print(f"\n🏆 İlk {args.top} Sembol ({args.rank_by}):")
+    columns = ['symbol', 'total_return', 'buy_hold_return', 'max_drawdown', 'sharpe_ratio', 'total_trades', 'win_rate']
+    print(table[table['error'].isna()][columns].head(args.top).to_string(float_format=lambda v: f"{v:.2f}"))
+
+    if args.output:
+        table.to_csv(args.output)
+        print(f"\n💾 Sonuçlar kaydedildi: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
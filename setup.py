@@ -1,15 +1,15 @@
 # setup.py
-from database.bist_data_loader import BISTDatabaseManager
+from database.backend import get_database_manager
 
 def main():
     print("🚀 BIST Trading Platform Setup")
     print("=" * 50)
     
-    # Database manager oluştur
-    db_manager = BISTDatabaseManager()
+    # Database manager oluştur (COPY yüklemesi PostgreSQL arka ucunda)
+    db_manager = get_database_manager('postgres')
     
-    # Database'i initialize et
-    db_manager.initialize_database()
+    # Database'i COPY tabanlı toplu yükleme ile initialize et
+    db_manager.initialize_database_bulk()
     
     print("✅ Setup tamamlandı!")
     
@@ -0,0 +1,222 @@
+# strategies/indicators.py
+"""Bar bar güncellenen (O(1)) indikatör state nesneleri
+
+Her indikatör geçmiş veriyle seed() edilip sonra update() ile tek bar
+beslenir. Değerler pandas karşılıklarıyla aynıdır:
+    SMA  -> close.rolling(window).mean()
+    EMA  -> close.ewm(span=span, adjust=False).mean()
+    RSI  -> Wilder RSI (ilk ortalama basit ortalama)
+    ATR  -> Wilder ATR (ilk ortalama basit ortalama)
+"""
+import math
+from array import array
+import numpy as np
+import pandas as pd
+
+
+class SMA:
+    """Halka tamponlu basit hareketli ortalama"""
+    __slots__ = ('window', 'buffer', 'position', 'count', 'total', 'value')
+
+    def __init__(self, window):
+        self.window = int(window)
+        self.reset()
+
+    def reset(self):
+        self.buffer = array('d', bytes(8 * self.window))
+        self.position = 0
+        self.count = 0
+        self.total = 0.0
+        self.value = math.nan
+
+    @property
+    def ready(self):
+        return self.count >= self.window
+
+    def update(self, price):
+        """Yeni kapanışı ekle ve ortalamayı döndür"""
+        if self.count >= self.window:
+            self.total -= self.buffer[self.position]
+        self.buffer[self.position] = price
+        self.total += price
+        self.count += 1
+        self.position += 1
+        if self.position == self.window:
+            self.position = 0
+            # Kayan toplamın yuvarlama hatası birikmesin diye tur başına bir kez yeniden topla
+            self.total = math.fsum(self.buffer)
+
+        if self.count >= self.window:
+            self.value = self.total / self.window
+        return self.value
+
+    def seed(self, prices):
+        """Geçmiş kapanışlarla state'i tek seferde kur"""
+        prices = np.asarray(prices, dtype=np.float64)
+        tail = prices[-self.window:]
+        self.reset()
+        self.count = len(prices)
+        self.position = len(tail) % self.window
+        self.buffer[:len(tail)] = array('d', tail.tobytes())
+        self.total = math.fsum(tail)
+        self.value = self.total / self.window if self.count >= self.window else math.nan
+        return self.value
+
+
+class EMA:
+    """Üstel hareketli ortalama (adjust=False)"""
+    __slots__ = ('span', 'alpha', 'count', 'value')
+
+    def __init__(self, span):
+        self.span = int(span)
+        self.alpha = 2.0 / (self.span + 1)
+        self.reset()
+
+    def reset(self):
+        self.count = 0
+        self.value = math.nan
+
+    @property
+    def ready(self):
+        return self.count >= self.span
+
+    def update(self, price):
+        if self.count == 0:
+            self.value = float(price)
+        else:
+            self.value += self.alpha * (price - self.value)
+        self.count += 1
+        return self.value
+
+    def seed(self, prices):
+        prices = pd.Series(np.asarray(prices, dtype=np.float64))
+        self.count = len(prices)
+        self.value = float(prices.ewm(span=self.span, adjust=False).mean().iloc[-1]) if len(prices) else math.nan
+        return self.value
+
+
+def _wilder_last(values, period):
+    """Wilder ortalamasının son değeri; ilk period değerin basit ortalamasıyla başlar"""
+    if len(values) < period:
+        return math.nan
+    start = values[:period].mean()
+    rest = values[period:]
+    if len(rest) == 0:
+        return float(start)
+    series = pd.Series(np.concatenate(([start], rest)))
+    return float(series.ewm(alpha=1.0 / period, adjust=False).mean().iloc[-1])
+
+
+class RSI:
+    """Wilder RSI"""
+    __slots__ = ('period', 'previous', 'count', 'gain_sum', 'loss_sum', 'avg_gain', 'avg_loss', 'value')
+
+    def __init__(self, period=14):
+        self.period = int(period)
+        self.reset()
+
+    def reset(self):
+        self.previous = math.nan
+        self.count = 0
+        self.gain_sum = 0.0
+        self.loss_sum = 0.0
+        self.avg_gain = math.nan
+        self.avg_loss = math.nan
+        self.value = math.nan
+
+    @property
+    def ready(self):
+        return self.count > self.period
+
+    def _compute(self):
+        if self.avg_loss == 0:
+            self.value = 100.0 if self.avg_gain > 0 else 50.0
+        else:
+            self.value = 100.0 - 100.0 / (1.0 + self.avg_gain / self.avg_loss)
+
+    def update(self, price):
+        self.count += 1
+        if self.count > 1:
+            change = price - self.previous
+            gain = change if change > 0 else 0.0
+            loss = -change if change < 0 else 0.0
+            if self.count <= self.period:
+                self.gain_sum += gain
+                self.loss_sum += loss
+            elif self.count == self.period + 1:
+                self.avg_gain = (self.gain_sum + gain) / self.period
+                self.avg_loss = (self.loss_sum + loss) / self.period
+                self._compute()
+            else:
+                self.avg_gain += (gain - self.avg_gain) / self.period
+                self.avg_loss += (loss - self.avg_loss) / self.period
+                self._compute()
+        self.previous = price
+        return self.value
+
+    def seed(self, prices):
+        prices = np.asarray(prices, dtype=np.float64)
+        if len(prices) <= self.period:
+            self.reset()
+            for price in prices:
+                self.update(price)
+            return self.value
+
+        changes = np.diff(prices)
+        self.count = len(prices)
+        self.previous = float(prices[-1])
+        self.avg_gain = _wilder_last(np.clip(changes, 0, None), self.period)
+        self.avg_loss = _wilder_last(np.clip(-changes, 0, None), self.period)
+        self._compute()
+        return self.value
+
+
+class ATR:
+    """Wilder Average True Range"""
+    __slots__ = ('period', 'previous_close', 'count', 'tr_sum', 'value')
+
+    def __init__(self, period=14):
+        self.period = int(period)
+        self.reset()
+
+    def reset(self):
+        self.previous_close = math.nan
+        self.count = 0
+        self.tr_sum = 0.0
+        self.value = math.nan
+
+    @property
+    def ready(self):
+        return self.count >= self.period
+
+    def update(self, high, low, close):
+        if self.count == 0:
+            true_range = high - low
+        else:
+            true_range = max(high - low, abs(high - self.previous_close), abs(low - self.previous_close))
+        self.count += 1
+        if self.count < self.period:
+            self.tr_sum += true_range
+        elif self.count == self.period:
+            self.value = (self.tr_sum + true_range) / self.period
+        else:
+            self.value += (true_range - self.value) / self.period
+        self.previous_close = close
+        return self.value
+
+    def seed(self, high, low, close):
+        high = np.asarray(high, dtype=np.float64)
+        low = np.asarray(low, dtype=np.float64)
+        close = np.asarray(close, dtype=np.float64)
+        if len(close) < self.period:
+            self.reset()
+            for h, l, c in zip(high, low, close):
+                self.update(h, l, c)
+            return self.value
+
+        previous = np.concatenate(([np.nan], close[:-1]))
+        true_range = np.fmax(high - low, np.fmax(np.abs(high - previous), np.abs(low - previous)))
+        self.count = len(close)
+        self.previous_close = float(close[-1])
+        self.value = _wilder_last(true_range, self.period)
+        return self.value
@@ -0,0 +1,146 @@
+# strategies/streaming_ma_cross.py
+import numpy as np
+import pandas as pd
+
+from strategies.indicators import SMA
+
+SIGNAL_COLUMNS = ('close', 'short_ma', 'long_ma', 'signal', 'position')
+SIGNAL_DTYPES = {'close': np.float64, 'short_ma': np.float64, 'long_ma': np.float64,
+                 'signal': np.int8, 'position': np.int8}
+
+
+class StreamingMovingAverageCrossStrategy:
+    """Artımlı hesaplanan MA crossover stratejisi
+
+    MovingAverageCrossStrategy ile aynı şekilde kurulur ve generate_signals
+    ile kullanılır. Aynı veri büyüyerek tekrar verildiğinde (canlı / paper
+    trading) sadece yeni barlar işlenir; tüm geçmiş yeniden hesaplanmaz.
+    Tek bar beslemek için update() kullanılır.
+
+    Sinyal: 1 short MA long MA'yı yukarı keser, -1 aşağı keser, 0 yok.
+    """
+
+    def __init__(self, short_window=10, long_window=30):
+        self.short_window = short_window
+        self.long_window = long_window
+        self.reset()
+
+    def reset(self):
+        """Tüm state'i sıfırla"""
+        self.short_ma = SMA(self.short_window)
+        self.long_ma = SMA(self.long_window)
+        self.above = False
+        self.last_timestamp = None
+        self._buffers = None
+        self._length = 0
+        self._index = None
+        self._frame = None
+
+    @property
+    def signals(self):
+        """İşlenen barların sinyal tablosu; henüz veri yoksa None
+
+        Tablo tamponların salt okunur görünümleriyle ilk erişimde kurulur ve
+        yeni bar gelene kadar önbellekte kalır; kolonlar kopyalanmaz.
+        """
+        if self._buffers is None:
+            return None
+        if self._frame is None:
+            columns = {}
+            for name in SIGNAL_COLUMNS:
+                view = self._buffers[name][:self._length]
+                view.flags.writeable = False
+                columns[name] = view
+            self._frame = pd.DataFrame(columns, index=self._index, copy=False)
+        return self._frame
+
+    def _store(self, values, index):
+        """Yeni barların kolon dizilerini tamponların sonuna ekle
+
+        index işlenen verinin tamamının indeksidir. Kapasite ikiye katlanarak
+        büyür; eski tamponlar daha önce döndürülen tabloların görünümleri için
+        yerinde bırakılır.
+        """
+        n = len(values['close'])
+        if self._buffers is None:
+            self._buffers = {name: np.empty(max(n, 1024), dtype=SIGNAL_DTYPES[name]) for name in SIGNAL_COLUMNS}
+        if self._length + n > len(self._buffers['close']):
+            capacity = max(self._length + n, 2 * len(self._buffers['close']))
+            for name in SIGNAL_COLUMNS:
+                grown = np.empty(capacity, dtype=SIGNAL_DTYPES[name])
+                grown[:self._length] = self._buffers[name][:self._length]
+                self._buffers[name] = grown
+        for name in SIGNAL_COLUMNS:
+            self._buffers[name][self._length:self._length + n] = values[name]
+        self._length += n
+        self._index = index
+        self._frame = None
+
+    def update(self, price):
+        """Tek kapanış fiyatı besle; o barın sinyalini döndür"""
+        short_value = self.short_ma.update(price)
+        long_value = self.long_ma.update(price)
+        above = short_value > long_value
+        signal = 1 if above and not self.above else -1 if self.above and not above else 0
+        self.above = above
+        return signal
+
+    def seed(self, data):
+        """Geçmiş veriyi vektörel işle, state'i son bara getir ve sinyal tablosunu döndür"""
+        close = self._close(data)
+        short_ma = close.rolling(self.short_window).mean()
+        long_ma = close.rolling(self.long_window).mean()
+        above = (short_ma > long_ma).to_numpy()
+
+        self._buffers = None
+        self._length = 0
+        self._store({
+            'close': close.to_numpy(),
+            'short_ma': short_ma.to_numpy(),
+            'long_ma': long_ma.to_numpy(),
+            'signal': np.diff(above.astype(np.int8), prepend=np.int8(0)),
+            'position': above.astype(np.int8),
+        }, data.index)
+
+        self.short_ma.seed(close.to_numpy())
+        self.long_ma.seed(close.to_numpy())
+        self.above = bool(above[-1]) if len(above) else False
+        self.last_timestamp = data.index[-1] if len(data) else None
+        return self.signals
+
+    def generate_signals(self, data):
+        """Verinin sinyal tablosunu döndür
+
+        Veri daha önce işlenen verinin devamıysa sadece yeni barlar
+        update() ile işlenip tamponlara eklenir; aksi halde seed() ile
+        baştan kurulur. Bar başına maliyet geçmişin uzunluğundan bağımsızdır.
+        """
+        if self._buffers is None or self.last_timestamp is None or data.empty:
+            return self.seed(data)
+
+        n_known = self._length
+        if len(data) < n_known or data.index[n_known - 1] != self.last_timestamp:
+            self.reset()
+            return self.seed(data)
+        if len(data) == n_known:
+            return self.signals
+
+        new_close = self._close(data.iloc[n_known:]).to_numpy()
+        values = {name: np.empty(len(new_close), dtype=SIGNAL_DTYPES[name]) for name in SIGNAL_COLUMNS}
+        for i, price in enumerate(new_close):
+            values['signal'][i] = self.update(price)
+            values['short_ma'][i] = self.short_ma.value
+            values['long_ma'][i] = self.long_ma.value
+            values['position'][i] = self.above
+        values['close'] = new_close
+
+        self._store(values, data.index)
+        self.last_timestamp = data.index[-1]
+        return self.signals
+
+    @staticmethod
+    def _close(data):
+        for key in ('close', 'Close'):
+            if key in data.columns:
+                return data[key].astype(np.float64)
+        raise ValueError("Veride 'close' kolonu bulunamadı")
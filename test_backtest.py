@@ -1,7 +1,7 @@
 # test_backtest.py
 import pandas as pd
 import numpy as np
-from database.bist_data_loader import BISTDatabaseManager
+from database.backend import get_database_manager
 from backtesting.simple_backtester import SimpleBacktester
 
 def test_backtest_detailed():
@@ -10,7 +10,7 @@ def test_backtest_detailed():
     print("=" * 50)
     
     # Database'den veri çek
-    db = BISTDatabaseManager()
+    db = get_database_manager()
     
     # Farklı sembol ve timeframe'lerde test
     test_cases = [
@@ -70,7 +70,7 @@ def compare_strategies():
     print("\n🎯 Strateji Karşılaştırması")
     print("=" * 50)
     
-    db = BISTDatabaseManager()
+    db = get_database_manager()
     data = db.get_symbol_data('AKBNK', '1d')
     
     if data is not None:
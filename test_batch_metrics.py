@@ -0,0 +1,60 @@
+# test_batch_metrics.py
+import numpy as np
+import pandas as pd
+from backtesting.numba_backtester import NumbaBacktester
+
+PARAMETER_SETS = [(5, 20, 0.02, 0.04), (10, 30, 0.01, 0.03), (3, 50, 0.05, 0.10), (1200, 1499, 0.02, 0.04)]
+
+
+def make_data(n=1500, seed=7):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    spread = np.abs(rng.normal(0, 0.004, n))
+    return pd.DataFrame({
+        'open': close, 'high': close * (1 + spread), 'low': close * (1 - spread),
+        'close': close, 'volume': 1000.0,
+    }, index=pd.date_range('2024-01-02 10:00', periods=n, freq='1h'))
+
+
+def run_all(backtester, data):
+    runs = [backtester.run_ma_crossover_backtest(data, s, l, sl, tp) for s, l, sl, tp in PARAMETER_SETS]
+    return [r for r, _ in runs], [t for _, t in runs]
+
+
+def assert_matches_single(backtester, results_list, trades_list, batch):
+    assert len(batch) == len(results_list)
+    for i, (results, trades) in enumerate(zip(results_list, trades_list)):
+        single = backtester.calculate_performance_metrics(results, trades)
+        for name, value in single.items():
+            assert np.isclose(batch[name].iloc[i], value, rtol=1e-12, atol=1e-12), \
+                f"{PARAMETER_SETS[i]} {name}: batch {batch[name].iloc[i]} != tekil {value}"
+
+
+def test_batch_matches_single_run_metrics():
+    """Batch metrikleri tek tek hesaplanan metriklerle aynı olmalı"""
+    print("🧪 Batch Metrik Testi")
+    backtester = NumbaBacktester(initial_capital=100000)
+    results_list, trades_list = run_all(backtester, make_data())
+    assert any(len(t) > 0 for t in trades_list) and any(len(t) == 0 for t in trades_list)
+
+    batch = backtester.calculate_performance_metrics_batch(results_list, trades_list)
+    assert_matches_single(backtester, results_list, trades_list, batch)
+    print(f"✅ {len(batch)} backtest, TradeLog ile tekil metriklerle aynı")
+
+
+def test_batch_accepts_dict_trade_lists():
+    """Sözlük listesi olarak verilen işlemler de aynı sonucu vermeli"""
+    print("🧪 Sözlük İşlem Listesi Testi")
+    backtester = NumbaBacktester(initial_capital=100000)
+    results_list, trades_list = run_all(backtester, make_data(seed=11))
+    dict_lists = [trades.to_dicts() for trades in trades_list]
+
+    batch = backtester.calculate_performance_metrics_batch(results_list, dict_lists)
+    assert_matches_single(backtester, results_list, dict_lists, batch)
+    assert backtester.calculate_performance_metrics_batch([], []).empty
+    print("✅ Sözlük listeleri ve boş giriş doğru")
+
+
+if __name__ == "__main__":
+    test_batch_matches_single_run_metrics()
+    test_batch_accepts_dict_trade_lists()
@@ -1,7 +1,7 @@
 # test_cuda_backtest.py
 import pandas as pd
 from database.bist_data_loader import BISTDatabaseManager
-from backtesting.cuda_optimized_backtester import OptimizedCUDABacktester
+from backtesting.backend import cuda_available, get_backtester
 
 def test_cuda_backtest():
     print("🚀 CUDA Backtest Testi...")
@@ -26,18 +26,32 @@ def test_cuda_backtest():
     if data is not None and not data.empty:
         print(f"✅ {symbol} verisi hazır: {len(data)} kayıt")
         
-        # CUDA Backtester
-        backtester = OptimizedCUDABacktester(initial_capital=100000)
-        
-        # Basit MA crossover backtest
-        print("🔁 CUDA Backtest çalıştırılıyor...")
-        results = backtester.run_optimized_backtest(
-            data, 
-            short_window=10, 
-            long_window=30,
-            stop_loss=0.02,
-            take_profit=0.04
-        )
+        if cuda_available():
+            # CUDA Backtester
+            from backtesting.cuda_optimized_backtester import OptimizedCUDABacktester
+            backtester = OptimizedCUDABacktester(initial_capital=100000)
+            
+            # Basit MA crossover backtest
+            print("🔁 CUDA Backtest çalıştırılıyor...")
+            results = backtester.run_optimized_backtest(
+                data, 
+                short_window=10, 
+                long_window=30,
+                stop_loss=0.02,
+                take_profit=0.04
+            )
+        else:
+            # GPU yok: aynı arayüzlü derlenmiş CPU backtester
+            backtester = get_backtester(initial_capital=100000, backend='cpu')
+            print(f"🔁 GPU bulunamadı, CPU ({backtester.backend}) backtest çalıştırılıyor...")
+            results, trades = backtester.run_ma_crossover_backtest(
+                data, 
+                short_window=10, 
+                long_window=30,
+                stop_loss=0.02,
+                take_profit=0.04
+            )
+            results = results.rename(columns={'portfolio_value': 'Portfolio_Value', 'signal': 'Signal'})
         
         # Sonuçları göster
         final_value = results['Portfolio_Value'].iloc[-1]
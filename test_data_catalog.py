@@ -0,0 +1,60 @@
+# test_data_catalog.py
+import os
+import tempfile
+import numpy as np
+import pandas as pd
+from sqlalchemy import create_engine, text
+
+from database.data_catalog import DataCatalog
+
+
+def make_bars(symbol, timeframe, periods, freq):
+    index = pd.date_range('2024-01-02 10:00', periods=periods, freq=freq)
+    close = np.linspace(10, 12, periods)
+    return pd.DataFrame({'symbol': symbol, 'timeframe': timeframe, 'timestamp': index, 'open': close,
+                         'high': close, 'low': close, 'close': close, 'volume': 100.0})
+
+
+def make_engine():
+    path = os.path.join(tempfile.mkdtemp(), 'catalog.db')
+    engine = create_engine(f"sqlite:///{path}")
+    pd.concat([make_bars('AKBNK', '5m', 120, '5min'), make_bars('GARAN', '1h', 40, '1h')]).to_sql(
+        'market_data', engine, index=False)
+    return engine
+
+
+def test_filtered_call_fills_empty_summary():
+    """Özet tablo boşken filtreli çağrılar da özeti doldurmalı"""
+    print("🧪 Boş Özetle Filtreli Katalog Testi")
+    engine = make_engine()
+    catalog = DataCatalog(engine)
+    akbnk = catalog.get_catalog(symbols=['AKBNK'])
+    assert list(akbnk['timeframe']) == ['5m'] and int(akbnk['row_count'].iloc[0]) == 120
+    hourly = catalog.get_catalog(timeframe='1h')
+    assert list(hourly['symbol']) == ['GARAN'] and int(hourly['row_count'].iloc[0]) == 40
+    engine.dispose()
+    print("✅ symbols= ve timeframe= çağrıları dolu özet döndürdü")
+
+
+def test_missing_keys_are_refreshed():
+    """Özeti güncellemeyen yolla yazılan anahtar istendiğinde özete eklenmeli"""
+    print("🧪 Eksik Anahtar Testi")
+    engine = make_engine()
+    catalog = DataCatalog(engine)
+    assert len(catalog.get_catalog()) == 2
+
+    make_bars('THYAO', '15m', 30, '15min').to_sql('market_data', engine, index=False, if_exists='append')
+    thyao = catalog.get_catalog(symbols=['THYAO', 'XXXXX'])
+    assert list(thyao['symbol']) == ['THYAO'] and int(thyao['row_count'].iloc[0]) == 30
+
+    with engine.begin() as conn:
+        conn.execute(text("DELETE FROM market_data WHERE symbol = 'GARAN'"))
+    catalog.refresh([('GARAN', '1h')])
+    assert list(catalog.get_catalog()['symbol']) == ['AKBNK', 'THYAO']
+    engine.dispose()
+    print("✅ Yeni anahtar eklendi, silinen anahtar özetten çıktı")
+
+
+if __name__ == "__main__":
+    test_filtered_call_fills_empty_summary()
+    test_missing_keys_are_refreshed()
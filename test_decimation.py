@@ -0,0 +1,49 @@
+# test_decimation.py
+import numpy as np
+from decimation import minmax_decimate
+
+
+def make_curve(n=1_000_003, seed=3):
+    x = np.arange(n, dtype=np.float64)
+    y = 100_000 + np.cumsum(np.random.default_rng(seed).normal(0, 50, n))
+    return x, y
+
+
+def test_extremes_are_kept():
+    """Her kovanın dibi ve tepesi ile aralığın uçları çizimde kalmalı"""
+    print("🧪 Tepe / Dip Koruma Testi")
+    x, y = make_curve()
+    dx, dy = minmax_decimate(x, y, n_buckets=1000)
+    assert dy.min() == y.min() and dy.max() == y.max()
+    assert dx[0] == x[0] and dx[-1] == x[-1]
+    assert np.all(np.diff(dx) > 0)
+    assert np.array_equal(dy, y[dx.astype(np.int64)])
+
+    # En derin drawdown dibi de korunmalı
+    trough = np.argmin(y - np.maximum.accumulate(y))
+    assert trough in dx.astype(np.int64)
+    print(f"✅ {len(y):,} noktadan {len(dy):,} nokta, uç değerler korundu")
+
+
+def test_point_count_is_bounded():
+    """Çıktı kova sayısıyla sınırlı olmalı; kısa aralıklar olduğu gibi dönmeli"""
+    print("🧪 Nokta Sayısı Testi")
+    x, y = make_curve()
+    for n_buckets in (10, 500, 2000):
+        dx, dy = minmax_decimate(x, y, n_buckets=n_buckets)
+        assert len(dx) == len(dy) <= 2 * n_buckets + 4
+
+    start, end = 250_000, 250_000 + 1500
+    dx, dy = minmax_decimate(x, y, start, end, n_buckets=1000)
+    assert np.array_equal(dx, x[start:end]) and np.array_equal(dy, y[start:end])
+
+    start, end = 100_000, 700_000
+    dx, dy = minmax_decimate(x, y, start, end, n_buckets=300)
+    assert dx[0] == start and dx[-1] == end - 1 and len(dx) <= 2 * 300 + 4
+    assert dy.min() == y[start:end].min() and dy.max() == y[start:end].max()
+    print("✅ Görünür aralık kova sayısıyla sınırlı")
+
+
+if __name__ == "__main__":
+    test_extremes_are_kept()
+    test_point_count_is_bounded()
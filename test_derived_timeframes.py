@@ -0,0 +1,57 @@
+# test_derived_timeframes.py
+import os
+import tempfile
+import numpy as np
+import pandas as pd
+from sqlalchemy import create_engine, text
+
+from database.fast_database_manager import FastBISTDatabaseManager
+from database.resampler import resample_ohlcv
+
+
+def make_manager(engine):
+    """Sunucusuz test için: sadece engine'i verilen, önbelleksiz yönetici"""
+    db = FastBISTDatabaseManager.__new__(FastBISTDatabaseManager)
+    db.engine = engine
+    db.bar_cache = None
+    db._catalog = None
+    return db
+
+
+def make_bars(days=5):
+    stamps = [pd.date_range(day + pd.Timedelta('09:55:00'), day + pd.Timedelta('18:05:00'), freq='5min')
+              for day in pd.bdate_range('2024-03-04', periods=days)]
+    index = pd.DatetimeIndex(np.concatenate(stamps))
+    close = 20 + np.cumsum(np.random.default_rng(5).normal(0, 0.05, len(index)))
+    return pd.DataFrame({'timestamp': index, 'open': close, 'high': close + 0.1, 'low': close - 0.1,
+                         'close': close, 'volume': np.full(len(index), 100.0)})
+
+
+def test_derive_4h_with_empty_summary():
+    """Özet tablo boşken 4h, kayıtlı 5m barlarından türetilmeli"""
+    print("🧪 Boş Katalogla Türetilmiş Timeframe Testi")
+    path = os.path.join(tempfile.mkdtemp(), 'market.db')
+    engine = create_engine(f"sqlite:///{path}")
+    bars = make_bars()
+    bars.assign(symbol='AKBNK', timeframe='5m').to_sql('market_data', engine, index=False)
+
+    db = make_manager(engine)
+    db.catalog  # özet tabloyu oluşturur ama doldurmaz (yükseltilmiş database)
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT COUNT(*) FROM market_data_summary")).scalar() == 0
+    assert db._resample_source('AKBNK', '4h') == '5m'
+    assert db._resample_source('AKBNK', '5m') is None
+
+    expected = resample_ohlcv(bars.set_index('timestamp'), '4h')
+    derived = db.get_symbol_data('AKBNK', '4h')
+    assert len(derived) == len(expected) == 2 * 5
+    assert np.allclose(derived.to_numpy(), expected.to_numpy())
+
+    sliced = db.get_symbol_data('AKBNK', '4h', start='2024-03-05 10:00', end='2024-03-06 17:00')
+    assert np.allclose(sliced.to_numpy(), expected.loc['2024-03-05 10:00':'2024-03-06 17:00'].to_numpy())
+    engine.dispose()
+    print("✅ 4h barları 5m'den türetildi")
+
+
+if __name__ == "__main__":
+    test_derive_4h_with_empty_summary()
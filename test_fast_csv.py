@@ -0,0 +1,88 @@
+# test_fast_csv.py
+import os
+import tempfile
+import numpy as np
+import pandas as pd
+from database.fast_csv import read_bist_csv, sniff_bist_csv
+from database.bulk_loader import normalize_ohlcv
+
+
+def write_csv(text):
+    handle, path = tempfile.mkstemp(suffix='.csv')
+    with os.fdopen(handle, 'w', encoding='utf-8') as f:
+        f.write(text)
+    return path
+
+
+def make_rows(closes, volumes, sep=';', decimal=','):
+    index = pd.date_range('2024-01-02 10:00', periods=len(closes), freq='5min')
+    lines = [sep.join(['Tarih', 'Saat', 'Açılış', 'Yüksek', 'Düşük', 'Kapanış', 'Hacim'])]
+    for stamp, close, volume in zip(index, closes, volumes):
+        prices = [str(close).replace('.', decimal)] * 4
+        lines.append(sep.join([stamp.strftime('%d.%m.%Y'), stamp.strftime('%H:%M')] + prices
+                              + [str(volume).replace('.', decimal)]))
+    return index, '\n'.join(lines) + '\n'
+
+
+def test_mixed_precision_prices():
+    """İlk satırlar tek basamaklı olsa da sonraki iki basamaklı fiyatlar korunmalı"""
+    print("🧪 Karışık Hassasiyet Testi")
+    closes = [12.3] * 30 + [12.35, 12.45, 12.25, 12.35]
+    volumes = list(range(100, 100 + len(closes)))
+    index, text = make_rows(closes, volumes)
+    path = write_csv(text)
+    try:
+        df = read_bist_csv(path)
+        assert (df.index == index).all()
+        assert df.attrs['price_decimals'] == 2
+        stored = normalize_ohlcv(df)
+        assert np.array_equal(stored['close'].to_numpy(), np.array(closes))
+        assert df['Volume'].dtype == np.int64
+    finally:
+        os.remove(path)
+    print("✅ 12.35 / 12.45 / 12.25 aynen okundu")
+
+
+def test_fractional_volume_after_sample():
+    """Örnek satırlardan sonra gelen kesirli hacim tamsayıya kesilmemeli"""
+    print("🧪 Kesirli Hacim Testi")
+    closes = [10.5] * 40
+    volumes = [100] * 39 + [150.5]
+    _, text = make_rows(closes, volumes)
+    path = write_csv(text)
+    try:
+        df = read_bist_csv(path)
+        assert df['Volume'].dtype == np.float64
+        assert df['Volume'].iloc[-1] == 150.5
+    finally:
+        os.remove(path)
+    print("✅ Hacim float64 kaldı")
+
+
+def test_headerless_and_epoch_layouts():
+    """Başlıksız birleşik tarih ve epoch saniyeli dosyalar aynı çıktıyı vermeli"""
+    print("🧪 Düzen Tespiti Testi")
+    index = pd.date_range('2024-01-02 10:00', periods=50, freq='5min')
+    close = np.round(20 + np.arange(50) * 0.01, 2)
+    headerless = pd.DataFrame({'d': index.strftime('%Y-%m-%d %H:%M:%S'), 'o': close, 'h': close,
+                               'l': close, 'c': close, 'v': 1000})
+    epoch = pd.DataFrame({'timestamp': (index - pd.Timestamp(0)) // pd.Timedelta('1s'), 'open': close,
+                          'high': close, 'low': close, 'close': close, 'volume': 1000})
+    for frame, header in ((headerless, False), (epoch, True)):
+        path = write_csv(frame.to_csv(index=False, header=header))
+        try:
+            layout = sniff_bist_csv(path)
+            assert layout['header'] == (0 if header else None)
+            for engine in ('c', 'auto'):
+                df = read_bist_csv(path, engine=engine)
+                assert (df.index == index).all()
+                assert np.array_equal(normalize_ohlcv(df)['close'].to_numpy(), close)
+        finally:
+            os.remove(path)
+    print("✅ Başlıksız ve epoch dosyaları doğru okundu")
+
+
+if __name__ == "__main__":
+    test_mixed_precision_prices()
+    test_fractional_volume_after_sample()
+    test_headerless_and_epoch_layouts()
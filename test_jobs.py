@@ -0,0 +1,98 @@
+# test_jobs.py
+import time
+from backtesting.jobs import CancelToken, Job, JobCancelled, JobQueue, ProgressTracker, format_duration
+
+
+def test_progress_rate_and_eta():
+    """Hız ve kalan süre geçen süreden doğru çıkarılmalı"""
+    print("🧪 ProgressTracker Hız / ETA Testi")
+    reports = []
+    tracker = ProgressTracker(lambda percent, message: reports.append((percent, message)), total=1000)
+    tracker.start_time = time.time() - 10
+    tracker(25, 'parça 1')
+    assert abs(tracker.eta - 30) < 0.5
+    assert abs(tracker.rate - 25) < 0.5
+    percent, message = reports[-1]
+    assert percent == 25 and message.startswith('parça 1')
+    assert '25 kombinasyon/sn' in message and 'Kalan ~00:30' in message
+
+    tracker(100)
+    assert 'Kalan' not in reports[-1][1]
+    assert format_duration(3725) == '1:02:05' and format_duration(65) == '01:05'
+    print("✅ 25 kombinasyon/sn, kalan ~30 sn")
+
+
+def test_progress_throttling():
+    """Aynı yüzde tekrarları seyreltilmeli; yüzde değişimi ve bitiş hemen raporlanmalı"""
+    print("🧪 ProgressTracker Seyreltme Testi")
+    reports = []
+    tracker = ProgressTracker(lambda percent, message: reports.append(percent), min_interval=60)
+    for _ in range(50):
+        tracker(10)
+    tracker(20)
+    tracker(20)
+    tracker(100)
+    assert reports == [10, 20, 100]
+    print("✅ 53 çağrıdan 3 rapor")
+
+
+def test_cancel_stops_job():
+    """İptal edilen iş bir sonraki ilerleme raporunda JobCancelled ile durmalı"""
+    print("🧪 İş İptali Testi")
+    token = CancelToken()
+    tracker = ProgressTracker(token=token)
+    tracker(10)
+    token.cancel()
+    try:
+        tracker(20)
+        raise AssertionError("JobCancelled bekleniyordu")
+    except JobCancelled:
+        pass
+
+    steps = []
+
+    def work(progress):
+        for step in range(100):
+            steps.append(step)
+            if step == 3:
+                job.cancel()
+            progress(step)
+        return 'bitti'
+
+    job = Job('uzun iş', work)
+    assert job.run() == 'cancelled'
+    assert steps == [0, 1, 2, 3] and job.result is None
+    print("✅ İş 4. adımda durdu")
+
+
+def test_queue_cancel_and_order():
+    """Kuyruk sırayı korumalı; iptal edilen bekleyen iş hiç çalışmamalı"""
+    print("🧪 JobQueue Testi")
+    queue = JobQueue()
+    ran = []
+    jobs = [queue.submit(Job(f"iş {i}", lambda progress, i=i: ran.append(i) or i)) for i in range(4)]
+    jobs[1].cancel()
+    assert [job.name for job in queue.pending()] == ['iş 0', 'iş 2', 'iş 3']
+
+    finished = queue.run_all()
+    assert ran == [0, 2, 3] and [job.result for job in finished] == [0, 2, 3]
+    assert jobs[1].status == 'cancelled' and queue.current is None
+
+    def failing(progress):
+        raise ValueError('veri yok')
+
+    queue.submit(Job('hatalı', failing))
+    later = queue.submit(Job('sonraki', lambda progress: 'ok'))
+    first = queue.next_job()
+    assert first.run() == 'failed' and isinstance(first.error, ValueError)
+    assert queue.cancel_current() is first
+    queue.cancel_all()
+    assert later.status == 'cancelled' and queue.next_job() is None
+    print("✅ Sıra, iptal ve hata durumları doğru")
+
+
+if __name__ == "__main__":
+    test_progress_rate_and_eta()
+    test_progress_throttling()
+    test_cancel_stops_job()
+    test_queue_cancel_and_order()
@@ -1,13 +1,13 @@
 # test_pyqt_interface.py
 import sys
 from PyQt6.QtWidgets import QApplication, QMainWindow, QVBoxLayout, QWidget, QPushButton, QTextEdit
-from database.bist_data_loader import BISTDatabaseManager
+from database.backend import get_database_manager
 from ui.advanced_optimization_panel import AdvancedOptimizationPanel
 
 class TestWindow(QMainWindow):
     def __init__(self):
         super().__init__()
-        self.db = BISTDatabaseManager()
+        self.db = get_database_manager()
         self.init_ui()
     
     def init_ui(self):
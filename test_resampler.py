@@ -0,0 +1,75 @@
+# test_resampler.py
+import numpy as np
+import pandas as pd
+from database.resampler import bucket_range, resample_ohlcv
+
+
+def make_session_bars(days=5):
+    """Açılış (09:55) ve kapanış seansı (18:00-18:05) dahil 5 dakikalık barlar"""
+    stamps = []
+    for day in pd.bdate_range('2024-03-04', periods=days):
+        stamps.append(pd.date_range(day + pd.Timedelta('09:55:00'), day + pd.Timedelta('18:05:00'), freq='5min'))
+    index = pd.DatetimeIndex(np.concatenate(stamps), name='timestamp')
+    rng = np.random.default_rng(7)
+    close = 20 + np.cumsum(rng.normal(0, 0.05, len(index)))
+    return pd.DataFrame({
+        'Open': close + rng.normal(0, 0.02, len(index)),
+        'High': close + 0.1,
+        'Low': close - 0.1,
+        'Close': close,
+        'Volume': rng.integers(100, 1000, len(index)).astype(np.float64),
+    }, index=index)
+
+
+def pandas_reference(data, rule):
+    """Açılış/kapanış seansı barları seans sınırına çekilip pandas ile toplanır"""
+    day = data.index.normalize()
+    clipped = data.index.where(data.index >= day + pd.Timedelta('10:00:00'), day + pd.Timedelta('10:00:00'))
+    last = day + pd.Timedelta('18:00:00') - pd.Timedelta(1, 'ns')
+    clipped = clipped.where(clipped <= last, last)
+    options = {'offset': '10h'} if rule.endswith('h') else {}
+    if rule == 'W':
+        rule, options = 'W-MON', {'label': 'left', 'closed': 'left'}
+    frame = data.set_axis(pd.DatetimeIndex(clipped, name='timestamp'))
+    aggregated = frame.resample(rule, **options).agg(
+        {'Open': 'first', 'High': 'max', 'Low': 'min', 'Close': 'last', 'Volume': 'sum'})
+    return aggregated.dropna(subset=['Close'])
+
+
+def test_pandas_parity_with_auction_bars():
+    """Açılış ve kapanış seansı barları ayrı kova oluşturmamalı"""
+    print("🧪 Yeniden Örnekleme Pandas Uyumu Testi")
+    data = make_session_bars()
+    for timeframe, rule in (('1h', '1h'), ('2h', '2h'), ('4h', '4h'), ('1d', '1D'), ('1w', 'W')):
+        result = resample_ohlcv(data, timeframe)
+        expected = pandas_reference(data, rule)
+        assert (result.index == expected.index).all(), timeframe
+        assert np.allclose(result.to_numpy(), expected.to_numpy()), timeframe
+    hourly = resample_ohlcv(data, '1h')
+    assert hourly.index.hour.max() == 17 and hourly.index.hour.min() == 10
+    assert len(resample_ohlcv(data, '4h')) == 2 * 5
+    print("✅ 1h/2h/4h/1d/1w pandas ile aynı, 18:00 kovası yok")
+
+
+def test_bucket_range_covers_session_edges():
+    """Sınır kovaları açılış ve kapanış seansı barlarını da kapsamalı"""
+    print("🧪 Kova Aralığı Testi")
+    start, end = bucket_range('2024-03-05 10:20', '2024-03-06 17:10', '4h')
+    assert start == pd.Timestamp('2024-03-05 00:00') and end.hour == 23
+    start, end = bucket_range('2024-03-05 09:55', '2024-03-06 18:05', '1h')
+    assert start == pd.Timestamp('2024-03-05 00:00') and end.hour == 23
+    start, end = bucket_range('2024-03-05 11:47', '2024-03-06 15:02', '1h')
+    assert start == pd.Timestamp('2024-03-05 11:00')
+    assert end == pd.Timestamp('2024-03-06 16:00') - pd.Timedelta(1, 'ns')
+
+    data = make_session_bars()
+    start, end = bucket_range('2024-03-05 10:20', '2024-03-06 17:10', '4h')
+    partial = resample_ohlcv(data.loc[start:end], '4h')
+    full = resample_ohlcv(data, '4h').loc[partial.index]
+    assert np.allclose(partial.to_numpy(), full.to_numpy())
+    print("✅ Sınır kovaları eksiksiz")
+
+
+if __name__ == "__main__":
+    test_pandas_parity_with_auction_bars()
+    test_bucket_range_covers_session_edges()
@@ -0,0 +1,87 @@
+# test_streaming_indicators.py
+import time
+import numpy as np
+import pandas as pd
+from strategies.indicators import SMA, EMA, RSI, ATR
+from strategies.streaming_ma_cross import StreamingMovingAverageCrossStrategy
+
+
+def make_bars(n=5000, seed=7):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.004, n)))
+    high = close * (1 + np.abs(rng.normal(0, 0.003, n)))
+    low = close * (1 - np.abs(rng.normal(0, 0.003, n)))
+    index = pd.date_range('2024-01-02 10:00', periods=n, freq='5min')
+    return pd.DataFrame({'open': close, 'high': high, 'low': low, 'close': close}, index=index)
+
+
+def wilder_reference(values, period):
+    """Wilder ortalaması (ilk değer basit ortalama)"""
+    out = np.full(len(values), np.nan)
+    out[period - 1] = values[:period].mean()
+    for i in range(period, len(values)):
+        out[i] = out[i - 1] + (values[i] - out[i - 1]) / period
+    return out
+
+
+def test_indicators_match_full_recompute():
+    """Seed + update sonuçları tam yeniden hesaplamayla aynı olmalı"""
+    print("🧪 Artımlı İndikatör Testi")
+    data = make_bars()
+    close = data['close'].to_numpy()
+    split = 3000
+
+    sma_ref = data['close'].rolling(20).mean().to_numpy()
+    ema_ref = data['close'].ewm(span=20, adjust=False).mean().to_numpy()
+
+    changes = np.diff(close)
+    avg_gain = wilder_reference(np.clip(changes, 0, None), 14)
+    avg_loss = wilder_reference(np.clip(-changes, 0, None), 14)
+    rsi_ref = np.concatenate(([np.nan], 100 - 100 / (1 + avg_gain / avg_loss)))
+
+    previous = np.concatenate(([np.nan], close[:-1]))
+    tr = np.fmax(data['high'] - data['low'],
+                 np.fmax(np.abs(data['high'] - previous), np.abs(data['low'] - previous))).to_numpy()
+    atr_ref = wilder_reference(tr, 14)
+
+    sma, ema, rsi, atr = SMA(20), EMA(20), RSI(14), ATR(14)
+    sma.seed(close[:split])
+    ema.seed(close[:split])
+    rsi.seed(close[:split])
+    atr.seed(data['high'][:split], data['low'][:split], close[:split])
+
+    for i in range(split, len(close)):
+        assert np.isclose(sma.update(close[i]), sma_ref[i])
+        assert np.isclose(ema.update(close[i]), ema_ref[i])
+        assert np.isclose(rsi.update(close[i]), rsi_ref[i])
+        assert np.isclose(atr.update(data['high'].iloc[i], data['low'].iloc[i], close[i]), atr_ref[i])
+    print("✅ SMA / EMA / RSI / ATR tam hesaplamayla aynı")
+
+
+def test_streaming_strategy_matches_batch():
+    """Bar bar büyüyen veriyle üretilen sinyaller tek seferlik hesapla aynı olmalı"""
+    print("🧪 Artımlı MA Cross Testi")
+    data = make_bars()
+    batch = StreamingMovingAverageCrossStrategy(10, 30).generate_signals(data)
+
+    strategy = StreamingMovingAverageCrossStrategy(10, 30)
+    strategy.generate_signals(data.iloc[:4000])
+    start_time = time.time()
+    for end in range(4001, len(data) + 1):
+        signals = strategy.generate_signals(data.iloc[:end])
+    per_bar = (time.time() - start_time) / (len(data) - 4000)
+
+    assert (signals['signal'].to_numpy() == batch['signal'].to_numpy()).all()
+    assert np.allclose(signals['long_ma'].to_numpy()[30:], batch['long_ma'].to_numpy()[30:])
+
+    start_time = time.time()
+    for price in data['close'].to_numpy():
+        strategy.update(price)
+    per_update = (time.time() - start_time) / len(data)
+
+    print(f"✅ Sinyaller aynı | generate_signals: {per_bar * 1e6:.0f} µs/bar, update: {per_update * 1e6:.1f} µs/bar")
+
+
+if __name__ == "__main__":
+    test_indicators_match_full_recompute()
+    test_streaming_strategy_matches_batch()
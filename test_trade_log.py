@@ -0,0 +1,74 @@
+# test_trade_log.py
+import pickle
+import numpy as np
+import pandas as pd
+from backtesting.trade_log import BUY, SELL, EXIT_CROSS, EXIT_STOP_LOSS, TradeLog
+
+
+def make_log(tz=None):
+    index = pd.date_range('2024-03-01 10:00', periods=6, freq='1h', tz=tz)
+    signal = np.array([BUY, 0, SELL, BUY, 0, SELL])
+    fill_price = np.array([10.0, 10.5, 11.0, 10.0, 9.8, 9.5])
+    exit_reason = np.array([0, 0, EXIT_CROSS, 0, 0, EXIT_STOP_LOSS])
+    portfolio_value = np.array([1000.0, 1050.0, 1100.0, 1100.0, 1078.0, 1045.0])
+    return index, TradeLog.from_signals(index, signal, fill_price, exit_reason, portfolio_value, fill_price)
+
+
+def test_record_mapping_interface():
+    """TradeRecord sözlük gibi davranmalı; bilinmeyen anahtar KeyError vermeli"""
+    print("🧪 TradeRecord Testi")
+    _, log = make_log()
+    trade = log[1]
+    assert trade['type'] == 'SELL' and trade['reason'] == 'MA Cross'
+    assert np.isclose(trade['pnl'], 10.0)
+    assert trade.get('symbol', 'n/a') == 'n/a'
+    assert 'symbol' not in trade and 'pnl' in trade
+    try:
+        trade['symbol']
+        raise AssertionError("KeyError bekleniyordu")
+    except KeyError:
+        pass
+    assert [t['reason'] for t in log.sells()] == ['MA Cross', 'Stop Loss']
+    print("✅ get / in / KeyError doğru")
+
+
+def test_timezone_is_preserved():
+    """Saat dilimli verinin işlem tarihleri yerel saatte kalmalı"""
+    print("🧪 Saat Dilimi Testi")
+    index, log = make_log('Europe/Istanbul')
+    assert log[0]['date'] == index[0]
+    assert log[0]['date'].hour == 10
+    assert (log.to_frame()['date'] == index[[0, 2, 3, 5]]).all()
+    assert pd.Timestamp(log.records['date'][0]).hour == 10
+
+    restored = pickle.loads(pickle.dumps(log))
+    assert restored[3]['date'] == index[5]
+    assert log[1:][0]['date'] == index[2]
+
+    appended = TradeLog()
+    appended.append(index[0], 'BUY', 10.0, 100, 'MA Cross')
+    appended.append(index[2].tz_convert('UTC'), 'SELL', 11.0, 100, 'Stop Loss', 10.0)
+    assert appended[1]['date'] == index[2]
+    print("✅ Tarihler Europe/Istanbul olarak korundu")
+
+
+def test_append_and_dicts_round_trip():
+    """from_dicts / to_dicts ve append büyümesi kaydı değiştirmemeli"""
+    print("🧪 list-of-dicts Uyumluluk Testi")
+    _, log = make_log()
+    dicts = log.to_dicts()
+    rebuilt = TradeLog.from_dicts(dicts)
+    assert rebuilt.to_dicts() == dicts
+
+    grown = TradeLog()
+    for i in range(100):
+        grown.append(pd.Timestamp('2024-01-01') + pd.Timedelta(minutes=i), 'BUY' if i % 2 == 0 else 'SELL',
+                     10.0 + i, 1.0, 'MA Cross')
+    assert len(grown) == 100 and grown[-1]['price'] == 109.0
+    print("✅ Dönüşümler kayıpsız")
+
+
+if __name__ == "__main__":
+    test_record_mapping_interface()
+    test_timezone_is_preserved()
+    test_append_and_dicts_round_trip()
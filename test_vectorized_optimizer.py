@@ -0,0 +1,48 @@
+# test_vectorized_optimizer.py
+import time
+from database.bist_data_loader import BISTDatabaseManager
+from backtesting.vectorized_optimizer import VectorizedOptimizer, build_param_grid
+
+def test_vectorized_optimizer():
+    """Vektörel optimizer hız testi"""
+    print("⚡ Vektörel Optimizer Testi")
+    print("=" * 50)
+
+    db = BISTDatabaseManager()
+    data = db.get_symbol_data('AKBNK', '5m')
+
+    if data is None or data.empty:
+        print("❌ AKBNK 5m verisi bulunamadı!")
+        return False
+
+    print(f"✅ AKBNK 5m verisi: {len(data):,} kayıt")
+
+    # ~10.000 kombinasyonluk grid
+    param_ranges = {
+        'short_min': 2, 'short_max': 50, 'short_step': 2,
+        'long_min': 20, 'long_max': 200, 'long_step': 10,
+        'sl_min': 1.0, 'sl_max': 3.0, 'sl_step': 0.5,
+        'tp_min': 2.0, 'tp_max': 6.0, 'tp_step': 1.0
+    }
+    combinations = len(build_param_grid(param_ranges)['short_window'])
+    print(f"🔍 {combinations:,} kombinasyon değerlendirilecek...")
+
+    optimizer = VectorizedOptimizer(initial_capital=100000)
+    start_time = time.time()
+    best_params, best_metrics = optimizer.optimize_ma_parameters(data, param_ranges)
+    duration = time.time() - start_time
+
+    print(f"⏱️  Süre: {duration:.2f} saniye ({combinations / duration:,.0f} kombinasyon/sn)")
+    print(f"🎯 En iyi parametreler: {best_params}")
+    print(f"📈 Getiri: {best_metrics['total_return']:.2f}% | Sharpe: {best_metrics['sharpe_ratio']:.2f}")
+
+    # İlk 5 sonuç
+    top = optimizer.last_results.sort_values('sharpe_ratio', ascending=False).head(5)
+    print("\n📋 İlk 5 Kombinasyon:")
+    print(top[['short_window', 'long_window', 'stop_loss', 'take_profit',
+               'total_return', 'max_drawdown', 'sharpe_ratio', 'total_trades']])
+
+    return True
+
+if __name__ == "__main__":
+    test_vectorized_optimizer()
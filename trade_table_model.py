@@ -0,0 +1,112 @@
+# trade_table_model.py
+import numpy as np
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PyQt6.QtGui import QColor
+
+from backtesting.trade_log import TradeLog, TRADE_TYPES, EXIT_REASONS, BUY, SELL
+
+COLUMNS = ['Tarih', 'İşlem', 'Fiyat', 'Adet', 'Sebep', 'Kar/Zarar (%)']
+# Görünen kolon -> TradeLog alanı
+FIELDS = ['date', 'type', 'price', 'shares', 'reason', 'pnl']
+
+# Filtre seçenekleri: (etiket, alan, kod)
+FILTERS = [
+    ('Tümü', None, None),
+    ('AL', 'type', BUY),
+    ('SAT', 'type', SELL),
+] + [(name, 'reason', code) for code, name in EXIT_REASONS.items()]
+
+
+class TradeTableModel(QAbstractTableModel):
+    """TradeLog dizilerini doğrudan okuyan sanal işlem tablosu modeli
+
+    Hücre metinleri sadece görünen satırlar için istendiğinde üretilir;
+    widget ya da satır nesnesi oluşturulmaz. Sıralama ve filtreleme
+    satır sırası dizisi (self._order) üzerinde NumPy ile yapılır.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._records = TradeLog().records
+        self._order = np.zeros(0, dtype=np.int64)
+        self._sort = None
+        self._filter = (None, None)
+
+    def set_trades(self, trades):
+        """TradeLog ya da list-of-dicts işlemleri göster"""
+        if not isinstance(trades, TradeLog):
+            trades = TradeLog.from_dicts(trades or [])
+        self.beginResetModel()
+        self._records = trades.records
+        self._order = self._visible_rows()
+        self.endResetModel()
+
+    def set_filter(self, field=None, code=None):
+        """Sadece field == code olan işlemleri göster (field None ise hepsi)"""
+        self.beginResetModel()
+        self._filter = (field, code)
+        self._order = self._visible_rows()
+        self.endResetModel()
+
+    def _visible_rows(self):
+        field, code = self._filter
+        rows = np.arange(len(self._records))
+        if field is not None:
+            mask = self._records[field] == code
+            if field == 'reason':
+                # Sebep filtresi çıkış işlemlerine uygulanır (AL işlemleri de 'MA Cross' taşır)
+                mask &= self._records['type'] == SELL
+            rows = rows[mask]
+        if self._sort is not None:
+            column, descending = self._sort
+            keys = self._records[FIELDS[column]][rows]
+            rows = rows[np.argsort(keys, kind='stable')]
+            if descending:
+                rows = rows[::-1]
+        return rows
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._order)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return COLUMNS[section]
+        return str(section + 1)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        record = self._records[self._order[index.row()]]
+        field = FIELDS[index.column()]
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            value = record[field]
+            if field == 'date':
+                return np.datetime_as_string(value, unit='m').replace('T', ' ')
+            if field == 'type':
+                return TRADE_TYPES[int(value)]
+            if field == 'reason':
+                return EXIT_REASONS.get(int(value), '')
+            if field == 'price':
+                return f"{value:.2f}"
+            if field == 'shares':
+                return f"{value:.0f}"
+            return f"{value:.1f}%" if record['type'] == SELL else ""
+
+        if role == Qt.ItemDataRole.ForegroundRole and field == 'pnl' and record['type'] == SELL:
+            return QColor('#00ff00') if record['pnl'] > 0 else QColor('#ff4444')
+
+        if role == Qt.ItemDataRole.TextAlignmentRole and field in ('price', 'shares', 'pnl'):
+            return int(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+        return None
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        self.layoutAboutToBeChanged.emit()
+        self._sort = (column, order == Qt.SortOrder.DescendingOrder)
+        self._order = self._visible_rows()
+        self.layoutChanged.emit()